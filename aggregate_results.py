@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Aggregate exported game results into per-flag difficulty.
+
+Reads session results as JSONL (one endGame record per line, optionally
+.gz-compressed), counts first-try, second-try and failed answers for every flag
+and writes generator/tables/difficulty.json with the rates and a smoothed
+difficulty score. The datasets are then rebuilt so every country in
+countries_<lang>.json (and the compact base) carries difficulty and answerStats,
+ready for an adaptive-difficulty mode without any work in the browser.
+"""
+import argparse
+import os
+import time
+
+from generator import countries, difficulty, pipeline, precache
+from generator.cache import BuildManifest
+from generator.paths import DIFFICULTY_TABLE, ROOT
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Aggregate exported game results into per-flag difficulty')
+    parser.add_argument('paths', nargs='+', metavar='RESULTS.jsonl',
+                        help='exported session results, one JSON object per line (.gz allowed)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--no-build', action='store_true',
+                        help='only write the difficulty table, do not rebuild the datasets')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    ids = countries.ordered_codes(countries.load_country_table(), countries.scan_flags())
+
+    start = time.perf_counter()
+    counts, sessions, skipped, unknown = difficulty.aggregate(args.paths, ids, workers=args.workers)
+    table = difficulty.build_table(ids, counts, sessions)
+    difficulty.write_table(table)
+    elapsed = time.perf_counter() - start
+
+    print(f'Aggregated {sessions:,} sessions ({table["plays"]:,} questions) in {elapsed:.1f} s '
+          f'into {os.path.relpath(DIFFICULTY_TABLE, ROOT)}')
+    if skipped:
+        print(f'⚠️  Skipped {skipped:,} lines without per-question outcomes or malformed answers')
+    if unknown:
+        print(f'⚠️  Ignored {unknown:,} answers for unknown flags or tries')
+    hardest = sorted(table['countries'].items(), key=lambda item: item[1]['difficulty'], reverse=True)[:10]
+    if hardest:
+        print('Hardest flags: ' + ', '.join(f'{code} {entry["difficulty"]:.2f}' for code, entry in hardest))
+
+    if not args.no_build:
+        manifest = BuildManifest()
+        shared = pipeline.build(manifest)
+        precache.build(shared)
+        manifest.save()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark the country dataset build and the bytes a game session loads.
+
+The checkout is copied to a temporary directory and built there, so a run leaves
+the tree untouched. For each language a forced build of generate_countries.py is
+timed and its peak memory recorded; every emitted dataset (full, columnar and
+suggestion index) is measured raw, gzip and (with the brotli package) brotli
+compressed, and parsed repeatedly in Python and, when node is installed, in V8.
+The files the game page fetches (page bundles, startup bundle, flag bundles and
+symbols) are totalled for the default selection and for each continent.
+
+Results are appended to benchmarks/history.json. Any metric that grew more than
+its threshold over the previous entry is reported and the exit status is 1, so
+the script can gate a data or flag change in CI.
+"""
+import argparse
+import sys
+
+from generator import benchmark, countries
+
+
+def parse_threshold(value):
+    kind, _, ratio = value.partition('=')
+    if kind not in benchmark.THRESHOLDS or not ratio:
+        raise argparse.ArgumentTypeError(
+            f'expected KIND=RATIO with KIND one of {", ".join(benchmark.THRESHOLDS)}')
+    return kind, float(ratio)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark dataset generation and client load cost')
+    parser.add_argument('--lang', action='append', dest='languages',
+                        help='only benchmark this language (repeatable, default: all name tables)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='forced builds per language; the median time is kept (default: %(default)s)')
+    parser.add_argument('--parse-iterations', type=int, default=50,
+                        help='parses per dataset; the median time is kept (default: %(default)s)')
+    parser.add_argument('--threshold', action='append', type=parse_threshold, default=[],
+                        metavar='KIND=RATIO',
+                        help='override an allowed growth, e.g. bytes=0.05 (repeatable)')
+    parser.add_argument('--no-record', action='store_true',
+                        help='compare against the history without appending this run')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    thresholds = dict(benchmark.THRESHOLDS, **dict(args.threshold))
+    languages = args.languages or countries.available_languages()
+
+    metrics = benchmark.run(languages, repeat=args.repeat, parse_iterations=args.parse_iterations)
+    for name, value in metrics.items():
+        print(f'{name:<52} {value:>12,}')
+
+    history = benchmark.load_history()
+    baseline = history[-1]['metrics'] if history else None
+    regressions = benchmark.find_regressions(metrics, baseline, thresholds) if baseline else []
+    if not args.no_record:
+        benchmark.record(metrics, history)
+
+    if regressions:
+        print(f'\n⚠️  {len(regressions)} metric(s) regressed against the previous run:')
+        for name, previous, current, growth in regressions:
+            print(f'  {name}: {previous:,} -> {current:,} (+{growth:.1%}, '
+                  f'limit {thresholds[benchmark.metric_kind(name)]:.0%})')
+        return 1
+
+    print('\nNo regressions' if baseline else '\nNo previous run to compare against')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
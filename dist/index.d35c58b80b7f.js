@@ -0,0 +1,308 @@
+class TranslationService{
+constructor(){
+this.currentLanguage=localStorage.getItem('wqc-language')||'en';
+this.translations={};
+this.languages=null;
+this.startupBundle=null;
+}
+useStartupBundle(bundle){
+this.startupBundle=bundle.catch(error=>{
+console.warn('Startup bundle unavailable, loading translation files:',error);
+return null;
+});
+}
+getCurrentLanguage(){
+return this.currentLanguage;
+}
+async setLanguage(language){
+if(language===this.currentLanguage)return;
+this.currentLanguage=language;
+localStorage.setItem('wqc-language',language);
+try{
+await this.loadTranslations(language);
+this.updatePageLanguage();
+}catch(error){
+console.error('Failed to load translations:',error);
+}
+}
+getTranslation(key){
+return this.translations[this.currentLanguage]?.[key]||key;
+}
+async loadTranslations(language){
+if(this.translations[language])return this.translations[language];
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle&&bundle.language===language){
+this.translations[language]=bundle.translations;
+return this.translations[language];
+}
+const response=await fetch(`/world-quiz-championships/assets/translations/${language}.json`);
+if(!response.ok){
+throw new Error(`Failed to load translations for ${language}`);
+}
+this.translations[language]=await response.json();
+return this.translations[language];
+}
+async loadLanguages(){
+if(this.languages)return this.languages;
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle){
+this.languages=bundle.languages;
+return this.languages;
+}
+const response=await fetch('/world-quiz-championships/assets/translations/languages.json');
+if(!response.ok){
+throw new Error('Failed to load languages');
+}
+this.languages=await response.json();
+return this.languages;
+}
+updatePageLanguage(){
+document.documentElement.lang=this.currentLanguage==='no'?'nb':'en';
+const elements=document.querySelectorAll('[data-translate]');
+elements.forEach(element=>{
+const key=element.getAttribute('data-translate');
+const translation=this.getTranslation(key);
+if(element.tagName==='OPTION'){
+const currentValue=element.value;
+const selected=element.selected;
+const newOption=document.createElement('option');
+newOption.value=currentValue;
+newOption.textContent=translation;
+newOption.selected=selected;
+element.parentNode.replaceChild(newOption,element);
+}else{
+element.textContent=translation;
+}
+});
+const event=new CustomEvent('languageChanged',{
+detail:{language:this.currentLanguage}
+});
+document.dispatchEvent(event);
+}
+async initialize(){
+await this.loadTranslations(this.currentLanguage);
+this.updatePageLanguage();
+}
+}
+const translator=new TranslationService();
+window.TranslationService=TranslationService;
+window.translator=translator;;
+const OfflineCache={
+scriptUrl:'/world-quiz-championships/sw.js',
+register:function(){
+if(!('serviceWorker'in navigator)){
+return Promise.resolve(null);
+}
+return navigator.serviceWorker.register(this.scriptUrl).catch(error=>{
+console.warn('Service worker registration failed:',error);
+return null;
+});
+},
+precacheContinents:function(continents){
+if(!('serviceWorker'in navigator)||continents.length===0)return;
+navigator.serviceWorker.ready.then(registration=>{
+if(registration.active){
+registration.active.postMessage({type:'precache-continents',continents:continents});
+}
+});
+}
+};
+OfflineCache.register();
+window.OfflineCache=OfflineCache;;
+class SettingsMenu{
+constructor(){
+this.isOpen=false;
+this.menuElement=null;
+this.init();
+}
+init(){
+this.createMenu();
+this.setupEventListeners();
+}
+async createMenu(){
+const hamburgerBtn=document.createElement('button');
+hamburgerBtn.className='hamburger-btn';
+hamburgerBtn.setAttribute('aria-label','Settings menu');
+hamburgerBtn.innerHTML=`
+            <span class="hamburger-line"></span>
+            <span class="hamburger-line"></span>
+            <span class="hamburger-line"></span>
+        `;
+let languages=[];
+try{
+languages=await translator.loadLanguages();
+}catch(error){
+console.error('Failed to load languages:',error);
+languages=[
+{"code":"en","name":"English","flag":"🇺🇸"},
+{"code":"no","name":"Norsk","flag":"🇳🇴"}
+];
+}
+const languageOptionsHtml=languages.map(lang=>`
+            <button class="language-option" data-language="${lang.code}">
+                <span class="language-flag">${lang.flag}</span> <span>${lang.name}</span>
+            </button>
+        `).join('');
+const dropdown=document.createElement('div');
+dropdown.className='settings-dropdown';
+dropdown.innerHTML=`
+            <div class="settings-section">
+                <h3 class="settings-title" data-translate="languageLabel">Language</h3>
+                <div class="language-options">
+                    ${languageOptionsHtml}
+                </div>
+            </div>
+            <div class="settings-section">
+                <div class="dark-mode-toggle">
+                    <span class="dark-mode-label" data-translate="darkMode">Dark Mode</span>
+                    <label class="toggle-switch">
+                        <input type="checkbox" disabled>
+                        <span class="toggle-slider"></span>
+                    </label>
+                    <span class="coming-soon-badge" data-translate="darkModeComingSoon">Coming soon</span>
+                </div>
+            </div>
+        `;
+let header=document.querySelector('.site-header .container');
+if(!header){
+header=document.querySelector('.game-header .container');
+}
+if(!header){
+console.error('Settings menu: No suitable header container found');
+return;
+}
+const menuContainer=document.createElement('div');
+menuContainer.className='settings-menu-container';
+menuContainer.appendChild(hamburgerBtn);
+menuContainer.appendChild(dropdown);
+header.appendChild(menuContainer);
+this.menuElement=dropdown;
+this.updateLanguageSelection();
+}
+setupEventListeners(){
+document.addEventListener('click',(e)=>{
+const hamburgerBtn=e.target.closest('.hamburger-btn');
+const settingsDropdown=e.target.closest('.settings-dropdown');
+const languageOption=e.target.closest('.language-option');
+if(hamburgerBtn){
+this.toggleMenu();
+return;
+}
+if(languageOption){
+const language=languageOption.dataset.language;
+translator.setLanguage(language);
+this.closeMenu();
+this.updateLanguageSelection();
+return;
+}
+if(!hamburgerBtn&&!settingsDropdown){
+this.closeMenu();
+}
+});
+document.addEventListener('languageChanged',()=>{
+this.updateLanguageSelection();
+});
+}
+toggleMenu(){
+this.isOpen=!this.isOpen;
+this.menuElement.classList.toggle('open',this.isOpen);
+const hamburgerBtn=document.querySelector('.hamburger-btn');
+hamburgerBtn.classList.toggle('open',this.isOpen);
+}
+closeMenu(){
+if(this.isOpen){
+this.isOpen=false;
+this.menuElement.classList.remove('open');
+const hamburgerBtn=document.querySelector('.hamburger-btn');
+hamburgerBtn.classList.remove('open');
+}
+}
+updateLanguageSelection(){
+const currentLang=translator.getCurrentLanguage();
+const languageOptions=document.querySelectorAll('.language-option');
+languageOptions.forEach(option=>{
+const isSelected=option.dataset.language===currentLang;
+option.classList.toggle('selected',isSelected);
+});
+}
+}
+document.addEventListener('DOMContentLoaded',()=>{
+const settingsMenu=new SettingsMenu();
+});
+window.SettingsMenu=SettingsMenu;;
+class Router{
+constructor(){
+this.routes={};
+this.currentRoute=null;
+window.addEventListener('hashchange',this.handleHashChange.bind(this));
+window.addEventListener('load',this.handleLoad.bind(this));
+}
+addRoute(route,handler){
+this.routes[route]=handler;
+}
+navigate(route,options={}){
+window.location.hash=route;
+this.handleRoute(route,options);
+}
+handleHashChange(){
+const hash=window.location.hash.substring(1)||'';
+this.handleRoute(hash);
+}
+handleLoad(){
+const hash=window.location.hash.substring(1)||'';
+if(hash){
+this.handleRoute(hash);
+}
+}
+handleRoute(route,options={}){
+if(this.routes[route]){
+this.currentRoute=route;
+this.routes[route](options);
+}else{
+this.navigateToMain();
+}
+}
+navigateToGameMode(gameMode){
+if(gameMode==='geography'){
+window.location.href='game-modes/geography-games/world-flag-championships/index.html';
+}else{
+console.log('Game mode not implemented:',gameMode);
+}
+}
+navigateToMain(){
+window.location.href='index.html';
+}
+getCurrentRoute(){
+return this.currentRoute;
+}
+}
+const router=new Router();
+document.addEventListener('DOMContentLoaded',()=>{
+translator.initialize();
+});
+if(document.querySelector('.game-modes')){
+router.addRoute('',()=>{
+});
+document.addEventListener('DOMContentLoaded',()=>{
+const gameModeCards=document.querySelectorAll('.game-mode-card');
+gameModeCards.forEach(card=>{
+if(!card.classList.contains('disabled')){
+card.addEventListener('click',()=>{
+const gameMode=card.dataset.game;
+router.navigateToGameMode(gameMode);
+});
+const button=card.querySelector('.game-mode-btn');
+if(button){
+button.addEventListener('click',(e)=>{
+e.stopPropagation();
+const gameMode=card.dataset.game;
+router.navigateToGameMode(gameMode);
+});
+}
+}
+});
+});
+}
+window.Router=Router;
+window.router=router;;
+//# sourceMappingURL=index.d35c58b80b7f.js.map
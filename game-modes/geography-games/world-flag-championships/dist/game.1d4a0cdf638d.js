@@ -0,0 +1,1118 @@
+const Storage={
+set(key,value){
+try{
+sessionStorage.setItem(key,JSON.stringify(value));
+return true;
+}catch(error){
+console.error('Failed to save to sessionStorage:',error);
+return false;
+}
+},
+get(key,defaultValue=null){
+try{
+const item=sessionStorage.getItem(key);
+return item?JSON.parse(item):defaultValue;
+}catch(error){
+console.error('Failed to read from sessionStorage:',error);
+return defaultValue;
+}
+},
+remove(key){
+try{
+sessionStorage.removeItem(key);
+return true;
+}catch(error){
+console.error('Failed to remove from sessionStorage:',error);
+return false;
+}
+},
+clear(){
+try{
+sessionStorage.clear();
+return true;
+}catch(error){
+console.error('Failed to clear sessionStorage:',error);
+return false;
+}
+}
+};
+const Timer={
+createCountdown(seconds,onTick,onComplete){
+let remaining=seconds;
+let interval=null;
+const update=()=>{
+onTick&&onTick(remaining);
+return remaining;
+};
+const start=()=>{
+update();
+interval=setInterval(()=>{
+remaining--;
+update();
+if(remaining<=0){
+stop();
+onComplete&&onComplete();
+}
+},1000);
+return interval;
+};
+const stop=()=>{
+if(interval){
+clearInterval(interval);
+interval=null;
+}
+};
+const getRemaining=()=>remaining;
+const setRemaining=(value)=>{remaining=value;};
+return{start,stop,getRemaining,setRemaining};
+},
+formatTime(seconds){
+if(seconds===0)return'0:00';
+if(!seconds||seconds<0)return'--:--';
+const mins=Math.floor(seconds/60);
+const secs=seconds%60;
+return`${mins}:${secs.toString().padStart(2,'0')}`;
+}
+};
+const ArrayUtils={
+shuffle(array){
+if(!Array.isArray(array))return array;
+const shuffled=[...array];
+for(let i=shuffled.length-1;i>0;i--){
+const j=Math.floor(Math.random()*(i+1));
+[shuffled[i],shuffled[j]]=[shuffled[j],shuffled[i]];
+}
+return shuffled;
+},
+getRandom(array,count=1){
+if(!Array.isArray(array)||count<=0)return[];
+const shuffled=this.shuffle(array);
+return shuffled.slice(0,Math.min(count,array.length));
+}
+};
+const StringUtils={
+capitalize(str){
+if(!str)return'';
+return str.charAt(0).toUpperCase()+str.slice(1).toLowerCase();
+},
+normalize(str){
+if(!str)return'';
+return str.trim().replace(/\s+/g,' ');
+}
+};
+const Navigation={
+go(path){
+window.location.href=path;
+},
+back(){
+window.history.back();
+},
+reload(){
+window.location.reload();
+}
+};
+const DOM={
+$(id){
+return document.getElementById(id);
+},
+$$(selector,context=document){
+return context.querySelector(selector);
+},
+$$$(selector,context=document){
+return Array.from(context.querySelectorAll(selector));
+},
+create(tag,options={}){
+const element=document.createElement(tag);
+if(options.class)element.className=options.class;
+if(options.text)element.textContent=options.text;
+if(options.html)element.innerHTML=options.html;
+if(options.id)element.id=options.id;
+for(const[key,value]of Object.entries(options)){
+if(['class','text','html','id'].includes(key))continue;
+element.setAttribute(key,value);
+}
+return element;
+},
+on(element,event,handler,options={}){
+element.addEventListener(event,handler,options);
+return element;
+}
+};
+if(!Element.prototype.closest){
+Element.prototype.closest=function(selector){
+let element=this;
+while(element&&element.nodeType===1){
+if(element.matches(selector)){
+return element;
+}
+element=element.parentElement||element.parentNode;
+}
+return null;
+};
+}
+const ErrorHandler={
+handle(error,context=''){
+console.error(`Error${context?` in ${context}`:''}:`,error);
+},
+showMessage(message,type='error'){
+alert(message);
+}
+};
+window.Storage=Storage;
+window.Timer=Timer;
+window.ArrayUtils=ArrayUtils;
+window.StringUtils=StringUtils;
+window.Navigation=Navigation;
+window.DOM=DOM;
+window.ErrorHandler=ErrorHandler;;
+const OfflineCache={
+scriptUrl:'/world-quiz-championships/sw.js',
+register:function(){
+if(!('serviceWorker'in navigator)){
+return Promise.resolve(null);
+}
+return navigator.serviceWorker.register(this.scriptUrl).catch(error=>{
+console.warn('Service worker registration failed:',error);
+return null;
+});
+},
+precacheContinents:function(continents){
+if(!('serviceWorker'in navigator)||continents.length===0)return;
+navigator.serviceWorker.ready.then(registration=>{
+if(registration.active){
+registration.active.postMessage({type:'precache-continents',continents:continents});
+}
+});
+}
+};
+OfflineCache.register();
+window.OfflineCache=OfflineCache;;
+class TranslationService{
+constructor(){
+this.currentLanguage=localStorage.getItem('wqc-language')||'en';
+this.translations={};
+this.languages=null;
+this.startupBundle=null;
+}
+useStartupBundle(bundle){
+this.startupBundle=bundle.catch(error=>{
+console.warn('Startup bundle unavailable, loading translation files:',error);
+return null;
+});
+}
+getCurrentLanguage(){
+return this.currentLanguage;
+}
+async setLanguage(language){
+if(language===this.currentLanguage)return;
+this.currentLanguage=language;
+localStorage.setItem('wqc-language',language);
+try{
+await this.loadTranslations(language);
+this.updatePageLanguage();
+}catch(error){
+console.error('Failed to load translations:',error);
+}
+}
+getTranslation(key){
+return this.translations[this.currentLanguage]?.[key]||key;
+}
+async loadTranslations(language){
+if(this.translations[language])return this.translations[language];
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle&&bundle.language===language){
+this.translations[language]=bundle.translations;
+return this.translations[language];
+}
+const response=await fetch(`/world-quiz-championships/assets/translations/${language}.json`);
+if(!response.ok){
+throw new Error(`Failed to load translations for ${language}`);
+}
+this.translations[language]=await response.json();
+return this.translations[language];
+}
+async loadLanguages(){
+if(this.languages)return this.languages;
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle){
+this.languages=bundle.languages;
+return this.languages;
+}
+const response=await fetch('/world-quiz-championships/assets/translations/languages.json');
+if(!response.ok){
+throw new Error('Failed to load languages');
+}
+this.languages=await response.json();
+return this.languages;
+}
+updatePageLanguage(){
+document.documentElement.lang=this.currentLanguage==='no'?'nb':'en';
+const elements=document.querySelectorAll('[data-translate]');
+elements.forEach(element=>{
+const key=element.getAttribute('data-translate');
+const translation=this.getTranslation(key);
+if(element.tagName==='OPTION'){
+const currentValue=element.value;
+const selected=element.selected;
+const newOption=document.createElement('option');
+newOption.value=currentValue;
+newOption.textContent=translation;
+newOption.selected=selected;
+element.parentNode.replaceChild(newOption,element);
+}else{
+element.textContent=translation;
+}
+});
+const event=new CustomEvent('languageChanged',{
+detail:{language:this.currentLanguage}
+});
+document.dispatchEvent(event);
+}
+async initialize(){
+await this.loadTranslations(this.currentLanguage);
+this.updatePageLanguage();
+}
+}
+const translator=new TranslationService();
+window.TranslationService=TranslationService;
+window.translator=translator;;
+const StartupBundle={
+requests:{},
+load:function(language){
+if(!this.requests[language]){
+this.requests[language]=fetch(`data/startup_${language}.json`)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.json();
+})
+.catch(error=>{
+delete this.requests[language];
+throw error;
+});
+}
+return this.requests[language];
+}
+};
+translator.useStartupBundle(StartupBundle.load(translator.getCurrentLanguage()));
+window.StartupBundle=StartupBundle;;
+const AnswerValidator={
+isCorrect:function(answer,country){
+return GameLogic.validateAnswer(answer,country);
+},
+isClose:function(answer,country){
+const normalizedAnswer=GameLogic.normalizeString(answer);
+const normalizedCountry=country.normalizedName||GameLogic.normalizeString(country.name);
+if(normalizedAnswer.includes(normalizedCountry)||
+normalizedCountry.includes(normalizedAnswer)){
+return true;
+}
+return false;
+},
+suggestionIndex:null,
+suggestionScope:{countries:null,ids:null},
+letterFolds:{'ø':'o','æ':'ae','œ':'oe','ß':'ss','đ':'d','ł':'l','ı':'i'},
+fold:function(text){
+return text.toLowerCase()
+.normalize('NFD')
+.replace(/[\u0300-\u036f]/g,'')
+.replace(/[øæœßđłı]/g,letter=>this.letterFolds[letter])
+.replace(/[^a-z0-9]+/g,' ')
+.trim();
+},
+loadSuggestionIndex:async function(language){
+const response=await fetch(`data/suggestions_${language}.json`);
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+this.suggestionIndex=await response.json();
+return this.suggestionIndex;
+},
+getSuggestions:function(partial,countries){
+if(!partial||partial.length<2)return[];
+const index=this.suggestionIndex;
+if(!index){
+const normalizedPartial=partial.toLowerCase().trim();
+const suggestions=[];
+for(const country of countries){
+if(country.name.toLowerCase().includes(normalizedPartial)){
+suggestions.push(country.name);
+if(suggestions.length>=5)break;
+}
+}
+return suggestions;
+}
+const query=this.fold(partial);
+const suggestions=[];
+const seen=new Set();
+if(query.length<2)return suggestions;
+if(this.suggestionScope.countries!==countries){
+this.suggestionScope={countries,ids:new Set(countries.map(country=>country.id))};
+}
+const allowed=this.suggestionScope.ids;
+const addTerm=(termIndex)=>{
+const ordinal=index.termIds[termIndex];
+if(!seen.has(ordinal)&&allowed.has(index.ids[ordinal])){
+seen.add(ordinal);
+suggestions.push(index.names[ordinal]);
+}
+return suggestions.length>=5;
+};
+let low=0;
+let high=index.terms.length;
+while(low<high){
+const mid=(low+high)>>>1;
+if(index.terms[mid]<query){
+low=mid+1;
+}else{
+high=mid;
+}
+}
+for(let i=low;i<index.terms.length&&index.terms[i].startsWith(query);i++){
+if(addTerm(i))return suggestions;
+}
+if(query.length>=3){
+let candidates=null;
+for(let i=0;i+3<=query.length;i++){
+const postings=index.trigrams[query.slice(i,i+3)];
+if(!postings)return suggestions;
+if(!candidates||postings.length<candidates.length){
+candidates=postings;
+}
+}
+for(const termIndex of candidates){
+if(index.terms[termIndex].includes(query)&&addTerm(termIndex))break;
+}
+}
+return suggestions;
+}
+};
+window.AnswerValidator=AnswerValidator;;
+const CountriesData={
+base:null,
+load:async function(language){
+if(window.StartupBundle&&!this.base){
+try{
+const bundle=await StartupBundle.load(language);
+this.base=bundle.countries.base;
+return this.merge(this.base,bundle.countries.names);
+}catch(error){
+console.warn('Startup bundle unavailable, loading countries data:',error);
+}
+}
+try{
+const manifest=await this.fetchJson('data/countries-manifest.json');
+if(manifest.names&&manifest.names[language]){
+const names=await this.fetchJson(manifest.names[language].path);
+if(!this.base||this.base.version!==names.version){
+this.base=await this.fetchJson(manifest.base.path);
+}
+return this.merge(this.base,names);
+}
+}catch(error){
+console.warn('Compact countries data unavailable, loading full dataset:',error);
+}
+return this.fetchJson(`data/countries_${language}.json`);
+},
+loadSubset:async function(language,query){
+const lists=['ids','continent','status'].filter(name=>query[name]);
+const endpoint=this.subsetEndpoint();
+if(endpoint&&!this.base&&lists.every(name=>query[name].length>0)){
+const params=new URLSearchParams({lang:language});
+lists.forEach(name=>{
+params.set(name,query[name].join(','));
+});
+if(query.answers){
+params.set('answers','1');
+}
+try{
+const subset=await this.fetchJson(`${endpoint}?${params}`);
+return this.merge(subset.base,subset.names);
+}catch(error){
+console.warn('Country subset endpoint unavailable, loading countries data:',error);
+}
+}
+return this.filter(await this.load(language),query);
+},
+subsetEndpoint:function(){
+const meta=document.querySelector('meta[name="countries-api"]');
+return meta?meta.content:null;
+},
+filter:function(data,query){
+const ids=query.ids?new Set(query.ids):null;
+const countries=data.countries.filter(country=>
+(!ids||ids.has(country.id))&&
+(!query.continent||query.continent.includes(country.continent))&&
+(!query.status||query.status.includes(country.status))
+);
+const continents={};
+countries.forEach(country=>{
+if(!continents[country.continent])continents[country.continent]=[];
+continents[country.continent].push(country.id);
+});
+const subset={...data,continents,countries};
+delete subset.selection;
+return subset;
+},
+fetchJson:async function(url){
+const response=await fetch(url);
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.json();
+},
+merge:function(base,names){
+if(base.version!==names.version){
+throw new Error(`Name overlay ${names.version} does not fit base ${base.version}`);
+}
+const continents={};
+base.continents.forEach(continent=>{
+continents[continent]=[];
+});
+const countries=base.ids.map((id,i)=>{
+const continent=base.continents[base.continent[i]];
+continents[continent].push(id);
+const country={
+id:id,
+name:names.names[i],
+continent:continent,
+flagPath:base.flagPathTemplate.replace('{id}',id),
+status:base.statuses[base.status[i]]
+};
+if(base.bundles){
+country.flagBundle=[base.bundles[base.bundle[i]],base.offset[i],base.length[i]];
+}
+if(base.flagThumb&&base.flagThumb[i]){
+country.flagThumb=base.flagThumb[i];
+}
+if(base.similarFlags){
+country.similarFlags=base.similarFlags[i].map(ordinal=>base.ids[ordinal]);
+}
+if(base.difficulty&&base.difficulty[i]!==null){
+country.difficulty=base.difficulty[i];
+country.answerStats=base.answerStats[i];
+}
+if(names.normalizedNames){
+country.normalizedName=names.normalizedNames[i];
+}
+if(names.alternatives&&names.alternatives[id]){
+country.alternatives=names.alternatives[id];
+}
+return country;
+});
+const data={continents,countries};
+if(base.flagAtlas){
+data.flagAtlas=base.flagAtlas;
+}
+if(base.selection){
+data.selection=base.selection;
+}
+if(names.answers){
+data.answers={};
+Object.entries(names.answers).forEach(([answer,match])=>{
+data.answers[answer]=Array.isArray(match)?match.map(i=>base.ids[i]):base.ids[match];
+});
+}
+return data;
+}
+};
+window.CountriesData=CountriesData;;
+const FlagLoader={
+bundles:{},
+objectUrls:new Set(),
+symbolsUrl:'data/flag-symbols.json',
+symbols:null,
+symbolReferencePattern:/<use href="#(wqs-[0-9a-f]+)"/g,
+preload:function(countries){
+const urls=new Set();
+countries.forEach(country=>{
+if(country.flagBundle){
+urls.add(country.flagBundle[0]);
+}
+});
+return Promise.all([...urls].map(url=>this.loadBundle(url)));
+},
+loadBundle:function(url){
+if(!this.bundles[url]){
+this.bundles[url]=fetch(url)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.arrayBuffer();
+})
+.catch(error=>{
+delete this.bundles[url];
+throw error;
+});
+}
+return this.bundles[url];
+},
+loadSymbols:function(){
+if(!this.symbols){
+this.symbols=fetch(this.symbolsUrl)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.json();
+})
+.then(library=>library.symbols)
+.catch(error=>{
+this.symbols=null;
+throw error;
+});
+}
+return this.symbols;
+},
+resolveSymbols:async function(bytes){
+const text=new TextDecoder().decode(bytes);
+const ids=new Set(Array.from(text.matchAll(this.symbolReferencePattern),match=>match[1]));
+if(ids.size===0)return bytes;
+const symbols=await this.loadSymbols();
+const defs=[...ids].map(id=>`<g id="${id}">${symbols[id]}</g>`).join('');
+const end=text.lastIndexOf('</svg>');
+return`${text.slice(0,end)}<defs>${defs}</defs>${text.slice(end)}`;
+},
+getFlagUrl:async function(country){
+let blob;
+if(country.flagBundle){
+const[url,offset,length]=country.flagBundle;
+const buffer=await this.loadBundle(url);
+const svg=await this.resolveSymbols(new Uint8Array(buffer,offset,length));
+blob=new Blob([svg],{type:'image/svg+xml'});
+}else{
+const response=await fetch(country.flagPath);
+blob=new Blob([await response.text()],{type:'image/svg+xml'});
+}
+const objectUrl=URL.createObjectURL(blob);
+this.objectUrls.add(objectUrl);
+return objectUrl;
+},
+release:function(objectUrl){
+if(objectUrl&&this.objectUrls.delete(objectUrl)){
+URL.revokeObjectURL(objectUrl);
+}
+},
+createThumb:function(country,atlas){
+if(!atlas||!country.flagThumb)return null;
+const[cellWidth,cellHeight]=atlas.cell;
+const[atlasWidth,atlasHeight]=atlas.size;
+const[x,y]=country.flagThumb;
+const columns=atlasWidth/cellWidth;
+const rows=atlasHeight/cellHeight;
+const image=window.devicePixelRatio>1?atlas.images['2x']:atlas.images['1x'];
+const thumb=document.createElement('div');
+thumb.className='flag-thumb';
+thumb.setAttribute('role','img');
+thumb.setAttribute('aria-label',country.name);
+thumb.style.backgroundImage=`url("${image}")`;
+thumb.style.backgroundSize=`${columns*100}% ${rows*100}%`;
+thumb.style.backgroundPosition=`${columns>1?(x/cellWidth)/(columns-1)*100:0}% `+
+`${rows>1?(y/cellHeight)/(rows-1)*100:0}%`;
+return thumb;
+},
+releaseAll:function(){
+this.objectUrls.forEach(objectUrl=>URL.revokeObjectURL(objectUrl));
+this.objectUrls.clear();
+}
+};
+window.FlagLoader=FlagLoader;;
+const GameLogic={
+answerTable:null,
+setAnswerTable:function(answerTable){
+this.answerTable=answerTable||null;
+},
+normalizeString:function(str){
+return str.toLowerCase()
+.trim()
+.normalize('NFD')
+.replace(/[\u0300-\u036f]/g,'')
+.replace(/[.,\/#!$%\^&\*;:{}=\-_`~()]/g,'')
+.replace(/\s+/g,' ');
+},
+validateAnswer:function(userAnswer,country){
+const normalizedUserAnswer=this.normalizeString(userAnswer);
+const normalizedCountryName=country.normalizedName||this.normalizeString(country.name);
+if(this.answerTable){
+const match=this.answerTable[normalizedUserAnswer];
+if(match===country.id||(Array.isArray(match)&&match.includes(country.id))){
+return true;
+}
+}else{
+if(normalizedUserAnswer===normalizedCountryName){
+return true;
+}
+const alternatives=this.getCountryAlternatives(country);
+for(const alt of alternatives){
+if(this.normalizeString(alt)===normalizedUserAnswer){
+return true;
+}
+}
+}
+return this.checkPartialMatch(normalizedUserAnswer,normalizedCountryName);
+},
+getCountryAlternatives:function(country){
+return[country.name,...(country.alternatives||[])];
+},
+checkPartialMatch:function(userAnswer,correctAnswer){
+if(userAnswer.length>=3&&(userAnswer.includes(correctAnswer)||correctAnswer.includes(userAnswer))){
+return true;
+}
+if(userAnswer.length<=3||correctAnswer.length<=3){
+return userAnswer===correctAnswer;
+}
+const words1=userAnswer.split(' ');
+const words2=correctAnswer.split(' ');
+const ignoreWords=['the','of','and','in','on','at','to','for','is'];
+const filteredWords1=words1.filter(word=>!ignoreWords.includes(word)&&word.length>1);
+const filteredWords2=words2.filter(word=>!ignoreWords.includes(word)&&word.length>1);
+if(filteredWords1.length>1&&filteredWords2.length>1){
+let matches=0;
+for(const word of filteredWords1){
+if(filteredWords2.some(w2=>w2.includes(word)||word.includes(w2))){
+matches++;
+}
+}
+return matches>=Math.min(filteredWords1.length,filteredWords2.length)*0.8;
+}
+return false;
+},
+calculateScore:function(correctFirstTry,correctSecondTry,totalQuestions){
+return(correctFirstTry*10)+(correctSecondTry*5);
+},
+getPerformanceRating:function(score,totalQuestions){
+const maxScore=totalQuestions*10;
+const percentage=(score/maxScore)*100;
+if(percentage>=95)return{level:'legendary',description:'Flag Master!'};
+if(percentage>=85)return{level:'expert',description:'Expert Identifier'};
+if(percentage>=70)return{level:'advanced',description:'Geography Guru'};
+if(percentage>=50)return{level:'intermediate',description:'Getting There'};
+if(percentage>=30)return{level:'beginner',description:'Keep Studying'};
+return{level:'novice',description:'Newbie Navigator'};
+},
+formatTime:function(seconds){
+if(seconds===0)return'∞';
+const hours=Math.floor(seconds/3600);
+const minutes=Math.floor((seconds%3600)/60);
+const secs=seconds%60;
+if(hours>0){
+return`${hours}:${minutes.toString().padStart(2,'0')}:${secs.toString().padStart(2,'0')}`;
+}
+return`${minutes}:${secs.toString().padStart(2,'0')}`;
+},
+getGameStatistics:function(gameResults){
+if(!gameResults||gameResults.length===0){
+return{
+totalGames:0,
+averageScore:0,
+bestScore:0,
+averageAccuracy:0,
+averageTime:0
+};
+}
+const totalGames=gameResults.length;
+let bestScore=-Infinity;
+let scoreTotal=0;
+let accuracyTotal=0;
+let timeTotal=0;
+gameResults.forEach(g=>{
+bestScore=Math.max(bestScore,g.score);
+scoreTotal+=g.score;
+accuracyTotal+=g.accuracy||0;
+timeTotal+=g.timeSpent||0;
+});
+const averageScore=scoreTotal/totalGames;
+const averageAccuracy=accuracyTotal/totalGames;
+const averageTime=timeTotal/totalGames;
+return{
+totalGames,
+averageScore:Math.round(averageScore),
+bestScore,
+averageAccuracy:Math.round(averageAccuracy),
+averageTime:Math.round(averageTime)
+};
+}
+};
+window.GameLogic=GameLogic;;
+let gameState={
+countries:[],
+currentQuestionIndex:0,
+score:0,
+timer:null,
+timeLimit:0,
+elapsedTime:0,
+attempts:{},
+gameActive:false,
+totalQuestions:20,
+awaitingAcknowledgment:false,
+lastCorrectAnswer:null,
+startTime:null,
+correctFirstTry:0,
+correctSecondTry:0,
+correctThirdTry:0,
+failedQuestions:0,
+bestStreak:0,
+currentStreak:0,
+secondTryCountries:[],
+failedCountries:[],
+flagUrl:null,
+flagAtlas:null
+};
+async function loadCountriesData(selectedCountryIds){
+try{
+const currentLanguage=localStorage.getItem('wqc-language')||'en';
+const countriesData=await CountriesData.loadSubset(currentLanguage,{
+ids:selectedCountryIds,
+answers:true
+});
+if(!countriesData.countries||!countriesData.continents){
+throw new Error('Invalid countries data format');
+}
+return countriesData;
+}catch(error){
+console.error('Error loading countries data:',error);
+throw error;
+}
+}
+async function initGame(){
+try{
+await translator.initialize();
+const settings=Storage.get('gameSettings');
+if(!settings){
+ErrorHandler.showMessage(translator.getTranslation('settingsNotFound'));
+setTimeout(()=>{
+window.location.href='index.html';
+},2000);
+return;
+}
+const countriesData=await loadCountriesData(settings.selectedCountryIds||[]);
+gameState.countries=countriesData.countries;
+gameState.flagAtlas=countriesData.flagAtlas||null;
+GameLogic.setAnswerTable(countriesData.answers);
+if(gameState.countries.length===0){
+ErrorHandler.showMessage(translator.getTranslation('noCountriesSelected'));
+setTimeout(()=>{
+window.location.href='index.html';
+},2000);
+return;
+}
+gameState.timeLimit=settings.timeLimit||0;
+gameState.elapsedTime=0;
+gameState.totalQuestions=gameState.countries.length;
+FlagLoader.preload(gameState.countries).catch(error=>{
+console.error('Failed to preload flag bundles:',error);
+});
+shuffleArray(gameState.countries);
+setupUI();
+startGame();
+}catch(error){
+console.error('Failed to initialize game:',error);
+ErrorHandler.showMessage(translator.getTranslation('dataLoadFailed'));
+}
+}
+function setupUI(){
+updateScore(0);
+updateProgress(0,gameState.totalQuestions);
+updateTimer(gameState.elapsedTime);
+const answerInput=document.getElementById('answer-input');
+if(answerInput){
+answerInput.addEventListener('keypress',handleAnswerKeypress);
+answerInput.placeholder=translator.getTranslation('typeCountryName');
+}
+document.addEventListener('keydown',handleGlobalKeydown);
+}
+function startGame(){
+gameState.gameActive=true;
+gameState.startTime=Date.now();
+startTimer();
+showNextQuestion();
+}
+function handleAnswerKeypress(event){
+if(event.key==='Enter'&&gameState.gameActive){
+submitAnswer();
+}
+}
+function handleGlobalKeydown(event){
+if(!gameState.gameActive)return;
+if(event.key==='Escape'){
+quitGame();
+}
+}
+function showNextQuestion(){
+if(gameState.currentQuestionIndex>=gameState.totalQuestions){
+endGame();
+return;
+}
+const country=gameState.countries[gameState.currentQuestionIndex];
+const answerInput=document.getElementById('answer-input');
+const feedbackElement=document.getElementById('feedback');
+const attemptElement=document.getElementById('attempt-text');
+gameState.awaitingAcknowledgment=false;
+gameState.lastCorrectAnswer=null;
+if(answerInput){
+answerInput.value='';
+answerInput.focus();
+}
+if(feedbackElement){
+feedbackElement.textContent='';
+}
+const attempts=gameState.attempts[country.id]||0;
+if(attemptElement){
+if(attempts===0){
+attemptElement.textContent=translator.getTranslation('firstTryLabel');
+}else{
+attemptElement.textContent=translator.getTranslation('secondTry');
+}
+}
+loadFlag(country);
+displayStatusLabel(country);
+gameState.gameActive=true;
+}
+function loadFlag(country){
+const flagImg=document.getElementById('flag-img');
+const loadingSpinner=document.getElementById('loading-spinner');
+if(!flagImg||!loadingSpinner)return;
+loadingSpinner.style.display='flex';
+flagImg.style.display='none';
+loadFlagAlternative(country);
+}
+function loadFlagAlternative(country){
+const flagImg=document.getElementById('flag-img');
+const loadingSpinner=document.getElementById('loading-spinner');
+if(!flagImg)return;
+FlagLoader.getFlagUrl(country)
+.then(url=>{
+const previousUrl=gameState.flagUrl;
+gameState.flagUrl=url;
+flagImg.src=url;
+flagImg.onload=()=>{
+FlagLoader.release(previousUrl);
+loadingSpinner.style.display='none';
+flagImg.style.display='block';
+};
+})
+.catch(error=>{
+console.error('Failed to load flag as SVG:',error);
+showErrorPlaceholder();
+});
+}
+function showErrorPlaceholder(){
+const flagImg=document.getElementById('flag-img');
+const loadingSpinner=document.getElementById('loading-spinner');
+if(flagImg){
+flagImg.src='data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNDAiIGhlaWdodD0iMzAiIHZpZXdCb3g9IjAgMCA0MCAzMCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHJlY3Qgd2lkdGg9IjQwIiBoZWlnaHQ9IjMwIiBmaWxsPSIjZTJlOGYwIi8+Cjx0ZXh0IHg9IjIwIiB5PSIxNSIgZm9udC1mYW1pbHk9ImFyaWFsLCBzYW5zLXNlcmlmIiBmb250LXNpemU9IjEwIiBmaWxsPSIjOWNhM2FmIiB0ZXh0LWFuY2hvcj0iYWlkIGltaWQiPk4vQTwvdGV4dD4KPC9zdmc+';
+flagImg.alt='Flag not available';
+flagImg.onload();
+}
+if(loadingSpinner){
+loadingSpinner.style.display='none';
+flagImg.style.display='block';
+}
+}
+function submitAnswer(){
+if(!gameState.gameActive)return;
+const country=gameState.countries[gameState.currentQuestionIndex];
+const currentAttempts=gameState.attempts[country.id]||0;
+if(currentAttempts>=3){
+return;
+}
+const answerInput=document.getElementById('answer-input');
+const feedbackElement=document.getElementById('feedback');
+const attemptElement=document.getElementById('attempt-text');
+if(!answerInput||!feedbackElement||!attemptElement)return;
+const userAnswer=answerInput.value.trim().toLowerCase();
+if(!userAnswer){
+showFeedback(translator.getTranslation('enterAnswer'),'warning');
+return;
+}
+const isCorrect=GameLogic.validateAnswer(userAnswer,country);
+if(!gameState.attempts[country.id]){
+gameState.attempts[country.id]=0;
+}
+gameState.attempts[country.id]++;
+if(isCorrect){
+if(gameState.attempts[country.id]===1){
+gameState.correctFirstTry++;
+}else if(gameState.attempts[country.id]===2){
+gameState.correctSecondTry++;
+gameState.secondTryCountries.push(country);
+}else if(gameState.attempts[country.id]===3){
+gameState.correctThirdTry++;
+}
+gameState.currentStreak++;
+if(gameState.currentStreak>gameState.bestStreak){
+gameState.bestStreak=gameState.currentStreak;
+}
+let points=0;
+if(gameState.attempts[country.id]===1){
+points=10;
+}else if(gameState.attempts[country.id]===2){
+points=5;
+}else{
+points=0;
+}
+gameState.score+=points;
+updateScore(gameState.score);
+let feedbackMessage;
+if(points===0){
+feedbackMessage=translator.getTranslation('correctLabel');
+}else{
+feedbackMessage=translator.getTranslation('correctWithPoints').replace('{{points}}',points.toString());
+}
+showFeedback(feedbackMessage,'success');
+setTimeout(()=>{
+gameState.currentQuestionIndex++;
+updateProgress(gameState.currentQuestionIndex,gameState.totalQuestions);
+showNextQuestion();
+},2000);
+}else{
+gameState.currentStreak=0;
+if(gameState.attempts[country.id]>=3){
+gameState.failedQuestions++;
+gameState.failedCountries.push(country);
+showFeedback(translator.getTranslation('answerWas').replace('{{answer}}',country.name),'error');
+setTimeout(()=>{
+gameState.currentQuestionIndex++;
+updateProgress(gameState.currentQuestionIndex,gameState.totalQuestions);
+showNextQuestion();
+},3000);
+}else if(gameState.attempts[country.id]===2){
+showFeedback(translator.getTranslation('correctAnswerIs').replace('{{answer}}',country.name),'info');
+attemptElement.textContent=translator.getTranslation('finalTry');
+answerInput.value='';
+answerInput.focus();
+}else{
+showFeedback(translator.getTranslation('wrongTryAgain'),'warning');
+attemptElement.textContent=translator.getTranslation('secondTry');
+answerInput.value='';
+answerInput.focus();
+}
+}
+}
+function moveToNextQuestion(){
+gameState.awaitingAcknowledgment=false;
+gameState.lastCorrectAnswer=null;
+gameState.currentQuestionIndex++;
+updateProgress(gameState.currentQuestionIndex,gameState.totalQuestions);
+showNextQuestion();
+}
+function showFeedback(message,type){
+const feedbackElement=document.getElementById('feedback');
+if(!feedbackElement)return;
+feedbackElement.textContent=message;
+feedbackElement.className=`feedback-display ${type}`;
+}
+function updateScore(score){
+const scoreElement=document.getElementById('score');
+if(scoreElement){
+scoreElement.textContent=score;
+}
+}
+function updateProgress(current,total){
+const progressElement=document.getElementById('progress');
+if(progressElement){
+progressElement.textContent=`${current+1} / ${total}`;
+}
+}
+function startTimer(){
+if(gameState.timer)clearInterval(gameState.timer);
+gameState.timer=setInterval(()=>{
+gameState.elapsedTime++;
+updateTimer(gameState.elapsedTime);
+},1000);
+}
+function updateTimer(seconds){
+const timerElement=document.getElementById('timer');
+if(!timerElement)return;
+const minutes=Math.floor(seconds/60);
+const remainingSeconds=seconds%60;
+timerElement.textContent=`${minutes}:${remainingSeconds.toString().padStart(2,'0')}`;
+}
+function endGame(){
+gameState.gameActive=false;
+if(gameState.timer)clearInterval(gameState.timer);
+const endTime=Date.now();
+const timeTakenSeconds=gameState.startTime?Math.floor((endTime-gameState.startTime)/1000):gameState.timeLimit;
+const failedIds=new Set(gameState.failedCountries.map(country=>country.id));
+const questions=gameState.countries.slice(0,gameState.currentQuestionIndex).map(country=>
+[country.id,failedIds.has(country.id)?0:(gameState.attempts[country.id]||0)]
+);
+const results={
+score:gameState.score,
+totalQuestions:gameState.totalQuestions,
+timeLimit:gameState.timeLimit,
+timeTaken:timeTakenSeconds,
+completedQuestions:gameState.currentQuestionIndex,
+correctFirstTry:gameState.correctFirstTry,
+correctSecondTry:gameState.correctSecondTry,
+correctThirdTry:gameState.correctThirdTry,
+failedQuestions:gameState.failedQuestions,
+bestStreak:gameState.bestStreak,
+secondTryCountries:gameState.secondTryCountries,
+failedCountries:gameState.failedCountries,
+questions:questions,
+continents:[...new Set(gameState.countries.map(country=>country.continent))].sort(),
+language:translator.getCurrentLanguage(),
+flagAtlas:gameState.flagAtlas,
+date:new Date().toISOString()
+};
+if(!Storage.set('gameResults',results)){
+console.error('Failed to save game results');
+}
+FlagLoader.releaseAll();
+setTimeout(()=>{
+window.location.href='results.html';
+},1000);
+}
+function quitGame(){
+const modal=document.getElementById('quit-modal');
+if(modal){
+modal.style.display='flex';
+}
+}
+function cancelQuit(){
+const modal=document.getElementById('quit-modal');
+if(modal){
+modal.style.display='none';
+}
+}
+function confirmQuit(){
+gameState.gameActive=false;
+if(gameState.timer)clearInterval(gameState.timer);
+window.location.href='index.html';
+}
+function displayStatusLabel(country){
+const statusLabel=document.getElementById('status-label');
+if(!statusLabel)return;
+let displayText='';
+switch(country.status){
+case'official':
+displayText=translator.getTranslation('unOfficial');
+break;
+case'territory':
+displayText=translator.getTranslation('territoryLabel');
+break;
+case'observer':
+displayText=translator.getTranslation('observerState');
+break;
+case'disputed':
+displayText=translator.getTranslation('disputedLabel');
+break;
+default:
+displayText='';
+}
+statusLabel.textContent=displayText;
+statusLabel.className=`status-label status-${country.status}`;
+}
+function shuffleArray(array){
+for(let i=array.length-1;i>0;i--){
+const j=Math.floor(Math.random()*(i+1));
+[array[i],array[j]]=[array[j],array[i]];
+}
+}
+document.addEventListener('DOMContentLoaded',()=>{
+initGame();
+});;
+//# sourceMappingURL=game.1d4a0cdf638d.js.map
@@ -0,0 +1,1349 @@
+class TranslationService{
+constructor(){
+this.currentLanguage=localStorage.getItem('wqc-language')||'en';
+this.translations={};
+this.languages=null;
+this.startupBundle=null;
+}
+useStartupBundle(bundle){
+this.startupBundle=bundle.catch(error=>{
+console.warn('Startup bundle unavailable, loading translation files:',error);
+return null;
+});
+}
+getCurrentLanguage(){
+return this.currentLanguage;
+}
+async setLanguage(language){
+if(language===this.currentLanguage)return;
+this.currentLanguage=language;
+localStorage.setItem('wqc-language',language);
+try{
+await this.loadTranslations(language);
+this.updatePageLanguage();
+}catch(error){
+console.error('Failed to load translations:',error);
+}
+}
+getTranslation(key){
+return this.translations[this.currentLanguage]?.[key]||key;
+}
+async loadTranslations(language){
+if(this.translations[language])return this.translations[language];
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle&&bundle.language===language){
+this.translations[language]=bundle.translations;
+return this.translations[language];
+}
+const response=await fetch(`/world-quiz-championships/assets/translations/${language}.json`);
+if(!response.ok){
+throw new Error(`Failed to load translations for ${language}`);
+}
+this.translations[language]=await response.json();
+return this.translations[language];
+}
+async loadLanguages(){
+if(this.languages)return this.languages;
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle){
+this.languages=bundle.languages;
+return this.languages;
+}
+const response=await fetch('/world-quiz-championships/assets/translations/languages.json');
+if(!response.ok){
+throw new Error('Failed to load languages');
+}
+this.languages=await response.json();
+return this.languages;
+}
+updatePageLanguage(){
+document.documentElement.lang=this.currentLanguage==='no'?'nb':'en';
+const elements=document.querySelectorAll('[data-translate]');
+elements.forEach(element=>{
+const key=element.getAttribute('data-translate');
+const translation=this.getTranslation(key);
+if(element.tagName==='OPTION'){
+const currentValue=element.value;
+const selected=element.selected;
+const newOption=document.createElement('option');
+newOption.value=currentValue;
+newOption.textContent=translation;
+newOption.selected=selected;
+element.parentNode.replaceChild(newOption,element);
+}else{
+element.textContent=translation;
+}
+});
+const event=new CustomEvent('languageChanged',{
+detail:{language:this.currentLanguage}
+});
+document.dispatchEvent(event);
+}
+async initialize(){
+await this.loadTranslations(this.currentLanguage);
+this.updatePageLanguage();
+}
+}
+const translator=new TranslationService();
+window.TranslationService=TranslationService;
+window.translator=translator;;
+const StartupBundle={
+requests:{},
+load:function(language){
+if(!this.requests[language]){
+this.requests[language]=fetch(`data/startup_${language}.json`)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.json();
+})
+.catch(error=>{
+delete this.requests[language];
+throw error;
+});
+}
+return this.requests[language];
+}
+};
+translator.useStartupBundle(StartupBundle.load(translator.getCurrentLanguage()));
+window.StartupBundle=StartupBundle;;
+class SettingsMenu{
+constructor(){
+this.isOpen=false;
+this.menuElement=null;
+this.init();
+}
+init(){
+this.createMenu();
+this.setupEventListeners();
+}
+async createMenu(){
+const hamburgerBtn=document.createElement('button');
+hamburgerBtn.className='hamburger-btn';
+hamburgerBtn.setAttribute('aria-label','Settings menu');
+hamburgerBtn.innerHTML=`
+            <span class="hamburger-line"></span>
+            <span class="hamburger-line"></span>
+            <span class="hamburger-line"></span>
+        `;
+let languages=[];
+try{
+languages=await translator.loadLanguages();
+}catch(error){
+console.error('Failed to load languages:',error);
+languages=[
+{"code":"en","name":"English","flag":"🇺🇸"},
+{"code":"no","name":"Norsk","flag":"🇳🇴"}
+];
+}
+const languageOptionsHtml=languages.map(lang=>`
+            <button class="language-option" data-language="${lang.code}">
+                <span class="language-flag">${lang.flag}</span> <span>${lang.name}</span>
+            </button>
+        `).join('');
+const dropdown=document.createElement('div');
+dropdown.className='settings-dropdown';
+dropdown.innerHTML=`
+            <div class="settings-section">
+                <h3 class="settings-title" data-translate="languageLabel">Language</h3>
+                <div class="language-options">
+                    ${languageOptionsHtml}
+                </div>
+            </div>
+            <div class="settings-section">
+                <div class="dark-mode-toggle">
+                    <span class="dark-mode-label" data-translate="darkMode">Dark Mode</span>
+                    <label class="toggle-switch">
+                        <input type="checkbox" disabled>
+                        <span class="toggle-slider"></span>
+                    </label>
+                    <span class="coming-soon-badge" data-translate="darkModeComingSoon">Coming soon</span>
+                </div>
+            </div>
+        `;
+let header=document.querySelector('.site-header .container');
+if(!header){
+header=document.querySelector('.game-header .container');
+}
+if(!header){
+console.error('Settings menu: No suitable header container found');
+return;
+}
+const menuContainer=document.createElement('div');
+menuContainer.className='settings-menu-container';
+menuContainer.appendChild(hamburgerBtn);
+menuContainer.appendChild(dropdown);
+header.appendChild(menuContainer);
+this.menuElement=dropdown;
+this.updateLanguageSelection();
+}
+setupEventListeners(){
+document.addEventListener('click',(e)=>{
+const hamburgerBtn=e.target.closest('.hamburger-btn');
+const settingsDropdown=e.target.closest('.settings-dropdown');
+const languageOption=e.target.closest('.language-option');
+if(hamburgerBtn){
+this.toggleMenu();
+return;
+}
+if(languageOption){
+const language=languageOption.dataset.language;
+translator.setLanguage(language);
+this.closeMenu();
+this.updateLanguageSelection();
+return;
+}
+if(!hamburgerBtn&&!settingsDropdown){
+this.closeMenu();
+}
+});
+document.addEventListener('languageChanged',()=>{
+this.updateLanguageSelection();
+});
+}
+toggleMenu(){
+this.isOpen=!this.isOpen;
+this.menuElement.classList.toggle('open',this.isOpen);
+const hamburgerBtn=document.querySelector('.hamburger-btn');
+hamburgerBtn.classList.toggle('open',this.isOpen);
+}
+closeMenu(){
+if(this.isOpen){
+this.isOpen=false;
+this.menuElement.classList.remove('open');
+const hamburgerBtn=document.querySelector('.hamburger-btn');
+hamburgerBtn.classList.remove('open');
+}
+}
+updateLanguageSelection(){
+const currentLang=translator.getCurrentLanguage();
+const languageOptions=document.querySelectorAll('.language-option');
+languageOptions.forEach(option=>{
+const isSelected=option.dataset.language===currentLang;
+option.classList.toggle('selected',isSelected);
+});
+}
+}
+document.addEventListener('DOMContentLoaded',()=>{
+const settingsMenu=new SettingsMenu();
+});
+window.SettingsMenu=SettingsMenu;;
+const Storage={
+set(key,value){
+try{
+sessionStorage.setItem(key,JSON.stringify(value));
+return true;
+}catch(error){
+console.error('Failed to save to sessionStorage:',error);
+return false;
+}
+},
+get(key,defaultValue=null){
+try{
+const item=sessionStorage.getItem(key);
+return item?JSON.parse(item):defaultValue;
+}catch(error){
+console.error('Failed to read from sessionStorage:',error);
+return defaultValue;
+}
+},
+remove(key){
+try{
+sessionStorage.removeItem(key);
+return true;
+}catch(error){
+console.error('Failed to remove from sessionStorage:',error);
+return false;
+}
+},
+clear(){
+try{
+sessionStorage.clear();
+return true;
+}catch(error){
+console.error('Failed to clear sessionStorage:',error);
+return false;
+}
+}
+};
+const Timer={
+createCountdown(seconds,onTick,onComplete){
+let remaining=seconds;
+let interval=null;
+const update=()=>{
+onTick&&onTick(remaining);
+return remaining;
+};
+const start=()=>{
+update();
+interval=setInterval(()=>{
+remaining--;
+update();
+if(remaining<=0){
+stop();
+onComplete&&onComplete();
+}
+},1000);
+return interval;
+};
+const stop=()=>{
+if(interval){
+clearInterval(interval);
+interval=null;
+}
+};
+const getRemaining=()=>remaining;
+const setRemaining=(value)=>{remaining=value;};
+return{start,stop,getRemaining,setRemaining};
+},
+formatTime(seconds){
+if(seconds===0)return'0:00';
+if(!seconds||seconds<0)return'--:--';
+const mins=Math.floor(seconds/60);
+const secs=seconds%60;
+return`${mins}:${secs.toString().padStart(2,'0')}`;
+}
+};
+const ArrayUtils={
+shuffle(array){
+if(!Array.isArray(array))return array;
+const shuffled=[...array];
+for(let i=shuffled.length-1;i>0;i--){
+const j=Math.floor(Math.random()*(i+1));
+[shuffled[i],shuffled[j]]=[shuffled[j],shuffled[i]];
+}
+return shuffled;
+},
+getRandom(array,count=1){
+if(!Array.isArray(array)||count<=0)return[];
+const shuffled=this.shuffle(array);
+return shuffled.slice(0,Math.min(count,array.length));
+}
+};
+const StringUtils={
+capitalize(str){
+if(!str)return'';
+return str.charAt(0).toUpperCase()+str.slice(1).toLowerCase();
+},
+normalize(str){
+if(!str)return'';
+return str.trim().replace(/\s+/g,' ');
+}
+};
+const Navigation={
+go(path){
+window.location.href=path;
+},
+back(){
+window.history.back();
+},
+reload(){
+window.location.reload();
+}
+};
+const DOM={
+$(id){
+return document.getElementById(id);
+},
+$$(selector,context=document){
+return context.querySelector(selector);
+},
+$$$(selector,context=document){
+return Array.from(context.querySelectorAll(selector));
+},
+create(tag,options={}){
+const element=document.createElement(tag);
+if(options.class)element.className=options.class;
+if(options.text)element.textContent=options.text;
+if(options.html)element.innerHTML=options.html;
+if(options.id)element.id=options.id;
+for(const[key,value]of Object.entries(options)){
+if(['class','text','html','id'].includes(key))continue;
+element.setAttribute(key,value);
+}
+return element;
+},
+on(element,event,handler,options={}){
+element.addEventListener(event,handler,options);
+return element;
+}
+};
+if(!Element.prototype.closest){
+Element.prototype.closest=function(selector){
+let element=this;
+while(element&&element.nodeType===1){
+if(element.matches(selector)){
+return element;
+}
+element=element.parentElement||element.parentNode;
+}
+return null;
+};
+}
+const ErrorHandler={
+handle(error,context=''){
+console.error(`Error${context?` in ${context}`:''}:`,error);
+},
+showMessage(message,type='error'){
+alert(message);
+}
+};
+window.Storage=Storage;
+window.Timer=Timer;
+window.ArrayUtils=ArrayUtils;
+window.StringUtils=StringUtils;
+window.Navigation=Navigation;
+window.DOM=DOM;
+window.ErrorHandler=ErrorHandler;;
+const OfflineCache={
+scriptUrl:'/world-quiz-championships/sw.js',
+register:function(){
+if(!('serviceWorker'in navigator)){
+return Promise.resolve(null);
+}
+return navigator.serviceWorker.register(this.scriptUrl).catch(error=>{
+console.warn('Service worker registration failed:',error);
+return null;
+});
+},
+precacheContinents:function(continents){
+if(!('serviceWorker'in navigator)||continents.length===0)return;
+navigator.serviceWorker.ready.then(registration=>{
+if(registration.active){
+registration.active.postMessage({type:'precache-continents',continents:continents});
+}
+});
+}
+};
+OfflineCache.register();
+window.OfflineCache=OfflineCache;;
+class Modal{
+constructor(options={}){
+this.options={
+title:options.title||'',
+content:options.content||'',
+buttons:options.buttons||[],
+closable:options.closable!==false,
+size:options.size||'medium',
+...options
+};
+this.element=null;
+this.isOpen=false;
+this.create();
+}
+create(){
+this.element=DOM.create('div',{class:'modal',style:'display: none;'});
+const content=DOM.create('div',{class:`modal-content modal-${this.options.size}`});
+if(this.options.closable){
+content.innerHTML=`
+                <button class="modal-close" onclick="this.closest('.modal').remove()">&times;</button>
+            `;
+}
+if(this.options.title){
+const titleEl=DOM.create('h3',{text:this.options.title});
+content.appendChild(titleEl);
+}
+if(this.options.content){
+const contentEl=DOM.create('div');
+if(typeof this.options.content==='string'){
+contentEl.innerHTML=this.options.content;
+}else if(this.options.content instanceof HTMLElement){
+contentEl.appendChild(this.options.content);
+}
+content.appendChild(contentEl);
+}
+if(this.options.buttons.length>0){
+const actions=DOM.create('div',{class:'modal-actions'});
+this.options.buttons.forEach(btn=>{
+const button=DOM.create('button',{
+class:btn.class||'btn btn-secondary',
+text:btn.text||'Button',
+onclick:btn.onClick||(()=>this.close())
+});
+actions.appendChild(button);
+});
+content.appendChild(actions);
+}
+this.element.appendChild(content);
+document.body.appendChild(this.element);
+}
+open(){
+this.isOpen=true;
+this.element.style.display='flex';
+return this;
+}
+close(){
+this.isOpen=false;
+this.element.style.display='none';
+return this;
+}
+destroy(){
+if(this.element&&this.element.parentNode){
+this.element.parentNode.removeChild(this.element);
+}
+this.element=null;
+}
+}
+const Button={
+create(text,options={}){
+const config={
+text:text,
+class:'btn',
+...options
+};
+if(options.primary){
+config.class+=' btn-primary';
+}else if(options.secondary){
+config.class+=' btn-secondary';
+}else if(options.danger){
+config.class+=' btn-danger';
+}else if(options.success){
+config.class+=' btn-success';
+}else if(options.warning){
+config.class+=' btn-warning';
+}else if(!options.class||!options.class.includes('btn-')){
+config.class+=' btn-secondary';
+}
+if(options.large){
+config.class+=' btn-large';
+}else if(options.small){
+config.class+=' btn-small';
+}
+if(options.disabled){
+config.disabled='disabled';
+}
+const button=DOM.create('button',config);
+if(options.onClick){
+button.addEventListener('click',options.onClick);
+}
+return button;
+},
+createGroup(buttons,options={}){
+const container=DOM.create('div',{
+class:`button-group${options.vertical?' button-group-vertical':''}`
+});
+buttons.forEach(btnConfig=>{
+const button=this.create(btnConfig.text,btnConfig);
+container.appendChild(button);
+});
+return container;
+}
+};
+class LoadingIndicator{
+constructor(options={}){
+this.options={
+text:options.text||'Loading...',
+size:options.size||'medium',
+type:options.type||'spinner',
+...options
+};
+this.element=this.create();
+}
+create(){
+const container=DOM.create('div',{class:`loading-indicator loading-${this.options.size}`});
+if(this.options.type==='spinner'){
+container.innerHTML=`
+                <div class="loading-spinner" role="status" aria-label="${this.options.text}">
+                    <span class="sr-only">${this.options.text}</span>
+                </div>
+                ${this.options.text?`<span class="loading-text">${this.options.text}</span>`:''}
+            `;
+}else if(this.options.type==='dots'){
+container.innerHTML=`
+                <div class="loading-dots">
+                    <span></span><span></span><span></span>
+                </div>
+                ${this.options.text?`<span class="loading-text">${this.options.text}</span>`:''}
+            `;
+}else if(this.options.type==='bar'){
+container.innerHTML=`
+                <div class="loading-bar">
+                    <div class="loading-bar-fill"></div>
+                </div>
+                ${this.options.text?`<span class="loading-text">${this.options.text}</span>`:''}
+            `;
+}
+return container;
+}
+show(container){
+container.appendChild(this.element);
+this.element.style.display='';
+return this;
+}
+hide(){
+if(this.element.parentNode){
+this.element.parentNode.removeChild(this.element);
+}
+return this;
+}
+setText(text){
+const textEl=this.element.querySelector('.loading-text');
+if(textEl){
+textEl.textContent=text;
+}
+return this;
+}
+}
+class Toast{
+constructor(message,options={}){
+this.message=message;
+this.options={
+type:options.type||'info',
+duration:options.duration||3000,
+position:options.position||'top-right',
+...options
+};
+this.element=null;
+this.timeout=null;
+this.create();
+}
+create(){
+const container=DOM.create('div',{
+class:`toast toast-${this.options.type}`,
+role:'alert',
+'aria-live':'assertive'
+});
+container.innerHTML=`
+            <span class="toast-message">${this.message}</span>
+            <button class="toast-close" aria-label="Close">&times;</button>
+        `;
+const closeBtn=container.querySelector('.toast-close');
+closeBtn.addEventListener('click',()=>this.hide());
+container.classList.add(`toast-${this.options.position}`);
+this.element=container;
+document.body.appendChild(container);
+if(this.options.duration>0){
+this.timeout=setTimeout(()=>this.hide(),this.options.duration);
+}
+return this;
+}
+show(){
+this.element.offsetHeight;
+this.element.classList.add('toast-show');
+return this;
+}
+hide(){
+if(this.timeout){
+clearTimeout(this.timeout);
+this.timeout=null;
+}
+this.element.classList.add('toast-hide');
+setTimeout(()=>{
+if(this.element&&this.element.parentNode){
+this.element.parentNode.removeChild(this.element);
+}
+this.element=null;
+},300);
+return this;
+}
+}
+const ToastManager={
+queue:[],
+maxVisible:3,
+show(message,options={}){
+const toast=new Toast(message,options);
+toast.show();
+setTimeout(()=>{
+if(toast.element){
+toast.hide();
+}
+},(options.duration||3000)+1000);
+return toast;
+},
+success(message,options={}){
+return this.show(message,{...options,type:'success'});
+},
+error(message,options={}){
+return this.show(message,{...options,type:'error'});
+},
+warning(message,options={}){
+return this.show(message,{...options,type:'warning'});
+},
+info(message,options={}){
+return this.show(message,{...options,type:'info'});
+}
+};
+class ProgressBar{
+constructor(options={}){
+this.options={
+min:options.min||0,
+max:options.max||100,
+value:options.value||0,
+showLabel:options.showLabel!==false,
+labelText:options.labelText||'',
+...options
+};
+this.element=this.create();
+this.update(this.options.value);
+}
+create(){
+const container=DOM.create('div',{class:'progress-bar-container'});
+const progress=DOM.create('div',{class:'progress-bar'});
+const fill=DOM.create('div',{class:'progress-bar-fill'});
+progress.appendChild(fill);
+container.appendChild(progress);
+if(this.options.showLabel){
+const label=DOM.create('div',{
+class:'progress-bar-label',
+text:this.options.labelText||`${this.options.value}/${this.options.max}`
+});
+container.appendChild(label);
+}
+return container;
+}
+update(value){
+this.options.value=Math.max(this.options.min,Math.min(this.options.max,value));
+const percentage=((this.options.value-this.options.min)/(this.options.max-this.options.min))*100;
+const fill=this.element.querySelector('.progress-bar-fill');
+if(fill){
+fill.style.width=`${percentage}%`;
+}
+const label=this.element.querySelector('.progress-bar-label');
+if(label){
+const labelText=this.options.getLabelText?
+this.options.getLabelText(this.options.value,this.options.max):
+this.options.labelText||`${this.options.value}/${this.options.max}`;
+label.textContent=labelText;
+}
+return this;
+}
+getValue(){
+return this.options.value;
+}
+setMax(max){
+this.options.max=max;
+this.update(this.options.value);
+return this;
+}
+}
+window.Modal=Modal;
+window.Button=Button;
+window.LoadingIndicator=LoadingIndicator;
+window.Toast=Toast;
+window.ToastManager=ToastManager;
+window.ProgressBar=ProgressBar;;
+const CountriesData={
+base:null,
+load:async function(language){
+if(window.StartupBundle&&!this.base){
+try{
+const bundle=await StartupBundle.load(language);
+this.base=bundle.countries.base;
+return this.merge(this.base,bundle.countries.names);
+}catch(error){
+console.warn('Startup bundle unavailable, loading countries data:',error);
+}
+}
+try{
+const manifest=await this.fetchJson('data/countries-manifest.json');
+if(manifest.names&&manifest.names[language]){
+const names=await this.fetchJson(manifest.names[language].path);
+if(!this.base||this.base.version!==names.version){
+this.base=await this.fetchJson(manifest.base.path);
+}
+return this.merge(this.base,names);
+}
+}catch(error){
+console.warn('Compact countries data unavailable, loading full dataset:',error);
+}
+return this.fetchJson(`data/countries_${language}.json`);
+},
+loadSubset:async function(language,query){
+const lists=['ids','continent','status'].filter(name=>query[name]);
+const endpoint=this.subsetEndpoint();
+if(endpoint&&!this.base&&lists.every(name=>query[name].length>0)){
+const params=new URLSearchParams({lang:language});
+lists.forEach(name=>{
+params.set(name,query[name].join(','));
+});
+if(query.answers){
+params.set('answers','1');
+}
+try{
+const subset=await this.fetchJson(`${endpoint}?${params}`);
+return this.merge(subset.base,subset.names);
+}catch(error){
+console.warn('Country subset endpoint unavailable, loading countries data:',error);
+}
+}
+return this.filter(await this.load(language),query);
+},
+subsetEndpoint:function(){
+const meta=document.querySelector('meta[name="countries-api"]');
+return meta?meta.content:null;
+},
+filter:function(data,query){
+const ids=query.ids?new Set(query.ids):null;
+const countries=data.countries.filter(country=>
+(!ids||ids.has(country.id))&&
+(!query.continent||query.continent.includes(country.continent))&&
+(!query.status||query.status.includes(country.status))
+);
+const continents={};
+countries.forEach(country=>{
+if(!continents[country.continent])continents[country.continent]=[];
+continents[country.continent].push(country.id);
+});
+const subset={...data,continents,countries};
+delete subset.selection;
+return subset;
+},
+fetchJson:async function(url){
+const response=await fetch(url);
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.json();
+},
+merge:function(base,names){
+if(base.version!==names.version){
+throw new Error(`Name overlay ${names.version} does not fit base ${base.version}`);
+}
+const continents={};
+base.continents.forEach(continent=>{
+continents[continent]=[];
+});
+const countries=base.ids.map((id,i)=>{
+const continent=base.continents[base.continent[i]];
+continents[continent].push(id);
+const country={
+id:id,
+name:names.names[i],
+continent:continent,
+flagPath:base.flagPathTemplate.replace('{id}',id),
+status:base.statuses[base.status[i]]
+};
+if(base.bundles){
+country.flagBundle=[base.bundles[base.bundle[i]],base.offset[i],base.length[i]];
+}
+if(base.flagThumb&&base.flagThumb[i]){
+country.flagThumb=base.flagThumb[i];
+}
+if(base.similarFlags){
+country.similarFlags=base.similarFlags[i].map(ordinal=>base.ids[ordinal]);
+}
+if(base.difficulty&&base.difficulty[i]!==null){
+country.difficulty=base.difficulty[i];
+country.answerStats=base.answerStats[i];
+}
+if(names.normalizedNames){
+country.normalizedName=names.normalizedNames[i];
+}
+if(names.alternatives&&names.alternatives[id]){
+country.alternatives=names.alternatives[id];
+}
+return country;
+});
+const data={continents,countries};
+if(base.flagAtlas){
+data.flagAtlas=base.flagAtlas;
+}
+if(base.selection){
+data.selection=base.selection;
+}
+if(names.answers){
+data.answers={};
+Object.entries(names.answers).forEach(([answer,match])=>{
+data.answers[answer]=Array.isArray(match)?match.map(i=>base.ids[i]):base.ids[match];
+});
+}
+return data;
+}
+};
+window.CountriesData=CountriesData;;
+const FlagLoader={
+bundles:{},
+objectUrls:new Set(),
+symbolsUrl:'data/flag-symbols.json',
+symbols:null,
+symbolReferencePattern:/<use href="#(wqs-[0-9a-f]+)"/g,
+preload:function(countries){
+const urls=new Set();
+countries.forEach(country=>{
+if(country.flagBundle){
+urls.add(country.flagBundle[0]);
+}
+});
+return Promise.all([...urls].map(url=>this.loadBundle(url)));
+},
+loadBundle:function(url){
+if(!this.bundles[url]){
+this.bundles[url]=fetch(url)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.arrayBuffer();
+})
+.catch(error=>{
+delete this.bundles[url];
+throw error;
+});
+}
+return this.bundles[url];
+},
+loadSymbols:function(){
+if(!this.symbols){
+this.symbols=fetch(this.symbolsUrl)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.json();
+})
+.then(library=>library.symbols)
+.catch(error=>{
+this.symbols=null;
+throw error;
+});
+}
+return this.symbols;
+},
+resolveSymbols:async function(bytes){
+const text=new TextDecoder().decode(bytes);
+const ids=new Set(Array.from(text.matchAll(this.symbolReferencePattern),match=>match[1]));
+if(ids.size===0)return bytes;
+const symbols=await this.loadSymbols();
+const defs=[...ids].map(id=>`<g id="${id}">${symbols[id]}</g>`).join('');
+const end=text.lastIndexOf('</svg>');
+return`${text.slice(0,end)}<defs>${defs}</defs>${text.slice(end)}`;
+},
+getFlagUrl:async function(country){
+let blob;
+if(country.flagBundle){
+const[url,offset,length]=country.flagBundle;
+const buffer=await this.loadBundle(url);
+const svg=await this.resolveSymbols(new Uint8Array(buffer,offset,length));
+blob=new Blob([svg],{type:'image/svg+xml'});
+}else{
+const response=await fetch(country.flagPath);
+blob=new Blob([await response.text()],{type:'image/svg+xml'});
+}
+const objectUrl=URL.createObjectURL(blob);
+this.objectUrls.add(objectUrl);
+return objectUrl;
+},
+release:function(objectUrl){
+if(objectUrl&&this.objectUrls.delete(objectUrl)){
+URL.revokeObjectURL(objectUrl);
+}
+},
+createThumb:function(country,atlas){
+if(!atlas||!country.flagThumb)return null;
+const[cellWidth,cellHeight]=atlas.cell;
+const[atlasWidth,atlasHeight]=atlas.size;
+const[x,y]=country.flagThumb;
+const columns=atlasWidth/cellWidth;
+const rows=atlasHeight/cellHeight;
+const image=window.devicePixelRatio>1?atlas.images['2x']:atlas.images['1x'];
+const thumb=document.createElement('div');
+thumb.className='flag-thumb';
+thumb.setAttribute('role','img');
+thumb.setAttribute('aria-label',country.name);
+thumb.style.backgroundImage=`url("${image}")`;
+thumb.style.backgroundSize=`${columns*100}% ${rows*100}%`;
+thumb.style.backgroundPosition=`${columns>1?(x/cellWidth)/(columns-1)*100:0}% `+
+`${rows>1?(y/cellHeight)/(rows-1)*100:0}%`;
+return thumb;
+},
+releaseAll:function(){
+this.objectUrls.forEach(objectUrl=>URL.revokeObjectURL(objectUrl));
+this.objectUrls.clear();
+}
+};
+window.FlagLoader=FlagLoader;;
+const CountrySelection={
+ids:[],
+ordinals:new Map(),
+wordCount:0,
+continents:{},
+statuses:{},
+init:function(data){
+this.ids=data.countries.map(country=>country.id);
+this.ordinals=new Map(this.ids.map((id,ordinal)=>[id,ordinal]));
+this.wordCount=Math.ceil(this.ids.length/32);
+if(data.selection&&data.selection.size===this.ids.length){
+this.continents=data.selection.continents;
+this.statuses=data.selection.statuses;
+return;
+}
+this.continents={};
+this.statuses={};
+data.countries.forEach((country,ordinal)=>{
+if(!this.continents[country.continent])this.continents[country.continent]=this.empty();
+if(!this.statuses[country.status])this.statuses[country.status]=this.empty();
+this.setBit(this.continents[country.continent],ordinal);
+this.setBit(this.statuses[country.status],ordinal);
+});
+},
+empty:function(){
+return new Array(this.wordCount).fill(0);
+},
+all:function(){
+const bits=this.empty();
+for(let ordinal=0;ordinal<this.ids.length;ordinal++){
+this.setBit(bits,ordinal);
+}
+return bits;
+},
+setBit:function(bits,ordinal){
+bits[ordinal>>>5]=(bits[ordinal>>>5]|(1<<(ordinal&31)))>>>0;
+},
+get:function(kind,key){
+return this[kind][key]||this.empty();
+},
+or:function(a,b){
+return a.map((word,i)=>(word|b[i])>>>0);
+},
+and:function(a,b){
+return a.map((word,i)=>(word&b[i])>>>0);
+},
+andNot:function(a,b){
+return a.map((word,i)=>(word&~b[i])>>>0);
+},
+count:function(bits){
+let total=0;
+bits.forEach(word=>{
+word=word-((word>>>1)&0x55555555);
+word=(word&0x33333333)+((word>>>2)&0x33333333);
+total+=(((word+(word>>>4))&0x0F0F0F0F)*0x01010101)>>>24;
+});
+return total;
+},
+fromIds:function(ids){
+const bits=this.empty();
+for(const id of ids){
+const ordinal=this.ordinals.get(id);
+if(ordinal!==undefined){
+this.setBit(bits,ordinal);
+}
+}
+return bits;
+},
+toIds:function(bits){
+const ids=[];
+bits.forEach((word,i)=>{
+while(word){
+const bit=31-Math.clz32(word&-word);
+ids.push(this.ids[i*32+bit]);
+word=(word&(word-1))>>>0;
+}
+});
+return ids;
+}
+};
+window.CountrySelection=CountrySelection;;
+let countriesData=null;
+let selectedCountryIds=new Set();
+let continentStates={};
+let selectionMode='both';
+const CONTINENTS={
+'Africa':'africa',
+'Asia':'asia',
+'Europe':'europe',
+'North America':'northAmerica',
+'South America':'southAmerica',
+'Oceania':'oceania',
+'Antarctica':'antarctica'
+};
+const FILTER_BUTTONS={
+'Africa':'africa',
+'Asia':'asia',
+'Europe':'europe',
+'North America':'northAmerica',
+'South America':'southAmerica',
+'Oceania':'oceania'
+};
+async function initSetup(){
+try{
+translator.initialize();
+const loadingIndicator=new LoadingIndicator({text:'Loading countries...'});
+loadingIndicator.show(document.body);
+await loadCountriesData();
+loadingIndicator.hide();
+const savedSettings=Storage.get('gameSettings');
+if(savedSettings){
+selectedCountryIds=new Set(savedSettings.selectedCountryIds||countriesData.countries.map(c=>c.id));
+continentStates={...savedSettings.continentStates};
+selectionMode=savedSettings.selectionMode||'both';
+const selectionRadio=document.querySelector(`input[name="selection-mode"][value="${selectionMode}"]`);
+if(selectionRadio){
+selectionRadio.checked=true;
+}
+}else{
+selectedCountryIds=new Set(countriesData.countries.map(c=>c.id));
+initializeContinentStates();
+}
+renderFilterButtons();
+renderCountryButtons();
+updateSelectedCounter();
+setupEventListeners();
+document.addEventListener('languageChanged',()=>{
+renderFilterButtons();
+updateSelectedCounter();
+reloadCountryNames();
+});
+}catch(error){
+console.error('Failed to initialize setup:',error);
+ErrorHandler.showMessage('Failed to load countries data. Please refresh the page.');
+}
+}
+async function loadCountriesData(){
+try{
+const currentLanguage=localStorage.getItem('wqc-language')||'en';
+countriesData=await CountriesData.load(currentLanguage);
+if(!countriesData.countries||!countriesData.continents){
+throw new Error('Invalid countries data format');
+}
+CountrySelection.init(countriesData);
+console.log(`Loaded ${countriesData.countries.length} countries`);
+}catch(error){
+console.error('Error loading countries data:',error);
+throw error;
+}
+}
+async function reloadCountryNames(){
+try{
+countriesData=await CountriesData.load(translator.getCurrentLanguage());
+CountrySelection.init(countriesData);
+renderCountryButtons();
+}catch(error){
+console.error('Failed to load country names:',error);
+}
+}
+function initializeContinentStates(){
+continentStates={};
+Object.keys(CONTINENTS).forEach(continent=>{
+continentStates[continent]=true;
+});
+}
+function renderFilterButtons(){
+const container=document.getElementById('filter-buttons');
+if(!container)return;
+container.innerHTML='';
+const counts=getContinentCounts();
+Object.keys(FILTER_BUTTONS).forEach(filterKey=>{
+let buttonText=translator.getTranslation(FILTER_BUTTONS[filterKey]);
+let buttonClass='filter-btn continent-filter';
+let countDisplay='';
+if(counts[filterKey]&&selectionMode!=='both'){
+if(selectionMode==='countries'){
+countDisplay=`(${counts[filterKey].countries})`;
+}else if(selectionMode==='territories'){
+countDisplay=`(${counts[filterKey].territories})`;
+}
+}
+if(countDisplay){
+buttonText=`${buttonText} ${countDisplay}`;
+}
+const button=DOM.create('button',{
+class:buttonClass+(continentStates[filterKey]?' active':''),
+'data-filter':filterKey
+});
+const textSpan=DOM.create('span',{
+class:'filter-text',
+text:buttonText
+});
+button.appendChild(textSpan);
+button.addEventListener('click',()=>toggleFilter(filterKey,button));
+container.appendChild(button);
+});
+}
+function renderCountryButtons(){
+const container=document.getElementById('country-buttons');
+if(!container)return;
+container.innerHTML='';
+countriesData.countries.forEach(country=>{
+const button=DOM.create('button',{
+class:`country-btn${selectedCountryIds.has(country.id)?' active':''}`,
+'data-country-id':country.id
+});
+const thumb=FlagLoader.createThumb(country,countriesData.flagAtlas);
+const img=thumb||DOM.create('img',{
+src:country.flagPath,
+alt:country.name,
+loading:'lazy'
+});
+if(!thumb){
+img.addEventListener('error',()=>{
+img.src='data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNDAiIGhlaWdodD0iMzAiIHZpZXdCb3g9IjAgMCA0MCAzMCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHJlY3Qgd2lkdGg9IjQwIiBoZWlnaHQ9IjMwIiBmaWxsPSIjZTJlOGYwIi8+Cjx0ZXh0IHg9IjIwIiB5PSIxNSIgZm9udC1mYW1pbHk9ImFyaWFsLCBzYW5zLXNlcmlmIiBmb250LXNpemU9IjEwIiBmaWxsPSIjOWNhM2FmIiB0ZXh0LWFuY2hvcj0iYWlkIGltaWQiPk4vQTwvdGV4dD4KPC9zdmc+';
+});
+}
+const span=DOM.create('span',{
+text:country.name
+});
+button.addEventListener('click',()=>toggleCountry(country.id,button));
+button.appendChild(img);
+button.appendChild(span);
+container.appendChild(button);
+});
+}
+function toggleFilter(filterKey,buttonElement){
+const isCurrentlyActive=buttonElement.classList.contains('active');
+const shouldSelect=!isCurrentlyActive;
+continentStates[filterKey]=shouldSelect;
+applyFilters();
+buttonElement.classList.toggle('active',shouldSelect);
+updateCountryButtons();
+updateSelectedCounter();
+updateStartButton();
+}
+function applyFilters(){
+const activeContinents=Object.keys(continentStates).filter(cont=>continentStates[cont]);
+let filtered=activeContinents.length>0
+?activeContinents.reduce((bits,continent)=>
+CountrySelection.or(bits,CountrySelection.get('continents',continent)),CountrySelection.empty())
+:CountrySelection.all();
+const territories=CountrySelection.get('statuses','territory');
+if(selectionMode==='countries'){
+filtered=CountrySelection.andNot(filtered,territories);
+}else if(selectionMode==='territories'){
+filtered=CountrySelection.and(filtered,territories);
+}
+filtered=CountrySelection.andNot(filtered,CountrySelection.fromIds(['ATA']));
+selectedCountryIds=new Set(CountrySelection.toIds(filtered));
+}
+function updateFilterButtons(){
+}
+function toggleCountry(countryId,buttonElement){
+if(selectedCountryIds.has(countryId)){
+selectedCountryIds.delete(countryId);
+buttonElement.classList.remove('active');
+}else{
+selectedCountryIds.add(countryId);
+buttonElement.classList.add('active');
+}
+updateContinentButtons();
+updateSelectedCounter();
+updateStartButton();
+}
+function updateCountryButtons(){
+const buttons=document.querySelectorAll('.country-btn');
+buttons.forEach(button=>{
+const countryId=button.dataset.countryId;
+const isSelected=selectedCountryIds.has(countryId);
+button.classList.toggle('active',isSelected);
+});
+}
+function updateContinentButtons(){
+const selected=CountrySelection.fromIds(selectedCountryIds);
+Object.keys(CONTINENTS).forEach(continent=>{
+const button=document.querySelector(`[data-continent="${continent}"]`);
+if(!button)return;
+const inContinent=CountrySelection.get('continents',continent);
+const selectedInContinent=CountrySelection.count(CountrySelection.and(selected,inContinent));
+const totalInContinent=CountrySelection.count(inContinent);
+const isActive=selectedInContinent===totalInContinent&&totalInContinent>0;
+button.classList.toggle('active',isActive);
+});
+}
+function updateSelectedCounter(){
+const counter=document.getElementById('selected-count');
+if(!counter)return;
+const selected=CountrySelection.fromIds(selectedCountryIds);
+const selectedCount=CountrySelection.count(selected);
+const selectedTerritories=CountrySelection.count(
+CountrySelection.and(selected,CountrySelection.get('statuses','territory')));
+const selectedRegularCountries=selectedCount-selectedTerritories;
+if(selectedTerritories>0){
+const selectedText=translator.getTranslation('selected');
+const countriesText=translator.getTranslation('countries');
+const territoriesText=translator.getTranslation('territories');
+counter.textContent=`${selectedCountryIds.size} ${selectedText} (${selectedRegularCountries} ${countriesText}, ${selectedTerritories} ${territoriesText})`;
+counter.classList.add('with-breakdown');
+}else{
+const selectedText=translator.getTranslation('selected');
+counter.textContent=`${selectedCountryIds.size} ${selectedText}`;
+counter.classList.remove('with-breakdown');
+}
+}
+function updateStartButton(){
+const startBtn=document.getElementById('start-btn');
+if(startBtn){
+startBtn.disabled=selectedCountryIds.size===0;
+}
+}
+function clearSettings(){
+Storage.remove('gameSettings');
+selectedCountryIds=new Set(countriesData.countries.map(c=>c.id));
+initializeContinentStates();
+selectionMode='both';
+const selectionRadio=document.querySelector('input[name="selection-mode"][value="both"]');
+if(selectionRadio){
+selectionRadio.checked=true;
+}
+renderFilterButtons();
+renderCountryButtons();
+updateSelectedCounter();
+updateStartButton();
+}
+function setupEventListeners(){
+const startBtn=document.getElementById('start-btn');
+if(startBtn){
+startBtn.addEventListener('click',startGame);
+}
+const clearBtn=document.getElementById('clear-settings-btn');
+if(clearBtn){
+clearBtn.addEventListener('click',clearSettings);
+}
+const selectionRadios=document.querySelectorAll('input[name="selection-mode"]');
+selectionRadios.forEach(radio=>{
+radio.addEventListener('change',(e)=>{
+selectionMode=e.target.value;
+applyFilters();
+renderFilterButtons();
+updateSelectedCounter();
+updateStartButton();
+});
+});
+}
+function startGame(){
+if(selectedCountryIds.size===0){
+ErrorHandler.showMessage('Please select at least one country to play.');
+return;
+}
+const timeLimit=0;
+const gameSettings={
+selectedCountryIds:Array.from(selectedCountryIds),
+timeLimit:timeLimit,
+continentStates:{...continentStates},
+selectionMode:selectionMode
+};
+if(!Storage.set('gameSettings',gameSettings)){
+ErrorHandler.showMessage('Failed to save game settings. Please try again.');
+return;
+}
+const selected=CountrySelection.fromIds(selectedCountryIds);
+OfflineCache.precacheContinents(Object.keys(countriesData.continents).filter(continent=>
+CountrySelection.count(CountrySelection.and(selected,CountrySelection.get('continents',continent)))>0));
+window.location.href='game.html';
+}
+document.addEventListener('keydown',(e)=>{
+if((e.ctrlKey||e.metaKey)&&e.key==='Enter'){
+e.preventDefault();
+const startBtn=document.getElementById('start-btn');
+if(startBtn&&!startBtn.disabled){
+startGame();
+}
+}
+});
+function getContinentCounts(){
+if(!countriesData)return{};
+const counts={};
+const territories=CountrySelection.get('statuses','territory');
+Object.keys(CONTINENTS).forEach(continent=>{
+const inContinent=CountrySelection.get('continents',continent);
+const total=CountrySelection.count(inContinent);
+const territoryCount=CountrySelection.count(CountrySelection.and(inContinent,territories));
+counts[continent]={
+total:total,
+territories:territoryCount,
+countries:total-territoryCount
+};
+});
+counts.totalTerritories=CountrySelection.count(territories);
+return counts;
+}
+document.addEventListener('DOMContentLoaded',initSetup);;
+//# sourceMappingURL=index.b1572bd49419.js.map
@@ -0,0 +1,531 @@
+class TranslationService{
+constructor(){
+this.currentLanguage=localStorage.getItem('wqc-language')||'en';
+this.translations={};
+this.languages=null;
+this.startupBundle=null;
+}
+useStartupBundle(bundle){
+this.startupBundle=bundle.catch(error=>{
+console.warn('Startup bundle unavailable, loading translation files:',error);
+return null;
+});
+}
+getCurrentLanguage(){
+return this.currentLanguage;
+}
+async setLanguage(language){
+if(language===this.currentLanguage)return;
+this.currentLanguage=language;
+localStorage.setItem('wqc-language',language);
+try{
+await this.loadTranslations(language);
+this.updatePageLanguage();
+}catch(error){
+console.error('Failed to load translations:',error);
+}
+}
+getTranslation(key){
+return this.translations[this.currentLanguage]?.[key]||key;
+}
+async loadTranslations(language){
+if(this.translations[language])return this.translations[language];
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle&&bundle.language===language){
+this.translations[language]=bundle.translations;
+return this.translations[language];
+}
+const response=await fetch(`/world-quiz-championships/assets/translations/${language}.json`);
+if(!response.ok){
+throw new Error(`Failed to load translations for ${language}`);
+}
+this.translations[language]=await response.json();
+return this.translations[language];
+}
+async loadLanguages(){
+if(this.languages)return this.languages;
+const bundle=this.startupBundle&&await this.startupBundle;
+if(bundle){
+this.languages=bundle.languages;
+return this.languages;
+}
+const response=await fetch('/world-quiz-championships/assets/translations/languages.json');
+if(!response.ok){
+throw new Error('Failed to load languages');
+}
+this.languages=await response.json();
+return this.languages;
+}
+updatePageLanguage(){
+document.documentElement.lang=this.currentLanguage==='no'?'nb':'en';
+const elements=document.querySelectorAll('[data-translate]');
+elements.forEach(element=>{
+const key=element.getAttribute('data-translate');
+const translation=this.getTranslation(key);
+if(element.tagName==='OPTION'){
+const currentValue=element.value;
+const selected=element.selected;
+const newOption=document.createElement('option');
+newOption.value=currentValue;
+newOption.textContent=translation;
+newOption.selected=selected;
+element.parentNode.replaceChild(newOption,element);
+}else{
+element.textContent=translation;
+}
+});
+const event=new CustomEvent('languageChanged',{
+detail:{language:this.currentLanguage}
+});
+document.dispatchEvent(event);
+}
+async initialize(){
+await this.loadTranslations(this.currentLanguage);
+this.updatePageLanguage();
+}
+}
+const translator=new TranslationService();
+window.TranslationService=TranslationService;
+window.translator=translator;;
+const Storage={
+set(key,value){
+try{
+sessionStorage.setItem(key,JSON.stringify(value));
+return true;
+}catch(error){
+console.error('Failed to save to sessionStorage:',error);
+return false;
+}
+},
+get(key,defaultValue=null){
+try{
+const item=sessionStorage.getItem(key);
+return item?JSON.parse(item):defaultValue;
+}catch(error){
+console.error('Failed to read from sessionStorage:',error);
+return defaultValue;
+}
+},
+remove(key){
+try{
+sessionStorage.removeItem(key);
+return true;
+}catch(error){
+console.error('Failed to remove from sessionStorage:',error);
+return false;
+}
+},
+clear(){
+try{
+sessionStorage.clear();
+return true;
+}catch(error){
+console.error('Failed to clear sessionStorage:',error);
+return false;
+}
+}
+};
+const Timer={
+createCountdown(seconds,onTick,onComplete){
+let remaining=seconds;
+let interval=null;
+const update=()=>{
+onTick&&onTick(remaining);
+return remaining;
+};
+const start=()=>{
+update();
+interval=setInterval(()=>{
+remaining--;
+update();
+if(remaining<=0){
+stop();
+onComplete&&onComplete();
+}
+},1000);
+return interval;
+};
+const stop=()=>{
+if(interval){
+clearInterval(interval);
+interval=null;
+}
+};
+const getRemaining=()=>remaining;
+const setRemaining=(value)=>{remaining=value;};
+return{start,stop,getRemaining,setRemaining};
+},
+formatTime(seconds){
+if(seconds===0)return'0:00';
+if(!seconds||seconds<0)return'--:--';
+const mins=Math.floor(seconds/60);
+const secs=seconds%60;
+return`${mins}:${secs.toString().padStart(2,'0')}`;
+}
+};
+const ArrayUtils={
+shuffle(array){
+if(!Array.isArray(array))return array;
+const shuffled=[...array];
+for(let i=shuffled.length-1;i>0;i--){
+const j=Math.floor(Math.random()*(i+1));
+[shuffled[i],shuffled[j]]=[shuffled[j],shuffled[i]];
+}
+return shuffled;
+},
+getRandom(array,count=1){
+if(!Array.isArray(array)||count<=0)return[];
+const shuffled=this.shuffle(array);
+return shuffled.slice(0,Math.min(count,array.length));
+}
+};
+const StringUtils={
+capitalize(str){
+if(!str)return'';
+return str.charAt(0).toUpperCase()+str.slice(1).toLowerCase();
+},
+normalize(str){
+if(!str)return'';
+return str.trim().replace(/\s+/g,' ');
+}
+};
+const Navigation={
+go(path){
+window.location.href=path;
+},
+back(){
+window.history.back();
+},
+reload(){
+window.location.reload();
+}
+};
+const DOM={
+$(id){
+return document.getElementById(id);
+},
+$$(selector,context=document){
+return context.querySelector(selector);
+},
+$$$(selector,context=document){
+return Array.from(context.querySelectorAll(selector));
+},
+create(tag,options={}){
+const element=document.createElement(tag);
+if(options.class)element.className=options.class;
+if(options.text)element.textContent=options.text;
+if(options.html)element.innerHTML=options.html;
+if(options.id)element.id=options.id;
+for(const[key,value]of Object.entries(options)){
+if(['class','text','html','id'].includes(key))continue;
+element.setAttribute(key,value);
+}
+return element;
+},
+on(element,event,handler,options={}){
+element.addEventListener(event,handler,options);
+return element;
+}
+};
+if(!Element.prototype.closest){
+Element.prototype.closest=function(selector){
+let element=this;
+while(element&&element.nodeType===1){
+if(element.matches(selector)){
+return element;
+}
+element=element.parentElement||element.parentNode;
+}
+return null;
+};
+}
+const ErrorHandler={
+handle(error,context=''){
+console.error(`Error${context?` in ${context}`:''}:`,error);
+},
+showMessage(message,type='error'){
+alert(message);
+}
+};
+window.Storage=Storage;
+window.Timer=Timer;
+window.ArrayUtils=ArrayUtils;
+window.StringUtils=StringUtils;
+window.Navigation=Navigation;
+window.DOM=DOM;
+window.ErrorHandler=ErrorHandler;;
+const OfflineCache={
+scriptUrl:'/world-quiz-championships/sw.js',
+register:function(){
+if(!('serviceWorker'in navigator)){
+return Promise.resolve(null);
+}
+return navigator.serviceWorker.register(this.scriptUrl).catch(error=>{
+console.warn('Service worker registration failed:',error);
+return null;
+});
+},
+precacheContinents:function(continents){
+if(!('serviceWorker'in navigator)||continents.length===0)return;
+navigator.serviceWorker.ready.then(registration=>{
+if(registration.active){
+registration.active.postMessage({type:'precache-continents',continents:continents});
+}
+});
+}
+};
+OfflineCache.register();
+window.OfflineCache=OfflineCache;;
+const FlagLoader={
+bundles:{},
+objectUrls:new Set(),
+symbolsUrl:'data/flag-symbols.json',
+symbols:null,
+symbolReferencePattern:/<use href="#(wqs-[0-9a-f]+)"/g,
+preload:function(countries){
+const urls=new Set();
+countries.forEach(country=>{
+if(country.flagBundle){
+urls.add(country.flagBundle[0]);
+}
+});
+return Promise.all([...urls].map(url=>this.loadBundle(url)));
+},
+loadBundle:function(url){
+if(!this.bundles[url]){
+this.bundles[url]=fetch(url)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.arrayBuffer();
+})
+.catch(error=>{
+delete this.bundles[url];
+throw error;
+});
+}
+return this.bundles[url];
+},
+loadSymbols:function(){
+if(!this.symbols){
+this.symbols=fetch(this.symbolsUrl)
+.then(response=>{
+if(!response.ok){
+throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+}
+return response.json();
+})
+.then(library=>library.symbols)
+.catch(error=>{
+this.symbols=null;
+throw error;
+});
+}
+return this.symbols;
+},
+resolveSymbols:async function(bytes){
+const text=new TextDecoder().decode(bytes);
+const ids=new Set(Array.from(text.matchAll(this.symbolReferencePattern),match=>match[1]));
+if(ids.size===0)return bytes;
+const symbols=await this.loadSymbols();
+const defs=[...ids].map(id=>`<g id="${id}">${symbols[id]}</g>`).join('');
+const end=text.lastIndexOf('</svg>');
+return`${text.slice(0,end)}<defs>${defs}</defs>${text.slice(end)}`;
+},
+getFlagUrl:async function(country){
+let blob;
+if(country.flagBundle){
+const[url,offset,length]=country.flagBundle;
+const buffer=await this.loadBundle(url);
+const svg=await this.resolveSymbols(new Uint8Array(buffer,offset,length));
+blob=new Blob([svg],{type:'image/svg+xml'});
+}else{
+const response=await fetch(country.flagPath);
+blob=new Blob([await response.text()],{type:'image/svg+xml'});
+}
+const objectUrl=URL.createObjectURL(blob);
+this.objectUrls.add(objectUrl);
+return objectUrl;
+},
+release:function(objectUrl){
+if(objectUrl&&this.objectUrls.delete(objectUrl)){
+URL.revokeObjectURL(objectUrl);
+}
+},
+createThumb:function(country,atlas){
+if(!atlas||!country.flagThumb)return null;
+const[cellWidth,cellHeight]=atlas.cell;
+const[atlasWidth,atlasHeight]=atlas.size;
+const[x,y]=country.flagThumb;
+const columns=atlasWidth/cellWidth;
+const rows=atlasHeight/cellHeight;
+const image=window.devicePixelRatio>1?atlas.images['2x']:atlas.images['1x'];
+const thumb=document.createElement('div');
+thumb.className='flag-thumb';
+thumb.setAttribute('role','img');
+thumb.setAttribute('aria-label',country.name);
+thumb.style.backgroundImage=`url("${image}")`;
+thumb.style.backgroundSize=`${columns*100}% ${rows*100}%`;
+thumb.style.backgroundPosition=`${columns>1?(x/cellWidth)/(columns-1)*100:0}% `+
+`${rows>1?(y/cellHeight)/(rows-1)*100:0}%`;
+return thumb;
+},
+releaseAll:function(){
+this.objectUrls.forEach(objectUrl=>URL.revokeObjectURL(objectUrl));
+this.objectUrls.clear();
+}
+};
+window.FlagLoader=FlagLoader;;
+let gameResults=null;
+function initResults(){
+gameResults=Storage.get('gameResults');
+if(!gameResults){
+console.error('No game results found');
+ErrorHandler.showMessage('No game results found. Redirecting to setup.');
+setTimeout(()=>{
+window.location.href='index.html';
+},2000);
+return;
+}
+translator.initialize();
+setTimeout(()=>{
+displayResults();
+},100);
+}
+function displayResults(){
+updateElement('final-score',gameResults.score);
+const grade=calculateGrade();
+updateElement('grade',grade.grade);
+document.getElementById('grade').className=`grade grade-${grade.grade}`;
+const totalAttempts=calculateTotalAttempts();
+const flagsPlayed=gameResults.completedQuestions||gameResults.totalQuestions;
+updateElement('total-flags',flagsPlayed);
+updateElement('correct-first',gameResults.correctFirstTry||0);
+updateElement('correct-second',gameResults.correctSecondTry||0);
+updateElement('correct-third',0);
+updateElement('failed',gameResults.failedQuestions||0);
+const correctQuestions=(gameResults.correctFirstTry||0)+(gameResults.correctSecondTry||0);
+const maxPossibleScore=flagsPlayed*10;
+const accuracy=flagsPlayed>0?Math.round((correctQuestions/flagsPlayed)*100):0;
+const firstTryRate=flagsPlayed>0?Math.round((gameResults.correctFirstTry/flagsPlayed)*100):0;
+const timeTakenSeconds=gameResults.timeTaken||0;
+const completedQuestions=gameResults.completedQuestions||0;
+const actualFlagsPerMinute=timeTakenSeconds>0?(completedQuestions/(timeTakenSeconds/60)):completedQuestions;
+const failedWithThird=(gameResults.failedQuestions||0)+(gameResults.correctThirdTry||0);
+updateElement('accuracy',accuracy+'%');
+updateElement('failed',failedWithThird);
+updateElement('first-try-rate',firstTryRate+'%');
+updateElement('flags-per-minute',actualFlagsPerMinute.toFixed(1));
+updateElement('best-streak',gameResults.bestStreak||0);
+updateElement('time-taken',formatTime(timeTakenSeconds));
+displayPracticeCountries();
+}
+function displayPracticeCountries(){
+const practiceContainer=document.getElementById('practice-countries');
+const practiceBox=document.getElementById('practice-more');
+if(!practiceContainer||!practiceBox)return;
+const allPracticeCountries=[
+...(gameResults.secondTryCountries||[]),
+...(gameResults.failedCountries||[])
+];
+if(allPracticeCountries.length===0){
+practiceBox.style.display='none';
+return;
+}
+practiceBox.style.display='block';
+practiceContainer.innerHTML='';
+const countriesGrid=document.createElement('div');
+countriesGrid.className='practice-countries-grid';
+allPracticeCountries.forEach(country=>{
+const countryItem=document.createElement('div');
+countryItem.className='practice-country-item';
+const flagContainer=document.createElement('div');
+flagContainer.className='practice-flag-container';
+const thumb=FlagLoader.createThumb(country,gameResults.flagAtlas);
+const flagImg=thumb||document.createElement('img');
+flagImg.classList.add('practice-flag');
+if(!thumb){
+flagImg.alt=country.name;
+}
+flagContainer.appendChild(flagImg);
+countryItem.appendChild(flagContainer);
+const nameElement=document.createElement('div');
+nameElement.className='practice-country-name';
+nameElement.textContent=country.name;
+countryItem.appendChild(nameElement);
+countriesGrid.appendChild(countryItem);
+if(!thumb){
+loadPracticeFlag(country,flagImg);
+}
+});
+practiceContainer.appendChild(countriesGrid);
+}
+async function loadPracticeFlag(country,imgElement){
+try{
+const url=await FlagLoader.getFlagUrl(country);
+imgElement.onload=()=>FlagLoader.release(url);
+imgElement.src=url;
+}catch(error){
+console.error('Failed to load flag for practice:',error);
+imgElement.src='data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNDAiIGhlaWdodD0iMzAiIHZpZXdCb3g9IjAgMCA0MCAzMCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHJlY3Qgd2lkdGg9IjQwIiBoZWlnaHQ9IjMwIiBmaWxsPSIjZTJlOGYwIi8+Cjx0ZXh0IHg9IjIwIiB5PSIxNSIgZm9udC1mYW1pbHk9ImFyaWFsLCBzYW5zLXNlcmlmIiBmb250LXNpemU9IjEwIiBmaWxsPSIjOWNhM2FmIiB0ZXh0LWFuY2hvcj0iYWlkIGltaWQiPk4vQTwvdGV4dD4KPC9zdmc+';
+}
+}
+function calculateGrade(){
+const flagsPlayed=gameResults.completedQuestions||gameResults.totalQuestions;
+const correctQuestions=(gameResults.correctFirstTry||0)+(gameResults.correctSecondTry||0);
+const accuracy=flagsPlayed>0?(correctQuestions/flagsPlayed)*100:0;
+const firstTryRate=flagsPlayed>0?(gameResults.correctFirstTry/flagsPlayed)*100:0;
+if(accuracy>=95&&firstTryRate>=70){
+return{grade:'S',color:'gold'};
+}else if((accuracy>=85&&firstTryRate>=50)||accuracy>=90){
+return{grade:'A',color:'purple'};
+}else if(accuracy>=75&&firstTryRate>=30){
+return{grade:'B',color:'cyan'};
+}else if(accuracy>=60){
+return{grade:'C',color:'green'};
+}else{
+return{grade:'D',color:'red'};
+}
+}
+function calculateTotalAttempts(){
+const firstTryCorrect=gameResults.correctFirstTry||0;
+const secondTryCorrect=gameResults.correctSecondTry||0;
+const thirdTryCorrect=gameResults.correctThirdTry||0;
+const failed=gameResults.failedQuestions||0;
+return firstTryCorrect*1+secondTryCorrect*2+thirdTryCorrect*3+failed*3;
+}
+function formatTime(totalSeconds){
+const minutes=Math.floor(totalSeconds/60);
+const seconds=totalSeconds%60;
+return`${minutes}:${seconds.toString().padStart(2,'0')}`;
+}
+function playAgain(){
+window.location.href='game.html';
+}
+function newGame(){
+Storage.remove('gameResults');
+Storage.remove('quizProgress');
+window.location.href='index.html';
+}
+function mainMenu(){
+Storage.remove('gameResults');
+Storage.remove('quizProgress');
+window.location.href='../../../index.html';
+}
+function updateElement(id,value){
+const element=document.getElementById(id);
+if(element){
+element.textContent=value;
+}
+}
+document.addEventListener('DOMContentLoaded',()=>{
+if(typeof translator!=='undefined'){
+translator.initialize();
+initResults();
+}else{
+console.error('Translator not loaded');
+setTimeout(()=>location.reload(),500);
+}
+});;
+//# sourceMappingURL=results.71b58e0d8fea.js.map
@@ -22,8 +22,8 @@ const AnswerValidator = {
      */
     isClose: function(answer, country) {
         // For future use - suggestion system
-        const normalizedAnswer = answer.toLowerCase().trim();
-        const normalizedCountry = country.name.toLowerCase().trim();
+        const normalizedAnswer = GameLogic.normalizeString(answer);
+        const normalizedCountry = country.normalizedName || GameLogic.normalizeString(country.name);
 
         // Direct substring match
         if (normalizedAnswer.includes(normalizedCountry) ||
@@ -34,22 +34,118 @@ const AnswerValidator = {
         return false;
     },
 
+    // Suggestion index from data/suggestions_<lang>.json
+    suggestionIndex: null,
+
+    // Country list of the last index lookup and the set of its ids
+    suggestionScope: { countries: null, ids: null },
+
+    // Letters NFD does not decompose, mirrored by LETTER_FOLDS in generator/suggestions.py
+    letterFolds: { 'ø': 'o', 'æ': 'ae', 'œ': 'oe', 'ß': 'ss', 'đ': 'd', 'ł': 'l', 'ı': 'i' },
+
+    /**
+     * Fold text the way the suggestion index terms were folded
+     * Mirrored by fold() in generator/suggestions.py; keep the two in sync
+     * @param {string} text - Text to fold
+     * @returns {string} Lowercase ASCII words separated by single spaces
+     */
+    fold: function(text) {
+        return text.toLowerCase()
+            .normalize('NFD')
+            .replace(/[\u0300-\u036f]/g, '')
+            .replace(/[øæœßđłı]/g, letter => this.letterFolds[letter])
+            .replace(/[^a-z0-9]+/g, ' ')
+            .trim();
+    },
+
+    /**
+     * Load the suggestion index for a language
+     * @param {string} language - Language code
+     * @returns {Promise<object>} The loaded index
+     */
+    loadSuggestionIndex: async function(language) {
+        const response = await fetch(`data/suggestions_${language}.json`);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        this.suggestionIndex = await response.json();
+        return this.suggestionIndex;
+    },
+
     /**
      * Get suggestions based on partial input
+     * Uses the suggestion index when loaded: prefix matches by binary search,
+     * then substring matches through the trigram posting lists, keeping only the given countries
      * @param {string} partial - Partial user input
-     * @param {Array} countries - Array of country objects
+     * @param {Array} countries - Array of country objects to suggest from
      * @returns {Array} Array of suggested country names
      */
     getSuggestions: function(partial, countries) {
         if (!partial || partial.length < 2) return [];
 
-        const normalizedPartial = partial.toLowerCase().trim();
+        const index = this.suggestionIndex;
+        if (!index) {
+            const normalizedPartial = partial.toLowerCase().trim();
+            const suggestions = [];
+
+            for (const country of countries) {
+                if (country.name.toLowerCase().includes(normalizedPartial)) {
+                    suggestions.push(country.name);
+                    if (suggestions.length >= 5) break; // Limit suggestions
+                }
+            }
+
+            return suggestions;
+        }
+
+        const query = this.fold(partial);
         const suggestions = [];
+        const seen = new Set();
+        if (query.length < 2) return suggestions;
 
-        for (const country of countries) {
-            if (country.name.toLowerCase().includes(normalizedPartial)) {
-                suggestions.push(country.name);
-                if (suggestions.length >= 5) break; // Limit suggestions
+        // The id set is built once per country list, not per keystroke
+        if (this.suggestionScope.countries !== countries) {
+            this.suggestionScope = { countries, ids: new Set(countries.map(country => country.id)) };
+        }
+        const allowed = this.suggestionScope.ids;
+
+        // Add the country behind a term; true once the limit is reached
+        const addTerm = (termIndex) => {
+            const ordinal = index.termIds[termIndex];
+            if (!seen.has(ordinal) && allowed.has(index.ids[ordinal])) {
+                seen.add(ordinal);
+                suggestions.push(index.names[ordinal]);
+            }
+            return suggestions.length >= 5; // Limit suggestions
+        };
+
+        // Prefix matches: first term >= query, then walk while it still matches
+        let low = 0;
+        let high = index.terms.length;
+        while (low < high) {
+            const mid = (low + high) >>> 1;
+            if (index.terms[mid] < query) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        for (let i = low; i < index.terms.length && index.terms[i].startsWith(query); i++) {
+            if (addTerm(i)) return suggestions;
+        }
+
+        // Substring matches: verify the terms of the rarest trigram in the query
+        if (query.length >= 3) {
+            let candidates = null;
+            for (let i = 0; i + 3 <= query.length; i++) {
+                const postings = index.trigrams[query.slice(i, i + 3)];
+                if (!postings) return suggestions;
+                if (!candidates || postings.length < candidates.length) {
+                    candidates = postings;
+                }
+            }
+            for (const termIndex of candidates) {
+                if (index.terms[termIndex].includes(query) && addTerm(termIndex)) break;
             }
         }
 
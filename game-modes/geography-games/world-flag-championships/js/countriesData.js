@@ -0,0 +1,197 @@
+/**
+ * Countries data loading for World Flag Championships
+ * The data is a shared base (ids, continents, statuses, flag bundles) plus a small
+ * per-language overlay of names. The first load takes both from the startup bundle when
+ * the page has one, otherwise from the content-hashed files in data/countries-manifest.json,
+ * and falls back to data/countries_<lang>.json. The base is kept, so switching language
+ * only downloads the new overlay. A page that needs only some countries filters those,
+ * or asks the api/countries endpoint for just those where serve.py announces it
+ * (see generator/store.py).
+ */
+
+const CountriesData = {
+    // Base dataset of the last load, reused for other languages
+    base: null,
+
+    /**
+     * Load the countries data for a language
+     * @param {string} language - Language code
+     * @returns {Promise<object>} Data with continents and countries, as in countries_<lang>.json
+     */
+    load: async function(language) {
+        if (window.StartupBundle && !this.base) {
+            try {
+                const bundle = await StartupBundle.load(language);
+                this.base = bundle.countries.base;
+                return this.merge(this.base, bundle.countries.names);
+            } catch (error) {
+                console.warn('Startup bundle unavailable, loading countries data:', error);
+            }
+        }
+
+        try {
+            const manifest = await this.fetchJson('data/countries-manifest.json');
+            if (manifest.names && manifest.names[language]) {
+                const names = await this.fetchJson(manifest.names[language].path);
+                if (!this.base || this.base.version !== names.version) {
+                    this.base = await this.fetchJson(manifest.base.path);
+                }
+                return this.merge(this.base, names);
+            }
+        } catch (error) {
+            console.warn('Compact countries data unavailable, loading full dataset:', error);
+        }
+
+        return this.fetchJson(`data/countries_${language}.json`);
+    },
+
+    /**
+     * Load only the countries matching a query
+     * The full data comes with the startup bundle or the precached files, so by default it
+     * is filtered here. Only where serve.py announces its api/countries endpoint (see
+     * subsetEndpoint) is the subset requested from there, falling back to the full data
+     * @param {string} language - Language code
+     * @param {object} query - Optional ids, continent and status arrays; answers to include the answer table
+     * @returns {Promise<object>} Data with continents and countries, as in countries_<lang>.json
+     */
+    loadSubset: async function(language, query) {
+        const lists = ['ids', 'continent', 'status'].filter(name => query[name]);
+        const endpoint = this.subsetEndpoint();
+        // An empty list matches nothing, but would be dropped from the query string and match everything
+        if (endpoint && !this.base && lists.every(name => query[name].length > 0)) {
+            const params = new URLSearchParams({ lang: language });
+            lists.forEach(name => {
+                params.set(name, query[name].join(','));
+            });
+            if (query.answers) {
+                params.set('answers', '1');
+            }
+            try {
+                const subset = await this.fetchJson(`${endpoint}?${params}`);
+                return this.merge(subset.base, subset.names);
+            } catch (error) {
+                console.warn('Country subset endpoint unavailable, loading countries data:', error);
+            }
+        }
+        return this.filter(await this.load(language), query);
+    },
+
+    /**
+     * The api/countries URL serve.py announces in the page, if any
+     * Static hosting has no such endpoint and no announcement
+     * @returns {string|null} Endpoint URL relative to the game mode
+     */
+    subsetEndpoint: function() {
+        const meta = document.querySelector('meta[name="countries-api"]');
+        return meta ? meta.content : null;
+    },
+
+    /**
+     * Keep the countries matching a query, as the api/countries endpoint would
+     * @param {object} data - Data with continents and countries
+     * @param {object} query - Optional ids, continent and status arrays
+     * @returns {object} The same data with only the matching countries
+     */
+    filter: function(data, query) {
+        const ids = query.ids ? new Set(query.ids) : null;
+        const countries = data.countries.filter(country =>
+            (!ids || ids.has(country.id)) &&
+            (!query.continent || query.continent.includes(country.continent)) &&
+            (!query.status || query.status.includes(country.status))
+        );
+
+        const continents = {};
+        countries.forEach(country => {
+            if (!continents[country.continent]) continents[country.continent] = [];
+            continents[country.continent].push(country.id);
+        });
+
+        const subset = { ...data, continents, countries };
+        // The selection bitsets index the full country list
+        delete subset.selection;
+        return subset;
+    },
+
+    /**
+     * Fetch and parse a JSON file
+     * @param {string} url - URL relative to the game mode
+     * @returns {Promise<object>} Parsed JSON
+     */
+    fetchJson: async function(url) {
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        return response.json();
+    },
+
+    /**
+     * Join a base dataset and a name overlay into the regular data structure
+     * Mirrors to_base() and to_names() in generator/compact.py
+     * @param {object} base - Language-independent columns
+     * @param {object} names - Name overlay for one language
+     * @returns {object} Data with continents and countries
+     */
+    merge: function(base, names) {
+        if (base.version !== names.version) {
+            throw new Error(`Name overlay ${names.version} does not fit base ${base.version}`);
+        }
+
+        const continents = {};
+        base.continents.forEach(continent => {
+            continents[continent] = [];
+        });
+
+        const countries = base.ids.map((id, i) => {
+            const continent = base.continents[base.continent[i]];
+            continents[continent].push(id);
+
+            const country = {
+                id: id,
+                name: names.names[i],
+                continent: continent,
+                flagPath: base.flagPathTemplate.replace('{id}', id),
+                status: base.statuses[base.status[i]]
+            };
+            if (base.bundles) {
+                country.flagBundle = [base.bundles[base.bundle[i]], base.offset[i], base.length[i]];
+            }
+            if (base.flagThumb && base.flagThumb[i]) {
+                country.flagThumb = base.flagThumb[i];
+            }
+            if (base.similarFlags) {
+                country.similarFlags = base.similarFlags[i].map(ordinal => base.ids[ordinal]);
+            }
+            if (base.difficulty && base.difficulty[i] !== null) {
+                country.difficulty = base.difficulty[i];
+                country.answerStats = base.answerStats[i];
+            }
+            if (names.normalizedNames) {
+                country.normalizedName = names.normalizedNames[i];
+            }
+            if (names.alternatives && names.alternatives[id]) {
+                country.alternatives = names.alternatives[id];
+            }
+            return country;
+        });
+
+        const data = { continents, countries };
+        if (base.flagAtlas) {
+            data.flagAtlas = base.flagAtlas;
+        }
+        if (base.selection) {
+            data.selection = base.selection;
+        }
+        if (names.answers) {
+            // Answers point at ordinals; turn them back into ids
+            data.answers = {};
+            Object.entries(names.answers).forEach(([answer, match]) => {
+                data.answers[answer] = Array.isArray(match) ? match.map(i => base.ids[i]) : base.ids[match];
+            });
+        }
+        return data;
+    }
+};
+
+// Export for use in other modules
+window.CountriesData = CountriesData;
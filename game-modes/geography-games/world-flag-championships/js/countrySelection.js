@@ -0,0 +1,129 @@
+/**
+ * Country selection bitsets for World Flag Championships
+ * A set of countries is an array of 32-bit words indexed by country ordinal (position
+ * in countriesData.countries). Per-continent and per-status sets come precomputed in the
+ * data (generator/selection.py), so filters and counts are a few word operations.
+ */
+
+const CountrySelection = {
+    ids: [],
+    ordinals: new Map(),
+    wordCount: 0,
+    continents: {},
+    statuses: {},
+
+    /**
+     * Index a countries dataset
+     * Builds the bitsets locally when the data predates precomputed selections
+     * @param {object} data - Countries data ({ continents, countries, selection })
+     */
+    init: function(data) {
+        this.ids = data.countries.map(country => country.id);
+        this.ordinals = new Map(this.ids.map((id, ordinal) => [id, ordinal]));
+        this.wordCount = Math.ceil(this.ids.length / 32);
+
+        if (data.selection && data.selection.size === this.ids.length) {
+            this.continents = data.selection.continents;
+            this.statuses = data.selection.statuses;
+            return;
+        }
+
+        this.continents = {};
+        this.statuses = {};
+        data.countries.forEach((country, ordinal) => {
+            if (!this.continents[country.continent]) this.continents[country.continent] = this.empty();
+            if (!this.statuses[country.status]) this.statuses[country.status] = this.empty();
+            this.setBit(this.continents[country.continent], ordinal);
+            this.setBit(this.statuses[country.status], ordinal);
+        });
+    },
+
+    empty: function() {
+        return new Array(this.wordCount).fill(0);
+    },
+
+    all: function() {
+        const bits = this.empty();
+        for (let ordinal = 0; ordinal < this.ids.length; ordinal++) {
+            this.setBit(bits, ordinal);
+        }
+        return bits;
+    },
+
+    setBit: function(bits, ordinal) {
+        bits[ordinal >>> 5] = (bits[ordinal >>> 5] | (1 << (ordinal & 31))) >>> 0;
+    },
+
+    /**
+     * Bitset of a continent or status; empty when the key is unknown
+     * @param {string} kind - 'continents' or 'statuses'
+     * @param {string} key - Continent name or status
+     * @returns {Array<number>} Bitset
+     */
+    get: function(kind, key) {
+        return this[kind][key] || this.empty();
+    },
+
+    or: function(a, b) {
+        return a.map((word, i) => (word | b[i]) >>> 0);
+    },
+
+    and: function(a, b) {
+        return a.map((word, i) => (word & b[i]) >>> 0);
+    },
+
+    andNot: function(a, b) {
+        return a.map((word, i) => (word & ~b[i]) >>> 0);
+    },
+
+    /**
+     * Number of countries in a bitset
+     * @param {Array<number>} bits - Bitset
+     * @returns {number} Population count
+     */
+    count: function(bits) {
+        let total = 0;
+        bits.forEach(word => {
+            word = word - ((word >>> 1) & 0x55555555);
+            word = (word & 0x33333333) + ((word >>> 2) & 0x33333333);
+            total += (((word + (word >>> 4)) & 0x0F0F0F0F) * 0x01010101) >>> 24;
+        });
+        return total;
+    },
+
+    /**
+     * Bitset of the given country ids (unknown ids are ignored)
+     * @param {Iterable<string>} ids - Country ids
+     * @returns {Array<number>} Bitset
+     */
+    fromIds: function(ids) {
+        const bits = this.empty();
+        for (const id of ids) {
+            const ordinal = this.ordinals.get(id);
+            if (ordinal !== undefined) {
+                this.setBit(bits, ordinal);
+            }
+        }
+        return bits;
+    },
+
+    /**
+     * Country ids in a bitset, in dataset order
+     * @param {Array<number>} bits - Bitset
+     * @returns {Array<string>} Country ids
+     */
+    toIds: function(bits) {
+        const ids = [];
+        bits.forEach((word, i) => {
+            while (word) {
+                const bit = 31 - Math.clz32(word & -word);
+                ids.push(this.ids[i * 32 + bit]);
+                word = (word & (word - 1)) >>> 0;
+            }
+        });
+        return ids;
+    }
+};
+
+// Export for use in other modules
+window.CountrySelection = CountrySelection;
@@ -0,0 +1,171 @@
+/**
+ * Flag loading for World Flag Championships
+ * Flags are cut out of per-continent bundles (data/flags/<continent>.bin) by byte range,
+ * so a session downloads each bundle once instead of one file per flag.
+ * Subtrees shared by several flags are left out of the bundled copies as <use> references
+ * into data/flag-symbols.json (see generator/symbols.py) and put back before display
+ */
+
+const FlagLoader = {
+    // Bundle URL -> Promise resolving to its ArrayBuffer
+    bundles: {},
+
+    // Object URLs handed out and not yet released
+    objectUrls: new Set(),
+
+    // Shared symbol library location and the Promise resolving to its contents
+    symbolsUrl: 'data/flag-symbols.json',
+    symbols: null,
+
+    // References to library symbols in a bundled flag
+    symbolReferencePattern: /<use href="#(wqs-[0-9a-f]+)"/g,
+
+    /**
+     * Start downloading every bundle the given countries need
+     * @param {Array} countries - Country objects from data
+     * @returns {Promise} Resolves once all bundles have arrived
+     */
+    preload: function(countries) {
+        const urls = new Set();
+        countries.forEach(country => {
+            if (country.flagBundle) {
+                urls.add(country.flagBundle[0]);
+            }
+        });
+        return Promise.all([...urls].map(url => this.loadBundle(url)));
+    },
+
+    /**
+     * Fetch a bundle once and share the result between callers
+     * @param {string} url - Bundle path relative to the game mode
+     * @returns {Promise<ArrayBuffer>} Bundle contents
+     */
+    loadBundle: function(url) {
+        if (!this.bundles[url]) {
+            this.bundles[url] = fetch(url)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                    }
+                    return response.arrayBuffer();
+                })
+                .catch(error => {
+                    // Allow a later call to retry
+                    delete this.bundles[url];
+                    throw error;
+                });
+        }
+        return this.bundles[url];
+    },
+
+    /**
+     * Fetch the shared symbol library once
+     * @returns {Promise<object>} Symbol id -> markup
+     */
+    loadSymbols: function() {
+        if (!this.symbols) {
+            this.symbols = fetch(this.symbolsUrl)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                    }
+                    return response.json();
+                })
+                .then(library => library.symbols)
+                .catch(error => {
+                    // Allow a later call to retry
+                    this.symbols = null;
+                    throw error;
+                });
+        }
+        return this.symbols;
+    },
+
+    /**
+     * Add the library symbols a bundled flag references as <defs>
+     * @param {Uint8Array} bytes - Flag SVG cut from a bundle
+     * @returns {Promise<Uint8Array|string>} The bytes as they were, or the completed SVG text
+     */
+    resolveSymbols: async function(bytes) {
+        const text = new TextDecoder().decode(bytes);
+        const ids = new Set(Array.from(text.matchAll(this.symbolReferencePattern), match => match[1]));
+        if (ids.size === 0) return bytes;
+
+        const symbols = await this.loadSymbols();
+        const defs = [...ids].map(id => `<g id="${id}">${symbols[id]}</g>`).join('');
+        const end = text.lastIndexOf('</svg>');
+        return `${text.slice(0, end)}<defs>${defs}</defs>${text.slice(end)}`;
+    },
+
+    /**
+     * Get an object URL for a country's flag
+     * Falls back to the standalone SVG for data without bundle information
+     * @param {object} country - Country object from data
+     * @returns {Promise<string>} Object URL; pass it to release() when no longer shown
+     */
+    getFlagUrl: async function(country) {
+        let blob;
+        if (country.flagBundle) {
+            const [url, offset, length] = country.flagBundle;
+            const buffer = await this.loadBundle(url);
+            const svg = await this.resolveSymbols(new Uint8Array(buffer, offset, length));
+            blob = new Blob([svg], { type: 'image/svg+xml' });
+        } else {
+            const response = await fetch(country.flagPath);
+            blob = new Blob([await response.text()], { type: 'image/svg+xml' });
+        }
+
+        const objectUrl = URL.createObjectURL(blob);
+        this.objectUrls.add(objectUrl);
+        return objectUrl;
+    },
+
+    /**
+     * Revoke an object URL returned by getFlagUrl()
+     * @param {string} objectUrl - URL to release
+     */
+    release: function(objectUrl) {
+        if (objectUrl && this.objectUrls.delete(objectUrl)) {
+            URL.revokeObjectURL(objectUrl);
+        }
+    },
+
+    /**
+     * Create a thumbnail element drawn from the pre-rendered flag atlas
+     * Positions are percentages so the element can be sized freely in CSS
+     * @param {object} country - Country object with a flagThumb position
+     * @param {object} atlas - flagAtlas metadata from the countries data
+     * @returns {HTMLElement|null} Thumbnail element, or null when no atlas entry exists
+     */
+    createThumb: function(country, atlas) {
+        if (!atlas || !country.flagThumb) return null;
+
+        const [cellWidth, cellHeight] = atlas.cell;
+        const [atlasWidth, atlasHeight] = atlas.size;
+        const [x, y] = country.flagThumb;
+        const columns = atlasWidth / cellWidth;
+        const rows = atlasHeight / cellHeight;
+        const image = window.devicePixelRatio > 1 ? atlas.images['2x'] : atlas.images['1x'];
+
+        const thumb = document.createElement('div');
+        thumb.className = 'flag-thumb';
+        thumb.setAttribute('role', 'img');
+        thumb.setAttribute('aria-label', country.name);
+        thumb.style.backgroundImage = `url("${image}")`;
+        thumb.style.backgroundSize = `${columns * 100}% ${rows * 100}%`;
+        thumb.style.backgroundPosition = `${columns > 1 ? (x / cellWidth) / (columns - 1) * 100 : 0}% ` +
+            `${rows > 1 ? (y / cellHeight) / (rows - 1) * 100 : 0}%`;
+        return thumb;
+    },
+
+    /**
+     * Revoke every outstanding object URL
+     */
+    releaseAll: function() {
+        this.objectUrls.forEach(objectUrl => URL.revokeObjectURL(objectUrl));
+        this.objectUrls.clear();
+    }
+};
+
+// Export for use in other modules
+window.FlagLoader = FlagLoader;
@@ -23,24 +23,24 @@ let gameState = {
     bestStreak: 0, // Track the best streak of correct answers
     currentStreak: 0, // Current streak counter
     secondTryCountries: [], // Countries gotten wrong on first try but correct on second
-    failedCountries: [] // Countries failed on all three attempts
+    failedCountries: [], // Countries failed on all three attempts
+    flagUrl: null, // Object URL of the flag currently shown
+    flagAtlas: null // Thumbnail atlas metadata, passed on to the results page
 };
 
 /**
- * Load countries data from JSON file
+ * Load the data of the selected countries
+ * @param {Array} selectedCountryIds - Ids chosen on the setup screen
  */
-async function loadCountriesData() {
+async function loadCountriesData(selectedCountryIds) {
     try {
         // Determine which data file to load based on current language
         const currentLanguage = localStorage.getItem('wqc-language') || 'en';
-        const dataFile = `data/countries_${currentLanguage}.json`;
 
-        const response = await fetch(dataFile);
-        if (!response.ok) {
-            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-        }
-
-        const countriesData = await response.json();
+        const countriesData = await CountriesData.loadSubset(currentLanguage, {
+            ids: selectedCountryIds,
+            answers: true
+        });
 
         if (!countriesData.countries || !countriesData.continents) {
             throw new Error('Invalid countries data format');
@@ -72,10 +72,11 @@ async function initGame() {
         }
 
         // Load countries data
-        const countriesData = await loadCountriesData();
-        gameState.countries = countriesData.countries.filter(country =>
-            settings.selectedCountryIds.includes(country.id)
-        );
+        const countriesData = await loadCountriesData(settings.selectedCountryIds || []);
+        gameState.countries = countriesData.countries;
+
+        gameState.flagAtlas = countriesData.flagAtlas || null;
+        GameLogic.setAnswerTable(countriesData.answers);
 
         if (gameState.countries.length === 0) {
             ErrorHandler.showMessage(translator.getTranslation('noCountriesSelected'));
@@ -90,6 +91,11 @@ async function initGame() {
         gameState.elapsedTime = 0; // Start elapsed time at 0
         gameState.totalQuestions = gameState.countries.length;
 
+        // Download the flag bundles for the selected continents in the background
+        FlagLoader.preload(gameState.countries).catch(error => {
+            console.error('Failed to preload flag bundles:', error);
+        });
+
         // Shuffle countries for random order
         shuffleArray(gameState.countries);
 
@@ -231,15 +237,15 @@ function loadFlagAlternative(country) {
 
     if (!flagImg) return;
 
-    // Try loading as SVG content
-    fetch(country.flagPath)
-        .then(response => response.text())
-        .then(svgContent => {
-            // Create a blob URL for SVG or use inline SVG
-            const blob = new Blob([svgContent], { type: 'image/svg+xml' });
-            const url = URL.createObjectURL(blob);
+    // Cut the SVG out of its continent bundle and show it through a blob URL
+    FlagLoader.getFlagUrl(country)
+        .then(url => {
+            const previousUrl = gameState.flagUrl;
+            gameState.flagUrl = url;
             flagImg.src = url;
             flagImg.onload = () => {
+                // The previous flag is no longer displayed
+                FlagLoader.release(previousUrl);
                 loadingSpinner.style.display = 'none';
                 flagImg.style.display = 'block';
             };
@@ -465,6 +471,12 @@ function endGame() {
     const endTime = Date.now();
     const timeTakenSeconds = gameState.startTime ? Math.floor((endTime - gameState.startTime) / 1000) : gameState.timeLimit;
 
+    // Outcome of every question played: [country id, try answered correctly on (1-3), or 0 if failed]
+    const failedIds = new Set(gameState.failedCountries.map(country => country.id));
+    const questions = gameState.countries.slice(0, gameState.currentQuestionIndex).map(country =>
+        [country.id, failedIds.has(country.id) ? 0 : (gameState.attempts[country.id] || 0)]
+    );
+
     // Save detailed results for accurate statistics
     const results = {
         score: gameState.score,
@@ -479,6 +491,10 @@ function endGame() {
         bestStreak: gameState.bestStreak,
         secondTryCountries: gameState.secondTryCountries,
         failedCountries: gameState.failedCountries,
+        questions: questions,
+        continents: [...new Set(gameState.countries.map(country => country.continent))].sort(),
+        language: translator.getCurrentLanguage(),
+        flagAtlas: gameState.flagAtlas,
         date: new Date().toISOString()
     };
 
@@ -486,6 +502,8 @@ function endGame() {
         console.error('Failed to save game results');
     }
 
+    FlagLoader.releaseAll();
+
     // Navigate to results page
     setTimeout(() => {
         window.location.href = 'results.html';
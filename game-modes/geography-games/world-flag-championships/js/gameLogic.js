@@ -3,40 +3,65 @@
  */
 
 const GameLogic = {
+    // Normalized answer -> country id (or list of ids) from the countries data
+    answerTable: null,
+
+    /**
+     * Use the precomputed answer table from the countries data
+     * @param {object} answerTable - The dataset's answers map
+     */
+    setAnswerTable: function(answerTable) {
+        this.answerTable = answerTable || null;
+    },
+
+    /**
+     * Normalize a string for comparison
+     * Mirrored by normalize() in generator/answers.py; keep the two in sync
+     * @param {string} str - String to normalize
+     * @returns {string} Normalized string
+     */
+    normalizeString: function(str) {
+        return str.toLowerCase()
+            .trim()
+            // Remove special characters and accents
+            .normalize('NFD')
+            .replace(/[\u0300-\u036f]/g, '')
+            // Remove punctuation
+            .replace(/[.,\/#!$%\^&\*;:{}=\-_`~()]/g, '')
+            // Replace multiple spaces with single space
+            .replace(/\s+/g, ' ');
+    },
+
     /**
      * Validate a user's answer against a country's name
+     * Mirrored by Rules.grade() in generator/grading.py (grade_answers.py); keep the two in sync
      * @param {string} userAnswer - The user's submitted answer
      * @param {object} country - Country object from data
      * @returns {boolean} True if the answer is correct
      */
     validateAnswer: function(userAnswer, country) {
-        // Normalize both strings for comparison
-        const normalizeString = (str) => {
-            return str.toLowerCase()
-                .trim()
-                // Remove special characters and accents
-                .normalize('NFD')
-                .replace(/[\u0300-\u036f]/g, '')
-                // Remove punctuation
-                .replace(/[.,\/#!$%\^&\*;:{}=\-_`~()]/g, '')
-                // Replace multiple spaces with single space
-                .replace(/\s+/g, ' ');
-        };
-
-        const normalizedUserAnswer = normalizeString(userAnswer);
-        const normalizedCountryName = normalizeString(country.name);
-
-        // Direct match
-        if (normalizedUserAnswer === normalizedCountryName) {
-            return true;
-        }
+        const normalizedUserAnswer = this.normalizeString(userAnswer);
+        const normalizedCountryName = country.normalizedName || this.normalizeString(country.name);
 
-        // Check for common variations and alternatives
-        const alternatives = this.getCountryAlternatives(country);
-        for (const alt of alternatives) {
-            if (normalizeString(alt) === normalizedUserAnswer) {
+        if (this.answerTable) {
+            // Exact name or alternative match is a single lookup
+            const match = this.answerTable[normalizedUserAnswer];
+            if (match === country.id || (Array.isArray(match) && match.includes(country.id))) {
+                return true;
+            }
+        } else {
+            // Direct match
+            if (normalizedUserAnswer === normalizedCountryName) {
                 return true;
             }
+
+            // Check for common variations and alternatives
+            const alternatives = this.getCountryAlternatives(country);
+            for (const alt of alternatives) {
+                if (this.normalizeString(alt) === normalizedUserAnswer) {
+                    return true;
+                }
+            }
         }
 
         // Check for partial matches with high confidence
@@ -45,66 +70,17 @@ const GameLogic = {
 
     /**
      * Get alternative names/accepted answers for a country
+     * The lists live in generator/tables/alternatives/<lang>.json
      * @param {object} country - Country object
      * @returns {string[]} Array of alternative names
      */
     getCountryAlternatives: function(country) {
-        const alternatives = [country.name];
-
-        // Add common alternative names
-        switch(country.id) {
-            case 'USA':
-                alternatives.push('United States', 'United States of America', 'America');
-                break;
-            case 'GBR':
-                alternatives.push('United Kingdom', 'Britain', 'UK', 'Great Britain');
-                break;
-            case 'PRK':
-                alternatives.push('North Korea', "Democratic People's Republic of Korea");
-                break;
-            case 'KOR':
-                alternatives.push('South Korea', 'Republic of Korea');
-                break;
-            case 'COD':
-                alternatives.push('Democratic Republic of the Congo', 'DR Congo', 'DRC');
-                break;
-            case 'COG':
-                alternatives.push('Republic of the Congo', 'Congo-Brazzaville');
-                break;
-            case 'PSE':
-                alternatives.push('Palestine', 'Palestinian territories');
-                break;
-            case 'TZA':
-                alternatives.push('Tanzania, United Republic of');
-                break;
-            case 'FSM':
-                alternatives.push('Micronesia', 'Federated States of Micronesia');
-                break;
-            case 'SSD':
-                alternatives.push('South Sudan');
-                break;
-            case 'MKD':
-                alternatives.push('North Macedonia', 'Macedonia', 'Nord Makedonia', 'Makedonia');
-                break;
-            case 'SWZ':
-                alternatives.push('Eswatini', 'Swaziland');
-                break;
-            case 'VEN':
-                alternatives.push('Venezuela (Bolivarian Republic of)');
-                break;
-            case 'BOL':
-                alternatives.push('Bolivia (Plurinational State of)');
-                break;
-            case 'LAO':
-                alternatives.push("Lao People's Democratic Republic", 'Laos');
-                break;
-        }
-
-        return alternatives;
+        return [country.name, ...(country.alternatives || [])];
     },
 
     /**
      * Check for partial matches with fuzzy logic
+     * Mirrored by Rules.partial_match() in generator/grading.py
      * @param {string} userAnswer - Normalized user answer
      * @param {string} correctAnswer - Normalized correct answer
      * @returns {boolean} True if they match sufficiently
@@ -206,20 +182,22 @@ const GameLogic = {
             };
         }
 
+        // One pass; spreading a long score list into Math.max can overflow the call stack
         const totalGames = gameResults.length;
-        const scores = gameResults.map(g => g.score);
-        const bestScore = Math.max(...scores);
-        const averageScore = scores.reduce((a, b) => a + b, 0) / totalGames;
-
-        // Assuming each result has an accuracy and time field
-        const accuracies = gameResults.map(g => g.accuracy || 0);
-        const times = gameResults.map(g => g.timeSpent || 0);
-
-        const averageAccuracy = accuracies.length > 0 ?
-            accuracies.reduce((a, b) => a + b, 0) / accuracies.length : 0;
-
-        const averageTime = times.length > 0 ?
-            times.reduce((a, b) => a + b, 0) / times.length : 0;
+        let bestScore = -Infinity;
+        let scoreTotal = 0;
+        let accuracyTotal = 0;
+        let timeTotal = 0;
+        gameResults.forEach(g => {
+            bestScore = Math.max(bestScore, g.score);
+            scoreTotal += g.score;
+            accuracyTotal += g.accuracy || 0;
+            timeTotal += g.timeSpent || 0;
+        });
+
+        const averageScore = scoreTotal / totalGames;
+        const averageAccuracy = accuracyTotal / totalGames;
+        const averageTime = timeTotal / totalGames;
 
         return {
             totalGames,
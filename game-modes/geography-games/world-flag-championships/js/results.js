@@ -115,9 +115,13 @@ function displayPracticeCountries() {
         const flagContainer = document.createElement('div');
         flagContainer.className = 'practice-flag-container';
 
-        const flagImg = document.createElement('img');
-        flagImg.className = 'practice-flag';
-        flagImg.alt = country.name;
+        // Prefer the thumbnail atlas over fetching each SVG
+        const thumb = FlagLoader.createThumb(country, gameResults.flagAtlas);
+        const flagImg = thumb || document.createElement('img');
+        flagImg.classList.add('practice-flag');
+        if (!thumb) {
+            flagImg.alt = country.name;
+        }
 
         flagContainer.appendChild(flagImg);
         countryItem.appendChild(flagContainer);
@@ -131,7 +135,9 @@ function displayPracticeCountries() {
         countriesGrid.appendChild(countryItem);
 
         // Load flag asynchronously
-        loadPracticeFlag(country, flagImg);
+        if (!thumb) {
+            loadPracticeFlag(country, flagImg);
+        }
     });
 
     practiceContainer.appendChild(countriesGrid);
@@ -142,11 +148,8 @@ function displayPracticeCountries() {
  */
 async function loadPracticeFlag(country, imgElement) {
     try {
-        const response = await fetch(country.flagPath);
-        const svgContent = await response.text();
-
-        const blob = new Blob([svgContent], { type: 'image/svg+xml' });
-        const url = URL.createObjectURL(blob);
+        const url = await FlagLoader.getFlagUrl(country);
+        imgElement.onload = () => FlagLoader.release(url);
         imgElement.src = url;
     } catch (error) {
         console.error('Failed to load flag for practice:', error);
@@ -81,6 +81,7 @@ async function initSetup() {
         document.addEventListener('languageChanged', () => {
             renderFilterButtons();
             updateSelectedCounter();
+            reloadCountryNames();
         });
 
     } catch (error) {
@@ -96,19 +97,15 @@ async function loadCountriesData() {
     try {
         // Determine which data file to load based on current language
         const currentLanguage = localStorage.getItem('wqc-language') || 'en';
-        const dataFile = `data/countries_${currentLanguage}.json`;
 
-        const response = await fetch(dataFile);
-        if (!response.ok) {
-            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-        }
-
-        countriesData = await response.json();
+        countriesData = await CountriesData.load(currentLanguage);
 
         if (!countriesData.countries || !countriesData.continents) {
             throw new Error('Invalid countries data format');
         }
 
+        CountrySelection.init(countriesData);
+
         console.log(`Loaded ${countriesData.countries.length} countries`);
 
     } catch (error) {
@@ -117,6 +114,20 @@ async function loadCountriesData() {
     }
 }
 
+/**
+ * Reload country names after a language switch
+ * Only the new language's name overlay is downloaded; the base data is reused
+ */
+async function reloadCountryNames() {
+    try {
+        countriesData = await CountriesData.load(translator.getCurrentLanguage());
+        CountrySelection.init(countriesData);
+        renderCountryButtons();
+    } catch (error) {
+        console.error('Failed to load country names:', error);
+    }
+}
+
 /**
  * Initialize continent states (all selected by default)
  */
@@ -190,17 +201,22 @@ function renderCountryButtons() {
             'data-country-id': country.id
         });
 
-        // Create flag img element
-        const img = DOM.create('img', {
+        // Draw the flag from the thumbnail atlas when the build produced one
+        const thumb = FlagLoader.createThumb(country, countriesData.flagAtlas);
+
+        // Otherwise create flag img element
+        const img = thumb || DOM.create('img', {
             src: country.flagPath,
             alt: country.name,
             loading: 'lazy'
         });
 
         // Add error handling for flags
-        img.addEventListener('error', () => {
-            img.src = 'data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNDAiIGhlaWdodD0iMzAiIHZpZXdCb3g9IjAgMCA0MCAzMCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHJlY3Qgd2lkdGg9IjQwIiBoZWlnaHQ9IjMwIiBmaWxsPSIjZTJlOGYwIi8+Cjx0ZXh0IHg9IjIwIiB5PSIxNSIgZm9udC1mYW1pbHk9ImFyaWFsLCBzYW5zLXNlcmlmIiBmb250LXNpemU9IjEwIiBmaWxsPSIjOWNhM2FmIiB0ZXh0LWFuY2hvcj0iYWlkIGltaWQiPk4vQTwvdGV4dD4KPC9zdmc+'; // N/A placeholder
-        });
+        if (!thumb) {
+            img.addEventListener('error', () => {
+                img.src = 'data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNDAiIGhlaWdodD0iMzAiIHZpZXdCb3g9IjAgMCA0MCAzMCIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHJlY3Qgd2lkdGg9IjQwIiBoZWlnaHQ9IjMwIiBmaWxsPSIjZTJlOGYwIi8+Cjx0ZXh0IHg9IjIwIiB5PSIxNSIgZm9udC1mYW1pbHk9ImFyaWFsLCBzYW5zLXNlcmlmIiBmb250LXNpemU9IjEwIiBmaWxsPSIjOWNhM2FmIiB0ZXh0LWFuY2hvcj0iYWlkIGltaWQiPk4vQTwvdGV4dD4KPC9zdmc+'; // N/A placeholder
+            });
+        }
 
         // Create country name span
         const span = DOM.create('span', {
@@ -241,52 +257,28 @@ function toggleFilter(filterKey, buttonElement) {
  * Apply all filters to update country selection
  */
 function applyFilters() {
-    let filteredCountryIds = new Set();
-
     // Get active continents
     const activeContinents = Object.keys(continentStates).filter(cont => continentStates[cont]);
 
-    // Filter logic based on selection mode
-    if (activeContinents.length > 0) {
-        activeContinents.forEach(continent => {
-            const countryIds = countriesData.continents[continent] || [];
-            countryIds.forEach(id => {
-                const country = countriesData.countries.find(c => c.id === id);
-                if (!country) return;
-
-                // Apply selection mode filter
-                const shouldInclude = (selectionMode === 'both') ||
-                    (selectionMode === 'countries' && country.status !== 'territory') ||
-                    (selectionMode === 'territories' && country.status === 'territory');
-
-                if (shouldInclude) {
-                    filteredCountryIds.add(id);
-                }
-            });
-        });
-    }
-    // If NO continents selected but selection mode is territories, show ALL territories globally
-    else if (selectionMode === 'territories') {
-        countriesData.countries
-            .filter(country => country.status === 'territory')
-            .forEach(country => filteredCountryIds.add(country.id));
-    }
-    // If NO continents selected and selection mode is countries, show ALL countries globally
-    else if (selectionMode === 'countries') {
-        countriesData.countries
-            .filter(country => country.status !== 'territory')
-            .forEach(country => filteredCountryIds.add(country.id));
-    }
-    // If NO continents selected and selection mode is both, show ALL countries and territories
-    else if (selectionMode === 'both') {
-        countriesData.countries.forEach(country => filteredCountryIds.add(country.id));
+    // No continents selected means every continent
+    let filtered = activeContinents.length > 0
+        ? activeContinents.reduce((bits, continent) =>
+            CountrySelection.or(bits, CountrySelection.get('continents', continent)), CountrySelection.empty())
+        : CountrySelection.all();
+
+    // Apply selection mode filter
+    const territories = CountrySelection.get('statuses', 'territory');
+    if (selectionMode === 'countries') {
+        filtered = CountrySelection.andNot(filtered, territories);
+    } else if (selectionMode === 'territories') {
+        filtered = CountrySelection.and(filtered, territories);
     }
 
     // Filter out countries we don't want in the game (like Antarctica)
-    filteredCountryIds = new Set([...filteredCountryIds].filter(id => id !== 'ATA'));
+    filtered = CountrySelection.andNot(filtered, CountrySelection.fromIds(['ATA']));
 
     // Update selected countries to match filtered results
-    selectedCountryIds = filteredCountryIds;
+    selectedCountryIds = new Set(CountrySelection.toIds(filtered));
 }
 
 /**
@@ -330,13 +322,15 @@ function updateCountryButtons() {
  * Update continent button states based on country selections
  */
 function updateContinentButtons() {
+    const selected = CountrySelection.fromIds(selectedCountryIds);
+
     Object.keys(CONTINENTS).forEach(continent => {
         const button = document.querySelector(`[data-continent="${continent}"]`);
         if (!button) return;
 
-        const countryIdsInContinent = countriesData.continents[continent] || [];
-        const selectedInContinent = countryIdsInContinent.filter(id => selectedCountryIds.has(id)).length;
-        const totalInContinent = countryIdsInContinent.length;
+        const inContinent = CountrySelection.get('continents', continent);
+        const selectedInContinent = CountrySelection.count(CountrySelection.and(selected, inContinent));
+        const totalInContinent = CountrySelection.count(inContinent);
 
         // Continent is active if all countries are selected
         const isActive = selectedInContinent === totalInContinent && totalInContinent > 0;
@@ -351,15 +345,17 @@ function updateSelectedCounter() {
     const counter = document.getElementById('selected-count');
     if (!counter) return;
 
-    const selectedCountries = countriesData.countries.filter(c => selectedCountryIds.has(c.id));
-    const selectedTerritories = selectedCountries.filter(c => c.status === 'territory');
-    const selectedRegularCountries = selectedCountries.filter(c => c.status !== 'territory');
+    const selected = CountrySelection.fromIds(selectedCountryIds);
+    const selectedCount = CountrySelection.count(selected);
+    const selectedTerritories = CountrySelection.count(
+        CountrySelection.and(selected, CountrySelection.get('statuses', 'territory')));
+    const selectedRegularCountries = selectedCount - selectedTerritories;
 
-    if (selectedTerritories.length > 0) {
+    if (selectedTerritories > 0) {
         const selectedText = translator.getTranslation('selected');
         const countriesText = translator.getTranslation('countries');
         const territoriesText = translator.getTranslation('territories');
-        counter.textContent = `${selectedCountryIds.size} ${selectedText} (${selectedRegularCountries.length} ${countriesText}, ${selectedTerritories.length} ${territoriesText})`;
+        counter.textContent = `${selectedCountryIds.size} ${selectedText} (${selectedRegularCountries} ${countriesText}, ${selectedTerritories} ${territoriesText})`;
         counter.classList.add('with-breakdown');
     } else {
         const selectedText = translator.getTranslation('selected');
@@ -458,6 +454,11 @@ function startGame() {
         return;
     }
 
+    // Keep the flags of every continent in play available offline
+    const selected = CountrySelection.fromIds(selectedCountryIds);
+    OfflineCache.precacheContinents(Object.keys(countriesData.continents).filter(continent =>
+        CountrySelection.count(CountrySelection.and(selected, CountrySelection.get('continents', continent))) > 0));
+
     // Navigate to game screen
     window.location.href = 'game.html';
 }
@@ -484,21 +485,22 @@ function getContinentCounts() {
     if (!countriesData) return {};
 
     const counts = {};
+    const territories = CountrySelection.get('statuses', 'territory');
 
     Object.keys(CONTINENTS).forEach(continent => {
-        const countryIds = countriesData.continents[continent] || [];
-        const countries = countryIds.map(id => countriesData.countries.find(c => c.id === id)).filter(c => c);
+        const inContinent = CountrySelection.get('continents', continent);
+        const total = CountrySelection.count(inContinent);
+        const territoryCount = CountrySelection.count(CountrySelection.and(inContinent, territories));
 
         counts[continent] = {
-            total: countries.length,
-            territories: countries.filter(c => c.status === 'territory').length,
-            countries: countries.filter(c => c.status !== 'territory').length
+            total: total,
+            territories: territoryCount,
+            countries: total - territoryCount
         };
     });
 
     // Also add total territories
-    const allTerritories = countriesData.countries.filter(c => c.status === 'territory');
-    counts.totalTerritories = allTerritories.length;
+    counts.totalTerritories = CountrySelection.count(territories);
 
     return counts;
 }
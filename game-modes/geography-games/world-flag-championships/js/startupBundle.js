@@ -0,0 +1,39 @@
+/**
+ * Startup bundle for World Flag Championships
+ * data/startup_<lang>.json carries the UI strings, the language list and the compact
+ * countries data, so a page needs one request before it can render
+ */
+
+const StartupBundle = {
+    // Language -> Promise resolving to the parsed bundle
+    requests: {},
+
+    /**
+     * Fetch a language's startup bundle once and share it between callers
+     * @param {string} language - Language code
+     * @returns {Promise<object>} Bundle with language, languages, translations and countries
+     */
+    load: function(language) {
+        if (!this.requests[language]) {
+            this.requests[language] = fetch(`data/startup_${language}.json`)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+                    }
+                    return response.json();
+                })
+                .catch(error => {
+                    // Allow a later call to retry
+                    delete this.requests[language];
+                    throw error;
+                });
+        }
+        return this.requests[language];
+    }
+};
+
+// Start the request right away; the translator waits for it instead of fetching its files
+translator.useStartupBundle(StartupBundle.load(translator.getCurrentLanguage()));
+
+// Export for use in other modules
+window.StartupBundle = StartupBundle;
@@ -0,0 +1,6 @@
+"""
+Build pipeline for the World Quiz Championships static data.
+
+The country tables in ``generator/tables`` are the single source for every
+generated dataset; ``generate_countries.py`` is the entry point.
+"""
@@ -0,0 +1,78 @@
+"""
+Accepted answers: alternative names per language plus a normalized lookup table
+
+``normalize`` mirrors ``GameLogic.normalizeString`` in js/gameLogic.js; keep the two
+in sync. The generated ``answers`` table maps every normalized name and alternative
+to its country id, so checking an exact answer in the browser is a single lookup.
+"""
+import os
+import re
+import unicodedata
+
+from .cache import hash_bytes, hash_file
+from .files import read_json
+from .modes import DEFAULT_MODE
+
+COMBINING_MARKS_RE = re.compile('[̀-ͯ]')
+PUNCTUATION_RE = re.compile(r'[.,/#!$%^&*;:{}=\-_`~()]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation, collapse whitespace (same order as the JS)."""
+    text = unicodedata.normalize('NFD', text.lower().strip())
+    text = COMBINING_MARKS_RE.sub('', text)
+    text = PUNCTUATION_RE.sub('', text)
+    return WHITESPACE_RE.sub(' ', text)
+
+
+def alternatives_path(language, mode=DEFAULT_MODE):
+    """The mode's alternatives table for ``language``, or None if the mode has no alternatives."""
+    alternatives_dir = mode.table('alternatives')
+    return os.path.join(alternatives_dir, f'{language}.json') if alternatives_dir else None
+
+
+def load_alternatives(language, mode=DEFAULT_MODE):
+    """Extra accepted names keyed by country id; languages without a table have none."""
+    path = alternatives_path(language, mode)
+    return read_json(path) if path and os.path.exists(path) else {}
+
+
+def accepted_answers(country, alternatives):
+    """The country's own name followed by its alternatives, like ``getCountryAlternatives``."""
+    return [country['name']] + alternatives.get(country['id'], [])
+
+
+def build_answer_table(countries, alternatives):
+    """
+    Map each normalized accepted answer to its country id.
+    A string shared by several countries maps to the list of their ids.
+    """
+    table = {}
+    for country in countries:
+        for answer in accepted_answers(country, alternatives):
+            key = normalize(answer)
+            current = table.get(key)
+            if current is None:
+                table[key] = country['id']
+            elif isinstance(current, list):
+                if country['id'] not in current:
+                    current.append(country['id'])
+            elif current != country['id']:
+                table[key] = [current, country['id']]
+    return table
+
+
+def input_digest(language, mode=DEFAULT_MODE):
+    path = alternatives_path(language, mode)
+    return hash_bytes(hash_file(__file__), hash_file(path) if path and os.path.exists(path) else '')
+
+
+def enrich(language, data, mode=DEFAULT_MODE):
+    """Add ``normalizedName``, ``alternatives`` and the ``answers`` table to a dataset."""
+    alternatives = load_alternatives(language, mode)
+    for country in data['countries']:
+        country['normalizedName'] = normalize(country['name'])
+        if country['id'] in alternatives:
+            country['alternatives'] = alternatives[country['id']]
+    data['answers'] = build_answer_table(data['countries'], alternatives)
@@ -0,0 +1,119 @@
+"""
+Flag thumbnail atlas: every flag pre-rendered into one PNG sprite sheet per pixel density
+
+The setup and practice grids draw their flags from the sheet with CSS background
+positions, so the browser decodes one image instead of rasterizing 249 SVGs.
+Rendering needs the optional ``cairosvg`` and ``Pillow`` packages.
+"""
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import hash_bytes, hash_file
+from .files import write_bytes
+from .modes import DEFAULT_MODE
+from .paths import ROOT, site_path
+
+STAGE = 'flag-atlas'
+
+# Thumbnail cell at 1x; flags are 4:3 and the practice grid shows them at 60x45
+CELL_WIDTH = 60
+CELL_HEIGHT = 45
+SCALES = (1, 2)
+
+
+def renderer_available():
+    try:
+        import cairosvg  # noqa: F401
+        import PIL  # noqa: F401
+    except (ImportError, OSError):
+        # OSError: cairosvg is installed but the native cairo library is not
+        return False
+    return True
+
+
+def atlas_path(scale, mode=DEFAULT_MODE):
+    return os.path.join(mode.atlas_dir, f'flags-{scale}x.png')
+
+
+def layout(codes):
+    """
+    Place ``codes`` row by row on a near-square grid.
+    Returns ``(columns, rows, {code: [x, y]})`` with coordinates in 1x pixels.
+    """
+    columns = max(1, math.ceil(math.sqrt(len(codes))))
+    rows = max(1, math.ceil(len(codes) / columns))
+    positions = {
+        code: [(i % columns) * CELL_WIDTH, (i // columns) * CELL_HEIGHT]
+        for i, code in enumerate(codes)
+    }
+    return columns, rows, positions
+
+
+def render_thumbnail(job):
+    """Worker entry point: ``(code, svg_path, scale)`` -> ``(code, scale, PNG bytes)``."""
+    import cairosvg
+
+    code, svg_path, scale = job
+    with open(svg_path, 'rb') as f:
+        png = cairosvg.svg2png(bytestring=f.read(),
+                               output_width=CELL_WIDTH * scale,
+                               output_height=CELL_HEIGHT * scale)
+    return code, scale, png
+
+
+def render_atlases(codes, flag_file, columns, rows, positions, workers=None, mode=DEFAULT_MODE):
+    from PIL import Image
+
+    sheets = {
+        scale: Image.new('RGBA', (columns * CELL_WIDTH * scale, rows * CELL_HEIGHT * scale), (0, 0, 0, 0))
+        for scale in SCALES
+    }
+    jobs = [(code, flag_file(code), scale) for code in codes for scale in SCALES]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for code, scale, png in pool.map(render_thumbnail, jobs, chunksize=8):
+            x, y = positions[code]
+            with Image.open(io.BytesIO(png)) as thumbnail:
+                sheets[scale].paste(thumbnail.convert('RGBA'), (x * scale, y * scale))
+
+    for scale, sheet in sheets.items():
+        buffer = io.BytesIO()
+        sheet.save(buffer, format='PNG', optimize=True)
+        write_bytes(atlas_path(scale, mode), buffer.getvalue())
+
+
+def build(manifest, flag_ids, flag_file, workers=None, force=False, mode=DEFAULT_MODE):
+    """
+    Render the atlases if any flag changed and return the dataset metadata
+    ``(atlas, {code: [x, y]})``, or ``(None, {})`` when no up-to-date atlas can be
+    produced: an existing atlas is only used while it matches the current flags.
+    """
+    codes = sorted(flag_ids)
+    columns, rows, positions = layout(codes)
+    digest = hash_bytes(hash_file(__file__), *codes, *(hash_file(flag_file(code)) for code in codes))
+    outputs_exist = all(os.path.exists(atlas_path(scale, mode)) for scale in SCALES)
+    fresh = outputs_exist and manifest.is_fresh(STAGE, 'flags', digest)
+
+    if force or not fresh:
+        if renderer_available():
+            render_atlases(codes, flag_file, columns, rows, positions, workers, mode)
+            manifest.record(STAGE, 'flags', digest)
+            print(f'Rendered {len(codes)} flag thumbnails into {os.path.relpath(mode.atlas_dir, ROOT)}')
+        elif fresh:
+            print('⚠️  cairosvg/Pillow not installed, keeping the existing flag atlas')
+        elif outputs_exist:
+            # Positions computed now could point at the wrong cells of the old sheets
+            print('⚠️  cairosvg/Pillow not installed and the flag atlas is out of date, leaving it out')
+            return None, {}
+        else:
+            print('⚠️  cairosvg/Pillow not installed, skipping the flag atlas')
+            return None, {}
+
+    atlas = {
+        'cell': [CELL_WIDTH, CELL_HEIGHT],
+        'size': [columns * CELL_WIDTH, rows * CELL_HEIGHT],
+        'images': {f'{scale}x': site_path(atlas_path(scale, mode), mode.game_dir) for scale in SCALES}
+    }
+    return atlas, positions
@@ -0,0 +1,267 @@
+"""
+Benchmarks for the generator pipeline and the bytes a game session loads
+
+Every run copies the checkout to a temporary directory and measures there, so the
+tree is left as it was. Per language it records the wall time and peak memory of a
+forced build, the raw and compressed size of each emitted dataset and how long it
+takes to parse. It also totals what the game page downloads for the default
+selection and for each continent: the page and its bundles, the startup bundle,
+the flag bundles and symbol library, as resolved by generator/weight.py. Results are flat ``metric -> value`` maps; the metric name
+ends in its kind (``time_s``, ``rss_kb``, ``parse_ms``, ``bytes``), which selects
+the regression threshold used when comparing against the previous history entry.
+"""
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from . import compact, countries, startup, suggestions, weight
+from .compress import available_encodings, compress_bytes
+from .files import read_json, write_json
+from .paths import BENCHMARK_HISTORY, GAME_DIR, ROOT, site_path
+
+# Allowed growth over the previous run before a metric counts as a regression
+THRESHOLDS = {
+    'time_s': 0.50,
+    'rss_kb': 0.20,
+    'parse_ms': 0.50,
+    'bytes': 0.02,
+}
+
+# Timings also have to grow by this absolute amount; sub-millisecond parses are noisy
+MIN_DELTA = {
+    'time_s': 0.1,
+    'parse_ms': 0.5,
+}
+
+# Countries the setup screen never selects
+EXCLUDED_FROM_SESSION = {'ATA'}
+
+# Page whose downloads make up a session
+SESSION_PAGE = os.path.join(GAME_DIR, 'game.html')
+
+# Left out of the benchmark copy: history, player data and deploy artifacts
+COPY_IGNORED = shutil.ignore_patterns('.git', 'results', '__pycache__', '*.gz', '*.br')
+
+NODE_PARSE_SCRIPT = """
+const fs = require('fs');
+const text = fs.readFileSync(process.argv[1], 'utf8');
+const times = [];
+for (let i = 0; i < Number(process.argv[2]); i++) {
+    const start = process.hrtime.bigint();
+    JSON.parse(text);
+    times.push(Number(process.hrtime.bigint() - start) / 1e6);
+}
+times.sort((a, b) => a - b);
+console.log(times[Math.floor(times.length / 2)]);
+"""
+
+
+def metric_kind(name):
+    return name.rsplit('.', 1)[-1]
+
+
+def copy_checkout(directory):
+    """Copy the checkout (build cache included) into ``directory``; returns the copy's root."""
+    root = os.path.join(directory, os.path.basename(ROOT))
+    shutil.copytree(ROOT, root, ignore=COPY_IGNORED)
+    return root
+
+
+def relocate(path, root):
+    """``path`` in the checkout mapped into the copy at ``root``."""
+    return os.path.join(root, os.path.relpath(path, ROOT))
+
+
+def run_build(language, root):
+    """
+    Run a forced single-language build in the copy at ``root``; returns
+    ``(wall seconds, peak RSS in KiB)``.
+    """
+    command = [sys.executable, os.path.join(root, 'generate_countries.py'), '--force', '--lang', language]
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=root, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+    # ru_maxrss is KiB on Linux and bytes on macOS; pool workers are not included
+    peak = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+    return elapsed, peak
+
+
+def node_available():
+    try:
+        subprocess.run(['node', '--version'], check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+def parse_time_python(path, iterations):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        json.loads(text)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def parse_time_node(path, iterations):
+    """Median ``JSON.parse`` time in V8, the closest stand-in for the browser."""
+    result = subprocess.run(['node', '-e', NODE_PARSE_SCRIPT, path, str(iterations)],
+                            check=True, capture_output=True, text=True)
+    return float(result.stdout)
+
+
+def size_metrics(prefix, payload, encodings):
+    metrics = {f'{prefix}.raw.bytes': len(payload)}
+    for encoding in encodings:
+        metrics[f'{prefix}.{encoding}.bytes'] = len(compress_bytes(payload, encoding))
+    return metrics
+
+
+def dataset_outputs(language, root):
+    """``{label: path}`` of the files the build in the copy at ``root`` emits for ``language``."""
+    outputs = {
+        'countries': countries.output_path(language),
+        'suggestions': suggestions.output_path(language),
+        'startup': startup.output_path(language),
+    }
+    manifest_path = relocate(compact.manifest_path(), root)
+    if os.path.exists(manifest_path):
+        pointers = read_json(manifest_path)
+        if pointers.get('base'):
+            outputs['base'] = os.path.join(GAME_DIR, pointers['base']['path'])
+        if language in pointers.get('names', {}):
+            outputs['names'] = os.path.join(GAME_DIR, pointers['names'][language]['path'])
+    outputs = {label: relocate(path, root) for label, path in outputs.items()}
+    return {label: path for label, path in outputs.items() if os.path.exists(path)}
+
+
+def measure_outputs(language, root, encodings, parse_iterations, use_node):
+    metrics = {}
+    for label, path in dataset_outputs(language, root).items():
+        prefix = f'output.{language}.{label}'
+        with open(path, 'rb') as f:
+            metrics.update(size_metrics(prefix, f.read(), encodings))
+        metrics[f'{prefix}.python.parse_ms'] = parse_time_python(path, parse_iterations)
+        if use_node:
+            metrics[f'{prefix}.node.parse_ms'] = parse_time_node(path, parse_iterations)
+    return metrics
+
+
+def session_files(language, data, continents, root):
+    """
+    Files the game page fetches for a selection of ``continents`` in the copy at
+    ``root``: the page, its scripts and stylesheets and the fetches weight.py knows of.
+    """
+    page_path = relocate(SESSION_PAGE, root)
+    blocking, other = weight.static_dependencies(page_path)
+    fetches = weight.PAGES[site_path(SESSION_PAGE, ROOT)]
+    fetched = [relocate(path, root) for kind in fetches['critical'] + fetches['session']
+               for path in weight.fetch_dependencies(kind, language, data, continents)]
+
+    files = []
+    for path in [page_path] + blocking + other + fetched:
+        if path not in files and os.path.exists(path):
+            files.append(path)
+    return files
+
+
+def session_metrics(language, root, encodings):
+    """
+    Bytes and requests of a game session for the default selection (every country
+    but the excluded ones) and for each single-continent selection. Every file is
+    one request and compressed on its own, as it is served.
+    """
+    data = read_json(relocate(countries.output_path(language), root))
+    selected = [c for c in data['countries'] if c['id'] not in EXCLUDED_FROM_SESSION]
+    selections = {'all': sorted({c['continent'] for c in selected})}
+    for continent in data['continents']:
+        if any(c['continent'] == continent for c in selected):
+            selections[continent] = [continent]
+
+    metrics = {}
+    for name, continents in selections.items():
+        slug = name.lower().replace(' ', '-')
+        chunks = []
+        for path in session_files(language, data, continents, root):
+            with open(path, 'rb') as f:
+                chunks.append(f.read())
+        metrics[f'session.{slug}.requests.count'] = len(chunks)
+        metrics[f'session.{slug}.raw.bytes'] = sum(len(chunk) for chunk in chunks)
+        for encoding in encodings:
+            metrics[f'session.{slug}.{encoding}.bytes'] = sum(
+                len(compress_bytes(chunk, encoding)) for chunk in chunks)
+    return metrics
+
+
+def run(languages, repeat=3, parse_iterations=50):
+    """Run every benchmark and return the flat metrics of this run."""
+    encodings = available_encodings()
+    use_node = node_available()
+    if not use_node:
+        print('⚠️  node not found, measuring parse time in Python only')
+
+    metrics = {}
+    with tempfile.TemporaryDirectory(prefix='wqc-benchmark-') as directory:
+        root = copy_checkout(directory)
+        for language in languages:
+            runs = [run_build(language, root) for _ in range(repeat)]
+            metrics[f'build.{language}.wall.time_s'] = statistics.median(elapsed for elapsed, _ in runs)
+            metrics[f'build.{language}.peak.rss_kb'] = max(peak for _, peak in runs)
+            metrics.update(measure_outputs(language, root, encodings, parse_iterations, use_node))
+        metrics.update(session_metrics(countries.FALLBACK_LANGUAGE, root, encodings))
+    return {key: round(value, 3) if isinstance(value, float) else value for key, value in metrics.items()}
+
+
+def current_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                check=True, capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def load_history(path=BENCHMARK_HISTORY):
+    return read_json(path) if os.path.exists(path) else []
+
+
+def find_regressions(metrics, baseline, thresholds=THRESHOLDS):
+    """
+    Metrics that grew more than their threshold (and ``MIN_DELTA``) relative to ``baseline``.
+    Returns ``[(name, previous, current, growth)]`` sorted by name; metrics missing
+    from either run, or of a kind without a threshold, are ignored.
+    """
+    regressions = []
+    for name in sorted(metrics.keys() & baseline.keys()):
+        limit = thresholds.get(metric_kind(name))
+        previous, current = baseline[name], metrics[name]
+        if limit is None or not previous:
+            continue
+        growth = current / previous - 1
+        if growth > limit and current - previous > MIN_DELTA.get(metric_kind(name), 0):
+            regressions.append((name, previous, current, growth))
+    return regressions
+
+
+def record(metrics, history, path=BENCHMARK_HISTORY):
+    history.append({
+        'timestamp': datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        'commit': current_commit(),
+        'python': sys.version.split()[0],
+        'encodings': list(available_encodings()),
+        'metrics': metrics
+    })
+    write_json(path, history)
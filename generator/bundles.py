@@ -0,0 +1,74 @@
+"""
+Flag bundles: the minified SVGs of each continent concatenated into one file
+
+A game session fetches the bundles of its selected continents once and cuts
+each flag out by byte range instead of requesting every flag separately.
+"""
+import os
+import re
+
+from .cache import hash_bytes, hash_file
+from .files import write_bytes
+from .modes import DEFAULT_MODE
+from .paths import ROOT, site_path
+
+STAGE = 'flag-bundles'
+
+
+def bundle_slug(continent):
+    return re.sub(r'[^a-z0-9]+', '-', continent.lower()).strip('-')
+
+
+def bundle_path(continent, mode=DEFAULT_MODE):
+    return os.path.join(mode.bundle_dir, f'{bundle_slug(continent)}.bin')
+
+
+def group_by_continent(country_table, flag_ids):
+    """Flag codes per continent, in country table order."""
+    available = set(flag_ids)
+    groups = {}
+    for code, country in country_table.items():
+        if code in available:
+            groups.setdefault(country['continent'], []).append(code)
+    return groups
+
+
+def build(manifest, country_table, flag_ids, flag_file, force=False, mode=DEFAULT_MODE):
+    """
+    Write one bundle per continent from ``flag_file(code)`` and return the index
+    ``{code: [bundle path relative to the game mode, offset, length]}``.
+    Offsets and lengths are in bytes.
+    """
+    os.makedirs(mode.bundle_dir, exist_ok=True)
+    index = {}
+    written = 0
+
+    for continent, codes in group_by_continent(country_table, flag_ids).items():
+        path = bundle_path(continent, mode)
+        sources = [flag_file(code) for code in codes]
+        digest = hash_bytes(*codes, *(hash_file(source) for source in sources))
+
+        payloads = []
+        offset = 0
+        for code, source in zip(codes, sources):
+            with open(source, 'rb') as f:
+                payload = f.read()
+            index[code] = [site_path(path, mode.game_dir), offset, len(payload)]
+            payloads.append(payload)
+            offset += len(payload)
+
+        if not force and os.path.exists(path) and manifest.is_fresh(STAGE, continent, digest):
+            continue
+        if write_bytes(path, b''.join(payloads)):
+            written += 1
+        manifest.record(STAGE, continent, digest)
+
+    # Continents that no longer have flags lose their bundle
+    expected = {os.path.basename(entry[0]) for entry in index.values()}
+    for name in os.listdir(mode.bundle_dir):
+        if name.endswith('.bin') and name not in expected:
+            os.remove(os.path.join(mode.bundle_dir, name))
+
+    print(f'Bundled {len(index)} flags into {len(expected)} files in '
+          f'{os.path.relpath(mode.bundle_dir, ROOT)} ({written} rewritten)')
+    return index
@@ -0,0 +1,131 @@
+"""
+Content-hash manifest used to skip build work whose inputs have not changed, and
+content-hashed intermediate results shared between worker processes
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+from .files import dump_json, read_json, write_bytes
+from .paths import INTERMEDIATE_DIR, MANIFEST_PATH
+
+
+def hash_bytes(*chunks):
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        digest.update(chunk)
+        # Separator so ('ab', 'c') and ('a', 'bc') hash differently
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """
+    Maps ``stage -> key -> input hash`` for the last successful build of each output.
+    A stage asks ``is_fresh`` before doing work and calls ``record`` afterwards.
+
+    A worker process gets a copy of the entries it needs (``entries``, with no
+    path) and hands ``recorded`` back for the parent to ``replay``; forgotten
+    entries are in it with a digest of None.
+    """
+
+    def __init__(self, path=MANIFEST_PATH, entries=None):
+        self.path = path
+        self.entries = {}
+        # (stage, key, digest) recorded since loading; forgotten keys have no digest
+        self.recorded = []
+        if entries is not None:
+            self.entries = entries
+        elif os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                # A corrupt manifest only costs a full rebuild
+                self.entries = {}
+
+    def is_fresh(self, stage, key, digest):
+        return self.entries.get(stage, {}).get(key) == digest
+
+    def record(self, stage, key, digest):
+        self.entries.setdefault(stage, {})[key] = digest
+        self.recorded.append((stage, key, digest))
+
+    def replay(self, recorded):
+        for stage, key, digest in recorded:
+            if digest is None:
+                self.forget(stage, key)
+            else:
+                self.record(stage, key, digest)
+
+    def scoped(self, scope):
+        return ScopedManifest(self, scope)
+
+    def subset(self, scope):
+        """Copy of the entries under ``scope``, for a worker process."""
+        prefix = f'{scope}/'
+        return BuildManifest(path=None, entries={stage: dict(keys) for stage, keys in self.entries.items()
+                                                 if stage.startswith(prefix)})
+
+    def forget(self, stage, key=None):
+        if key is None:
+            self.entries.pop(stage, None)
+        else:
+            self.entries.get(stage, {}).pop(key, None)
+        self.recorded.append((stage, key, None))
+
+    def save(self):
+        payload = json.dumps(self.entries, indent=2, sort_keys=True).encode('utf-8')
+        write_bytes(self.path, payload)
+
+
+class ScopedManifest:
+    """
+    The entries of one game mode: stages are stored as ``<scope>/<stage>`` so
+    modes that share stage names and keys (languages, country codes) stay apart.
+    """
+
+    def __init__(self, manifest, scope):
+        self.manifest = manifest
+        self.scope = scope
+
+    def is_fresh(self, stage, key, digest):
+        return self.manifest.is_fresh(f'{self.scope}/{stage}', key, digest)
+
+    def record(self, stage, key, digest):
+        self.manifest.record(f'{self.scope}/{stage}', key, digest)
+
+    def forget(self, stage, key=None):
+        self.manifest.forget(f'{self.scope}/{stage}', key)
+
+
+def store_intermediate(name, data):
+    """
+    Write ``data`` as JSON under a content-hashed name and return the path; older
+    versions of ``name`` are removed. Unchanged data keeps its path, so workers
+    that already loaded it reuse their copy.
+    """
+    payload = dump_json(data, indent=None)
+    path = os.path.join(INTERMEDIATE_DIR, f'{name}.{hash_bytes(payload)[:16]}.json')
+    write_bytes(path, payload)
+    for other in os.listdir(INTERMEDIATE_DIR):
+        if other.startswith(f'{name}.') and other != os.path.basename(path):
+            os.remove(os.path.join(INTERMEDIATE_DIR, other))
+    return path
+
+
+@lru_cache(maxsize=16)
+def load_intermediate(path):
+    """Read an intermediate once per process; treat the result as read-only."""
+    return read_json(path)
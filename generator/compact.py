@@ -0,0 +1,172 @@
+"""
+Compact datasets: one shared columnar base plus a small name overlay per language
+
+Every ``countries_<lang>.json`` carries the same ids, continents, statuses, flag
+bundle ranges and selection bitsets; only the names differ. The base holds the
+language-independent columns once (``flagPath`` becomes a single template and the
+per-continent id lists are dropped, since the client can derive both) and each
+``names_<lang>`` overlay holds the names, alternatives and answer table indexed by
+the same ordinals. Both are written under content-hashed names so they can be
+cached immutably; ``data/countries-manifest.json`` points at the current files.
+``CountriesData.merge`` in js/countriesData.js joins a base and an overlay back
+into the regular structure.
+"""
+import os
+import re
+
+from .cache import hash_bytes, hash_file
+from .countries import FLAG_PATH_TEMPLATE
+from .files import dump_json, read_json, write_bytes, write_json
+from .modes import DEFAULT_MODE
+from .paths import site_path
+
+STAGE = 'compact'
+BASE_FORMAT = 'countries-base/1'
+NAMES_FORMAT = 'countries-names/1'
+MANIFEST_NAME = 'countries-manifest.json'
+# countries_<lang>.<hash>.json were the per-language copies written before overlays
+HASHED_NAME_RE = re.compile(r'^(countries-base|names_[\w-]+|countries_[\w-]+)\.[0-9a-f]{12}\.json$')
+
+
+def manifest_path(mode=DEFAULT_MODE):
+    return os.path.join(mode.data_dir, MANIFEST_NAME)
+
+
+def index_of(values, value):
+    """Position of ``value`` in ``values``, appending it on first sight."""
+    if value not in values:
+        values.append(value)
+    return values.index(value)
+
+
+def ordinal_version(countries):
+    """Identifies the ordinal order; an overlay only fits a base with the same version."""
+    return hash_bytes(*(country['id'] for country in countries))[:12]
+
+
+def to_base(data):
+    countries = data['countries']
+    continents = list(data['continents'])
+    statuses = []
+    bundles = []
+
+    base = {
+        'format': BASE_FORMAT,
+        'version': ordinal_version(countries),
+        'continents': continents,
+        'statuses': statuses,
+        'ids': [country['id'] for country in countries],
+        'continent': [continents.index(country['continent']) for country in countries],
+        'status': [index_of(statuses, country['status']) for country in countries],
+        'flagPathTemplate': FLAG_PATH_TEMPLATE,
+    }
+
+    if all('flagBundle' in country for country in countries):
+        base['bundles'] = bundles
+        base['bundle'] = [index_of(bundles, country['flagBundle'][0]) for country in countries]
+        base['offset'] = [country['flagBundle'][1] for country in countries]
+        base['length'] = [country['flagBundle'][2] for country in countries]
+
+    if 'flagAtlas' in data:
+        base['flagAtlas'] = data['flagAtlas']
+        base['flagThumb'] = [country.get('flagThumb') for country in countries]
+
+    if any('similarFlags' in country for country in countries):
+        ordinals = {country['id']: ordinal for ordinal, country in enumerate(countries)}
+        base['similarFlags'] = [[ordinals[code] for code in country.get('similarFlags', [])]
+                                for country in countries]
+
+    if any('difficulty' in country for country in countries):
+        base['difficulty'] = [country.get('difficulty') for country in countries]
+        base['answerStats'] = [country.get('answerStats') for country in countries]
+
+    if 'selection' in data:
+        base['selection'] = data['selection']
+
+    return base
+
+
+def to_names(data):
+    countries = data['countries']
+    ordinals = {country['id']: ordinal for ordinal, country in enumerate(countries)}
+    names = {
+        'format': NAMES_FORMAT,
+        'version': ordinal_version(countries),
+        'names': [country['name'] for country in countries],
+    }
+
+    if 'answers' in data:
+        names['normalizedNames'] = [country['normalizedName'] for country in countries]
+        names['alternatives'] = {
+            country['id']: country['alternatives'] for country in countries if 'alternatives' in country
+        }
+        # Answers point at ordinals instead of repeating id strings
+        names['answers'] = {
+            answer: [ordinals[code] for code in match] if isinstance(match, list) else ordinals[match]
+            for answer, match in data['answers'].items()
+        }
+
+    return names
+
+
+def write_hashed(stem, data, mode=DEFAULT_MODE):
+    """Write ``data`` as ``<stem>.<hash>.json``; returns its manifest pointer."""
+    payload = dump_json(data, indent=None)
+    path = os.path.join(mode.data_dir, f'{stem}.{hash_bytes(payload)[:12]}.json')
+    write_bytes(path, payload)
+    return {'path': site_path(path, mode.game_dir), 'bytes': len(payload)}
+
+
+def load_pointers(mode=DEFAULT_MODE):
+    path = manifest_path(mode)
+    pointers = read_json(path) if os.path.exists(path) else {}
+    if 'names' not in pointers:
+        # Manifest from the per-language layout; everything is rewritten
+        pointers = {'base': None, 'names': {}}
+    return pointers
+
+
+def pointer_exists(pointer, mode=DEFAULT_MODE):
+    return pointer is not None and os.path.exists(os.path.join(mode.game_dir, pointer['path']))
+
+
+def build(manifest, languages, dataset_path, force=False, mode=DEFAULT_MODE):
+    """
+    Write the shared base and the name overlay of each language whose dataset
+    changed, then refresh the pointer manifest. Hashed files no longer referenced
+    are removed.
+    """
+    pointers = load_pointers(mode)
+    module_hash = hash_file(__file__)
+    base = None
+
+    for language in languages:
+        source = dataset_path(language)
+        digest = hash_bytes(module_hash, hash_file(source))
+        if (not force and pointer_exists(pointers['base'], mode)
+                and pointer_exists(pointers['names'].get(language), mode)
+                and manifest.is_fresh(STAGE, language, digest)):
+            continue
+
+        data = read_json(source)
+        language_base = to_base(data)
+        if base is None:
+            base = language_base
+            pointers['base'] = write_hashed('countries-base', base, mode)
+            print(f'Created {pointers["base"]["path"]} ({pointers["base"]["bytes"]:,} bytes)')
+        elif language_base != base:
+            print(f'⚠️  {language}: dataset disagrees with the shared base, rebuild every language')
+
+        pointers['names'][language] = write_hashed(f'names_{language}', to_names(data), mode)
+        manifest.record(STAGE, language, digest)
+        print(f'Created {pointers["names"][language]["path"]} ({pointers["names"][language]["bytes"]:,} bytes, '
+              f'full dataset {os.path.getsize(source):,} bytes)')
+
+    pointers['names'] = dict(sorted(pointers['names'].items()))
+    write_json(manifest_path(mode), pointers)
+
+    referenced = {os.path.basename(entry['path']) for entry in [pointers['base'], *pointers['names'].values()]
+                  if entry}
+    for name in os.listdir(mode.data_dir):
+        if HASHED_NAME_RE.match(name) and name not in referenced:
+            os.remove(os.path.join(mode.data_dir, name))
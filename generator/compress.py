@@ -0,0 +1,136 @@
+"""
+Precompressed variants: writes .gz and .br siblings for every data file and flag
+
+A static host can answer ``Accept-Encoding`` with the sibling bytes instead of
+compressing on each request. Brotli needs the optional ``brotli`` package; without
+it only gzip variants are produced. Siblings whose source file is gone (a renamed
+content-hashed file, a removed flag) are deleted.
+"""
+import gzip
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import hash_bytes, hash_file
+from .files import write_bytes, write_json
+from .modes import MODES
+from .paths import PRECOMPRESSED_MANIFEST, ROOT, TRANSLATIONS_DIR, site_path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STAGE = 'compress'
+ENCODINGS = ('gzip', 'br')
+SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+# (directory, extension) pairs whose files are served as-is
+SOURCES = tuple(
+    source for mode in MODES for source in ((mode.data_dir, '.json'), (mode.bundle_dir, '.bin'), (mode.min_dir, '.svg'))
+) + ((TRANSLATIONS_DIR, '.json'),)
+
+
+def available_encodings():
+    return ENCODINGS if brotli is not None else ('gzip',)
+
+
+def compress_bytes(payload, encoding):
+    if encoding == 'gzip':
+        # mtime=0 keeps the output byte-identical across runs
+        return gzip.compress(payload, compresslevel=9, mtime=0)
+    if encoding == 'br':
+        return brotli.compress(payload, quality=11)
+    raise ValueError(f'Unknown encoding: {encoding}')
+
+
+def compress_file(job):
+    """Worker entry point: ``(path, encodings)`` -> ``(path, {encoding: size})``."""
+    path, encodings = job
+    with open(path, 'rb') as f:
+        payload = f.read()
+    sizes = {'raw': len(payload)}
+    for encoding in encodings:
+        compressed = compress_bytes(payload, encoding)
+        write_bytes(path + SUFFIXES[encoding], compressed)
+        sizes[encoding] = len(compressed)
+    return path, sizes
+
+
+def collect_sources():
+    paths = []
+    for directory, extension in SOURCES:
+        if not os.path.isdir(directory):
+            continue
+        paths.extend(os.path.join(directory, name)
+                     for name in sorted(os.listdir(directory)) if name.endswith(extension))
+    return paths
+
+
+def remove_orphans(manifest):
+    """Delete siblings whose source file is gone (renamed hashed files, removed flags)."""
+    removed = 0
+    for directory, extension in SOURCES:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            source = next((name[:-len(suffix)] for suffix in SUFFIXES.values()
+                           if name.endswith(extension + suffix)), None)
+            if source is not None and not os.path.exists(os.path.join(directory, source)):
+                os.remove(os.path.join(directory, name))
+                manifest.forget(STAGE, site_path(os.path.join(directory, source), ROOT))
+                removed += 1
+    return removed
+
+
+def recorded_sizes(path, encodings):
+    sizes = {'raw': os.path.getsize(path)}
+    for encoding in encodings:
+        sizes[encoding] = os.path.getsize(path + SUFFIXES[encoding])
+    return sizes
+
+
+def build(manifest, workers=None, force=False):
+    """
+    Compress every served data file and flag whose content changed and write the
+    size manifest. Returns the manifest entries keyed by site path.
+    """
+    encodings = available_encodings()
+    if brotli is None:
+        print('⚠️  brotli is not installed, writing gzip variants only')
+
+    module_hash = hash_file(__file__)
+    entries = {}
+    jobs = []
+    digests = {}
+
+    for path in collect_sources():
+        key = site_path(path, ROOT)
+        digest = hash_bytes(module_hash, ','.join(encodings), hash_file(path))
+        digests[path] = (key, digest)
+        siblings_exist = all(os.path.exists(path + SUFFIXES[e]) for e in encodings)
+        if not force and siblings_exist and manifest.is_fresh(STAGE, key, digest):
+            entries[key] = recorded_sizes(path, encodings)
+        else:
+            jobs.append((path, encodings))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for path, sizes in pool.map(compress_file, jobs, chunksize=8):
+                key, digest = digests[path]
+                entries[key] = sizes
+                manifest.record(STAGE, key, digest)
+
+    removed = remove_orphans(manifest)
+    entries = dict(sorted(entries.items()))
+    totals = {field: sum(sizes[field] for sizes in entries.values()) for field in ('raw',) + encodings}
+    write_json(PRECOMPRESSED_MANIFEST, {
+        'encodings': list(encodings),
+        'totals': totals,
+        'files': entries
+    })
+
+    print(f'Compressed {len(jobs)} of {len(entries)} files '
+          f'({", ".join(f"{field} {size:,}" for field, size in totals.items())} bytes)')
+    if removed:
+        print(f'Removed {removed} orphaned compressed files')
+    return entries
@@ -0,0 +1,155 @@
+"""
+Country dataset build: one structural table, one name table per language and game mode
+"""
+import json
+import os
+
+from .cache import hash_bytes, hash_file
+from .files import read_json, write_json
+from .modes import DEFAULT_MODE
+from .paths import COUNTRY_TABLE, FLAG_DIR, ROOT
+
+STAGE = 'countries'
+STATUSES = ('official', 'territory', 'observer', 'disputed')
+FALLBACK_LANGUAGE = 'en'
+FLAG_PATH_TEMPLATE = 'assets/flags/min/{id}.svg'
+
+
+def load_country_table():
+    """Structural fields (continent, status) keyed by ISO alpha-3 code."""
+    return read_json(COUNTRY_TABLE)
+
+
+def available_languages(mode=DEFAULT_MODE):
+    """Every language with a name table, e.g. ``['en', 'no']``."""
+    names_dir = mode.table('names')
+    return sorted(f[:-len('.json')] for f in os.listdir(names_dir) if f.endswith('.json'))
+
+
+def names_path(language, mode=DEFAULT_MODE):
+    return os.path.join(mode.table('names'), f'{language}.json')
+
+
+def load_names(language, mode=DEFAULT_MODE):
+    return read_json(names_path(language, mode))
+
+
+def scan_flags(flag_dir=FLAG_DIR):
+    """Country codes that have an SVG flag, sorted for stable output."""
+    return sorted(f[:-len('.svg')] for f in os.listdir(flag_dir) if f.endswith('.svg'))
+
+
+def output_path(language, mode=DEFAULT_MODE):
+    return os.path.join(mode.data_dir, f'countries_{language}.json')
+
+
+def flag_path(code):
+    return FLAG_PATH_TEMPLATE.format(id=code)
+
+
+def ordered_codes(country_table, flag_ids):
+    """Dataset order: country table order, limited to codes with a flag file."""
+    available = set(flag_ids)
+    return [code for code in country_table if code in available]
+
+
+def build_dataset(language, country_table, flag_ids, names, fallback_names=None,
+                  country_fields=None, extra_fields=None):
+    """
+    Assemble the ``countries_<lang>.json`` structure.
+    Countries follow the table order; only codes with a flag file are included.
+    ``country_fields`` maps a code to extra keys for that country (e.g. ``flagBundle``)
+    and ``extra_fields`` adds top-level keys produced by other build stages.
+    """
+    continents = {}
+    countries = []
+    untranslated = []
+
+    for code in ordered_codes(country_table, flag_ids):
+        country = country_table[code]
+        name = names.get(code)
+        if name is None:
+            untranslated.append(code)
+            name = (fallback_names or {}).get(code, code)
+
+        entry = {
+            'id': code,
+            'name': name,
+            'continent': country['continent'],
+            'flagPath': flag_path(code),
+            'status': country['status']
+        }
+        entry.update((country_fields or {}).get(code, {}))
+        countries.append(entry)
+        continents.setdefault(country['continent'], []).append(code)
+
+    if untranslated:
+        print(f'⚠️  {language}: no name for {untranslated}, using {FALLBACK_LANGUAGE}')
+
+    data = {
+        'continents': continents,
+        'countries': countries
+    }
+    data.update(extra_fields or {})
+    return data
+
+
+def input_digest(language, flag_ids, country_fields=None, extra_fields=None, enrichers=(), mode=DEFAULT_MODE):
+    """Hash of everything a language's dataset is derived from."""
+    return hash_bytes(
+        hash_file(__file__),
+        hash_file(COUNTRY_TABLE),
+        hash_file(names_path(language, mode)),
+        hash_file(names_path(FALLBACK_LANGUAGE, mode)),
+        ','.join(flag_ids),
+        json.dumps([country_fields, extra_fields], sort_keys=True),
+        *(enricher.input_digest(language, mode) for enricher in enrichers)
+    )
+
+
+def print_summary(path, data):
+    countries = data['countries']
+    counts = {status: sum(1 for c in countries if c['status'] == status) for status in STATUSES}
+
+    print(f'Created {os.path.relpath(path, ROOT)} with {len(countries)} countries across {len(data["continents"])} continents')
+    print(f'  Official UN members: {counts["official"]}')
+    print(f'  Territories: {counts["territory"]}')
+    print(f'  UN observers: {counts["observer"]}')
+    print(f'  Disputed territories: {counts["disputed"]}')
+
+
+def build(manifest, country_table, flag_ids, country_fields=None, extra_fields=None,
+          enrichers=(), languages=None, force=False, mode=DEFAULT_MODE):
+    """
+    Write ``countries_<lang>.json`` for each requested language.
+    ``country_fields`` and ``extra_fields`` are passed through to ``build_dataset``.
+    Each of ``enrichers`` is a module with ``input_digest(language, mode)`` and
+    ``enrich(language, data, mode)`` that adds language-specific fields before writing.
+    Languages whose inputs hash the same as last build (and whose output exists) are skipped.
+    Returns the list of languages that were rebuilt.
+    """
+    languages = languages or available_languages(mode)
+    fallback_names = load_names(FALLBACK_LANGUAGE, mode)
+
+    missing = sorted(set(flag_ids) - set(country_table))
+    if missing:
+        print(f'⚠️  Missing countries for these flag codes: {missing[:10]}...')
+
+    rebuilt = []
+    for language in languages:
+        path = output_path(language, mode)
+        digest = input_digest(language, flag_ids, country_fields, extra_fields, enrichers, mode)
+        if not force and os.path.exists(path) and manifest.is_fresh(STAGE, language, digest):
+            print(f'{language}: up to date')
+            continue
+
+        data = build_dataset(language, country_table, flag_ids, load_names(language, mode), fallback_names,
+                             country_fields, extra_fields)
+        for enricher in enrichers:
+            enricher.enrich(language, data, mode)
+        write_json(path, data)
+        manifest.record(STAGE, language, digest)
+        print_summary(path, data)
+        rebuilt.append(language)
+
+    return rebuilt
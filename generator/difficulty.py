@@ -0,0 +1,267 @@
+"""
+Per-flag difficulty aggregated from exported game results
+
+Sessions are JSONL records as saved by ``endGame`` in js/game.js; their
+``questions`` list holds ``[country id, try]`` pairs where ``try`` is the attempt
+that was answered correctly (1-3) or 0 when the question was failed. A third-try
+answer comes after the game has shown the solution, so it counts as a fail, as on
+the results page. Lines and question entries that do not have this shape are
+counted as skipped. Files are read line by line in byte ranges, one range per worker
+process, and outcomes are added to per-country counters a batch at a time (with
+``numpy.bincount`` when NumPy is installed).
+
+The resulting table (generator/tables/difficulty.json) is picked up by the build,
+which adds ``difficulty`` and ``answerStats`` to every country in the datasets.
+``self_check`` aggregates fixed sessions into a known table.
+"""
+import gzip
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from .files import read_json, write_json
+from .paths import DIFFICULTY_TABLE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+OUTCOMES = ('firstTry', 'secondTry', 'fail')
+# Outcome index for each recorded try value
+OUTCOME_OF_TRY = {1: 0, 2: 1, 3: 2, 0: 2}
+# Contribution of each outcome to the difficulty score (0 = always known, 1 = always failed)
+OUTCOME_WEIGHTS = (0.0, 0.5, 1.0)
+# Plays of the global average mixed into every flag, so rarely played flags stay near it
+PRIOR_PLAYS = 20
+
+BATCH_QUESTIONS = 1 << 18
+RANGE_BYTES = 32 << 20
+
+# Fixture sessions for ``self_check``: a third try counts as a fail, XXX is unknown,
+# and a malformed line, a record without outcomes and four malformed questions are skipped
+SELF_CHECK_IDS = ['FRA', 'DEU', 'ITA']
+SELF_CHECK_LINES = [
+    '{"questions": [["FRA", 1], ["DEU", 2], ["FRA", 0]]}',
+    '{"questions": [["DEU", 3], ["XXX", 1]]}',
+    '{"questions": ',
+    '{"score": 40}',
+    '',
+    '{"questions": [["FRA", 2]]}',
+    '{"questions": [["DEU"], ["FRA", [1]], ["ITA", "1"], "ITA"]}',
+]
+# Expected table: 5 plays weighing 0 + 0.5 + 1 + 1 + 0.5 = 3, an average of 0.6;
+# FRA weighs 1.5 over 3 plays and DEU 1.5 over 2, so DEU ranks harder; ITA is unplayed
+SELF_CHECK_TABLE = {
+    'sessions': 4,
+    'plays': 5,
+    'averageDifficulty': 0.6,
+    'countries': {
+        'FRA': {'plays': 3, 'firstTry': 0.3333, 'secondTry': 0.3333, 'fail': 0.3333, 'difficulty': 0.587},
+        'DEU': {'plays': 2, 'firstTry': 0.0, 'secondTry': 0.5, 'fail': 0.5, 'difficulty': 0.6136},
+    }
+}
+
+
+class Counters:
+    """Play counts per outcome and country ordinal, filled in batches."""
+
+    def __init__(self, size):
+        self.size = size
+        self.counts = [[0] * size for _ in OUTCOMES]
+        self.ordinals = []
+        self.outcomes = []
+
+    def add(self, ordinal, outcome):
+        self.ordinals.append(ordinal)
+        self.outcomes.append(outcome)
+        if len(self.ordinals) >= BATCH_QUESTIONS:
+            self.flush()
+
+    def flush(self):
+        if not self.ordinals:
+            return
+        if numpy is not None:
+            keys = numpy.asarray(self.outcomes, dtype=numpy.int64) * self.size + numpy.asarray(self.ordinals)
+            batch = numpy.bincount(keys, minlength=len(OUTCOMES) * self.size).reshape(len(OUTCOMES), self.size)
+            for outcome, row in enumerate(batch.tolist()):
+                counts = self.counts[outcome]
+                for ordinal, value in enumerate(row):
+                    counts[ordinal] += value
+        else:
+            for ordinal, outcome in zip(self.ordinals, self.outcomes):
+                self.counts[outcome][ordinal] += 1
+        self.ordinals = []
+        self.outcomes = []
+
+
+def split_ranges(path, range_bytes=RANGE_BYTES):
+    """Byte ranges of about ``range_bytes`` covering ``path``, each starting at a line."""
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, 'rb') as f:
+        while start < size:
+            f.seek(min(start + range_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_lines(path, start, end):
+    if path.endswith('.gz'):
+        # Compressed input cannot be split; it is always a single range
+        with gzip.open(path, 'rb') as f:
+            yield from f
+        return
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            yield line
+
+
+def is_question(entry):
+    """Whether a ``questions`` entry is a ``[country id, try]`` pair."""
+    return (isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str)
+            and type(entry[1]) is int)
+
+
+def aggregate_range(job):
+    """
+    Worker entry point: ``(path, start, end, ids)`` -> ``(counts, sessions, skipped,
+    unknown)``, where ``skipped`` counts malformed lines and question entries.
+    """
+    path, start, end, ids = job
+    ordinals = {code: ordinal for ordinal, code in enumerate(ids)}
+    counters = Counters(len(ids))
+    sessions = skipped = unknown = 0
+
+    for line in read_lines(path, start, end):
+        if not line.strip():
+            continue
+        try:
+            questions = json.loads(line).get('questions')
+        except (ValueError, AttributeError):
+            questions = None
+        if not isinstance(questions, list):
+            # Malformed, or saved before per-question outcomes were recorded
+            skipped += 1
+            continue
+
+        sessions += 1
+        for entry in questions:
+            if not is_question(entry):
+                skipped += 1
+                continue
+            code, tries = entry
+            ordinal = ordinals.get(code)
+            outcome = OUTCOME_OF_TRY.get(tries)
+            if ordinal is None or outcome is None:
+                unknown += 1
+            else:
+                counters.add(ordinal, outcome)
+
+    counters.flush()
+    return counters.counts, sessions, skipped, unknown
+
+
+def aggregate(paths, ids, workers=None):
+    """Sum the outcomes in ``paths`` per country; returns ``(counts, sessions, skipped, unknown)``."""
+    jobs = []
+    for path in paths:
+        ranges = [(0, None)] if path.endswith('.gz') else split_ranges(path)
+        jobs.extend((path, start, end, ids) for start, end in ranges)
+
+    counts = [[0] * len(ids) for _ in OUTCOMES]
+    sessions = skipped = unknown = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part, part_sessions, part_skipped, part_unknown in pool.map(aggregate_range, jobs):
+            for total, row in zip(counts, part):
+                for ordinal, value in enumerate(row):
+                    total[ordinal] += value
+            sessions += part_sessions
+            skipped += part_skipped
+            unknown += part_unknown
+    return counts, sessions, skipped, unknown
+
+
+def build_table(ids, counts, sessions):
+    """
+    Rates per outcome and a difficulty score per flag id. The score is the mean
+    outcome weight, smoothed toward the average over all flags with
+    ``PRIOR_PLAYS`` virtual plays. Flags never played are left out.
+    """
+    plays = [sum(column) for column in zip(*counts)]
+    total_plays = sum(plays)
+    total_weight = sum(weight * sum(row) for weight, row in zip(OUTCOME_WEIGHTS, counts))
+    average = total_weight / total_plays if total_plays else 0.0
+
+    countries = {}
+    for ordinal, code in enumerate(ids):
+        if not plays[ordinal]:
+            continue
+        weight = sum(w * counts[outcome][ordinal] for outcome, w in enumerate(OUTCOME_WEIGHTS))
+        entry = {'plays': plays[ordinal]}
+        entry.update((name, round(counts[outcome][ordinal] / plays[ordinal], 4))
+                     for outcome, name in enumerate(OUTCOMES))
+        entry['difficulty'] = round((weight + PRIOR_PLAYS * average) / (plays[ordinal] + PRIOR_PLAYS), 4)
+        countries[code] = entry
+
+    return {'sessions': sessions, 'plays': total_plays, 'averageDifficulty': round(average, 4),
+            'countries': countries}
+
+
+def write_table(table, path=DIFFICULTY_TABLE):
+    return write_json(path, table)
+
+
+def load_fields(path=DIFFICULTY_TABLE):
+    """``{code: {'difficulty', 'answerStats'}}`` for the dataset build; empty without a table."""
+    if not os.path.exists(path):
+        return {}
+    fields = {}
+    for code, entry in read_json(path)['countries'].items():
+        fields[code] = {
+            'difficulty': entry['difficulty'],
+            'answerStats': {name: entry[name] for name in ('plays',) + OUTCOMES}
+        }
+    return fields
+
+
+def self_check():
+    """Aggregate the fixture sessions, whole and in small ranges; returns failure messages."""
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.jsonl')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(SELF_CHECK_LINES) + '\n')
+
+        with open(path, 'rb') as f:
+            lines = f.readlines()
+        ranges = split_ranges(path, range_bytes=16)
+        if [line for start, end in ranges for line in read_lines(path, start, end)] != lines:
+            failures.append('difficulty: byte ranges do not split the file into its lines')
+
+        counts = [[0] * len(SELF_CHECK_IDS) for _ in OUTCOMES]
+        sessions = skipped = unknown = 0
+        for start, end in ranges:
+            part, part_sessions, part_skipped, part_unknown = aggregate_range((path, start, end, SELF_CHECK_IDS))
+            for total, row in zip(counts, part):
+                for ordinal, value in enumerate(row):
+                    total[ordinal] += value
+            sessions += part_sessions
+            skipped += part_skipped
+            unknown += part_unknown
+
+    if (skipped, unknown) != (6, 1):
+        failures.append(f'difficulty: skipped {skipped} lines or questions and ignored {unknown}, expected 6 and 1')
+    table = build_table(SELF_CHECK_IDS, counts, sessions)
+    if table != SELF_CHECK_TABLE:
+        failures.append(f'difficulty: fixture table is {json.dumps(table)}, expected {json.dumps(SELF_CHECK_TABLE)}')
+    return failures
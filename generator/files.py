@@ -0,0 +1,43 @@
+"""
+Small file helpers that keep build output deterministic
+"""
+import json
+import os
+
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data, indent=2):
+    """Serialize ``data`` the way every generated JSON file is written."""
+    if indent is None:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=indent, ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def write_bytes(path, payload):
+    """
+    Write ``payload`` to ``path`` unless the file already holds exactly those bytes.
+    Returns True when the file was (re)written.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_json(path, data, indent=2):
+    return write_bytes(path, dump_json(data, indent))
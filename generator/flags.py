@@ -0,0 +1,321 @@
+"""
+Flag SVG optimizer: minifies every flag of a game mode's asset directory into assets/flags/min
+
+The transform keeps the rendering identical: comments, metadata and editor
+namespaces are dropped, unreferenced ids removed, attribute-only groups folded
+into their single child and coordinates rounded to a fixed number of decimals.
+Serialization is hand-rolled so the same input always yields the same bytes.
+"""
+import os
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import hash_bytes, hash_file
+from .files import write_bytes, write_json
+from .modes import DEFAULT_MODE
+from .paths import ROOT
+
+STAGE = 'flags-min'
+DEFAULT_PRECISION = 3
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+XML_NS = 'http://www.w3.org/XML/1998/namespace'
+PREFIXES = {SVG_NS: '', XLINK_NS: 'xlink', XML_NS: 'xml'}
+
+# Elements whose content never affects rendering
+DROPPED_TAGS = {'metadata', 'desc'}
+
+# Attributes holding plain coordinates or lengths; transforms keep their precision
+# because a rounded scale factor visibly moves everything beneath it
+COORDINATE_ATTRS = {
+    'd', 'points', 'x', 'y', 'x1', 'y1', 'x2', 'y2', 'cx', 'cy', 'r', 'rx', 'ry',
+    'fx', 'fy', 'width', 'height', 'stroke-width'
+}
+
+# Presentation attributes a lone-child group can hand down without changing the result
+FOLDABLE_ATTRS = {
+    'fill', 'fill-rule', 'fill-opacity', 'stroke', 'stroke-width', 'stroke-linecap',
+    'stroke-linejoin', 'stroke-miterlimit', 'stroke-opacity', 'transform'
+}
+
+NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+# Positions of the large-arc and sweep flags among an arc's seven arguments
+ARC_FLAG_ARGUMENTS = (3, 4)
+REFERENCE_RE = re.compile(r'#([^\s)"\']+)')
+
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def namespace(tag):
+    return tag[1:].split('}', 1)[0] if tag.startswith('{') else None
+
+
+def format_number(value, precision):
+    text = f'{round(value, precision):.{precision}f}'.rstrip('0').rstrip('.')
+    if text in ('-0', ''):
+        return '0'
+    if text.startswith('0.'):
+        return text[1:]
+    if text.startswith('-0.'):
+        return '-' + text[2:]
+    return text
+
+
+def path_numbers(value):
+    """
+    ``(start, end, is_flag)`` of every number in path data. The large-arc and sweep
+    flags of an arc are single digits that may run into what follows (``01 5``).
+    """
+    position = 0
+    command = None
+    argument = 0
+    while position < len(value):
+        char = value[position]
+        if char.isalpha():
+            command = char
+            argument = 0
+            position += 1
+        elif command in ('A', 'a') and argument % 7 in ARC_FLAG_ARGUMENTS and char in '01':
+            yield position, position + 1, True
+            argument += 1
+            position += 1
+        else:
+            match = NUMBER_RE.match(value, position)
+            if match:
+                yield position, match.end(), False
+                argument += 1
+                position = match.end()
+            else:
+                position += 1
+
+
+def round_numbers(value, precision, path=False):
+    """
+    Round every number in an attribute value (path data with ``path``, whose arc
+    flags are kept as they are). Where two numbers touch, a separator is added if
+    rounding would merge them: ``1.04.5`` becomes ``1 .5`` rather than ``1.5`` and
+    ``5-0.0001`` becomes ``5 0`` rather than ``50``.
+    """
+    if path:
+        spans = path_numbers(value)
+    else:
+        spans = ((match.start(), match.end(), False) for match in NUMBER_RE.finditer(value))
+
+    out = []
+    last = 0
+    previous = None
+    previous_flag = False
+    for start, end, is_flag in spans:
+        text = value[start:end]
+        number = text if is_flag else format_number(float(text), precision)
+        if start == last and previous is not None:
+            lost_point = (number.startswith('.') and not previous_flag
+                          and '.' not in previous and 'e' not in previous)
+            lost_sign = text.startswith('-') and not number.startswith('-')
+            if lost_point or lost_sign:
+                out.append(' ')
+        out.append(value[last:start])
+        out.append(number)
+        previous = number
+        previous_flag = is_flag
+        last = end
+    out.append(value[last:])
+    return ''.join(out)
+
+
+def referenced_ids(root):
+    refs = set()
+    for element in root.iter():
+        for value in element.attrib.values():
+            if '#' in value:
+                refs.update(REFERENCE_RE.findall(value))
+        if local_name(element.tag) == 'style' and element.text:
+            refs.update(REFERENCE_RE.findall(element.text))
+    return refs
+
+
+def clean(element, refs, precision, preserve_space=False):
+    """Apply the attribute and whitespace rules to ``element`` and its subtree in place."""
+    preserve_space = element.get(f'{{{XML_NS}}}space', 'preserve' if preserve_space else None) == 'preserve'
+
+    for key in list(element.attrib):
+        ns = namespace(key)
+        if ns is not None and ns not in PREFIXES:
+            del element.attrib[key]
+        elif key == 'id' and element.attrib[key] not in refs:
+            del element.attrib[key]
+        elif key in COORDINATE_ATTRS:
+            element.attrib[key] = round_numbers(element.attrib[key], precision, path=key == 'd')
+
+    for child in list(element):
+        ns = namespace(child.tag)
+        if (ns is not None and ns not in PREFIXES) or local_name(child.tag) in DROPPED_TAGS:
+            element.remove(child)
+            continue
+        clean(child, refs, precision, preserve_space)
+        if not preserve_space and child.tail is not None and not child.tail.strip():
+            child.tail = None
+
+    if not preserve_space and element.text is not None and not element.text.strip():
+        element.text = None
+
+
+def collapse_groups(element):
+    """Fold redundant ``<g>`` wrappers into their parent or their only child."""
+    index = 0
+    while index < len(element):
+        child = element[index]
+        collapse_groups(child)
+
+        if local_name(child.tag) == 'g' and not child.text:
+            if not child.attrib:
+                # A bare group is pure nesting
+                element[index:index + 1] = list(child)
+                continue
+            if len(child) == 1 and set(child.attrib) <= FOLDABLE_ATTRS:
+                only = child[0]
+                if not (set(child.attrib) & set(only.attrib)):
+                    only.attrib.update(child.attrib)
+                    only.tail = child.tail
+                    element[index] = only
+                    continue
+        index += 1
+
+    # Strip an empty <defs/> left behind by the passes above
+    for child in list(element):
+        if local_name(child.tag) == 'defs' and len(child) == 0 and not child.text:
+            element.remove(child)
+
+
+def escape(text, quote=False):
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    if quote:
+        text = text.replace('"', '&quot;')
+    return text
+
+
+def qualified(name):
+    ns = namespace(name)
+    if ns is None:
+        return name
+    prefix = PREFIXES[ns]
+    return f'{prefix}:{local_name(name)}' if prefix else local_name(name)
+
+
+def used_namespaces(root):
+    found = set()
+    for element in root.iter():
+        found.add(namespace(element.tag))
+        found.update(namespace(key) for key in element.attrib)
+    return found
+
+
+def serialize(element, out, declarations=''):
+    out.append(f'<{qualified(element.tag)}{declarations}')
+    for key, value in element.attrib.items():
+        out.append(f' {qualified(key)}="{escape(value, quote=True)}"')
+    if len(element) == 0 and not element.text:
+        out.append('/>')
+    else:
+        out.append('>')
+        if element.text:
+            out.append(escape(element.text))
+        for child in element:
+            serialize(child, out)
+            if child.tail:
+                out.append(escape(child.tail))
+        out.append(f'</{qualified(element.tag)}>')
+
+
+def serialize_document(root):
+    """Serialize a whole SVG tree, declaring only the namespaces it uses."""
+    namespaces = used_namespaces(root)
+    declarations = f' xmlns="{SVG_NS}"'
+    if XLINK_NS in namespaces:
+        declarations += f' xmlns:xlink="{XLINK_NS}"'
+
+    out = []
+    serialize(root, out, declarations)
+    return ''.join(out).encode('utf-8')
+
+
+def optimize_svg(source, precision=DEFAULT_PRECISION):
+    """Return the minified bytes for one SVG document."""
+    root = ET.fromstring(source)
+    clean(root, referenced_ids(root), precision)
+    collapse_groups(root)
+    return serialize_document(root)
+
+
+def optimize_file(job):
+    """Worker entry point: ``(code, source_path, output_path, precision)``."""
+    code, source_path, output_path, precision = job
+    with open(source_path, 'rb') as f:
+        source = f.read()
+    optimized = optimize_svg(source, precision)
+    changed = write_bytes(output_path, optimized)
+    return code, len(source), len(optimized), changed
+
+
+def min_path(code, mode=DEFAULT_MODE):
+    return os.path.join(mode.min_dir, f'{code}.svg')
+
+
+def build(manifest, precision=DEFAULT_PRECISION, workers=None, force=False, mode=DEFAULT_MODE):
+    """
+    Optimize every flag that changed since the last run and write the size report.
+    Returns the codes whose optimized file was rewritten.
+    """
+    module_hash = hash_file(__file__)
+    jobs = []
+    digests = {}
+    report = {}
+
+    for name in sorted(os.listdir(mode.asset_dir)):
+        if not name.endswith('.svg'):
+            continue
+        code = name[:-len('.svg')]
+        source_path = os.path.join(mode.asset_dir, name)
+        output_path = min_path(code, mode)
+        digest = hash_bytes(module_hash, str(precision), hash_file(source_path))
+        digests[code] = digest
+
+        if not force and os.path.exists(output_path) and manifest.is_fresh(STAGE, code, digest):
+            report[code] = {'before': os.path.getsize(source_path), 'after': os.path.getsize(output_path)}
+        else:
+            jobs.append((code, source_path, output_path, precision))
+
+    os.makedirs(mode.min_dir, exist_ok=True)
+    rewritten = []
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for code, before, after, changed in pool.map(optimize_file, jobs, chunksize=8):
+                report[code] = {'before': before, 'after': after}
+                manifest.record(STAGE, code, digests[code])
+                if changed:
+                    rewritten.append(code)
+
+    # Flags removed from the source directory lose their optimized copy too
+    for name in os.listdir(mode.min_dir):
+        if name.endswith('.svg') and name[:-len('.svg')] not in digests:
+            os.remove(os.path.join(mode.min_dir, name))
+            manifest.forget(STAGE, name[:-len('.svg')])
+
+    before = sum(entry['before'] for entry in report.values())
+    after = sum(entry['after'] for entry in report.values())
+    write_json(os.path.join(mode.reports_dir, 'flags-min.json'), {
+        'precision': precision,
+        'totalBefore': before,
+        'totalAfter': after,
+        'files': dict(sorted(report.items()))
+    })
+
+    print(f'Optimized {len(jobs)} of {len(report)} flags into {os.path.relpath(mode.min_dir, ROOT)} '
+          f'({len(rewritten)} rewritten)')
+    if before:
+        print(f'  {before:,} -> {after:,} bytes ({100 - after * 100 / before:.1f}% smaller)')
+    return rewritten
@@ -0,0 +1,327 @@
+"""
+Batch answer grading: replay logged answers under two versions of the matching rules
+
+``Rules.grade`` mirrors ``GameLogic.validateAnswer`` in js/gameLogic.js: an answer
+is correct when its normalized form is the country's name or one of its
+alternatives (``getCountryAlternatives``), or when ``checkPartialMatch`` accepts
+it. A rule version is a set of options over those steps, either one of
+``RULE_VERSIONS`` or a JSON file of overrides on top of ``current``; an
+``alternativesDir`` in the overrides replaces the alternative-name tables.
+
+Logs are JSONL with one ``{"answer", "id", "language"}`` object per line (.gz
+allowed), split into line-aligned byte ranges across a process pool. Each worker
+indexes the generated datasets once per language and caches normalized answers
+and verdicts, since players type the same answers over and over. Only pairs
+whose verdict differs between the versions are kept in the report.
+
+``self_check`` grades fixed answers with known verdicts, in Python and, when node
+is installed, with js/gameLogic.js itself, so the two cannot drift apart unnoticed.
+"""
+import json
+import os
+import shutil
+import subprocess
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .answers import build_answer_table, normalize
+from .countries import FALLBACK_LANGUAGE, output_path
+from .difficulty import read_lines, split_ranges
+from .files import read_json
+from .paths import GAME_DIR
+
+# Options of the rules as shipped; keep in sync with GameLogic.checkPartialMatch
+CURRENT_RULES = {
+    'alternatives': True,
+    # Substring matches need an answer at least this long
+    'minSubstringLength': 3,
+    # Answers or names this short must match exactly
+    'exactMatchLength': 3,
+    'ignoreWords': ['the', 'of', 'and', 'in', 'on', 'at', 'to', 'for', 'is'],
+    # Words must be longer than this to count in the word comparison
+    'minWordLength': 1,
+    'wordMatchRatio': 0.8,
+    'partialMatch': True
+}
+
+RULE_VERSIONS = {
+    'current': CURRENT_RULES,
+    # Names and alternatives only, no fuzzy matching
+    'exact': dict(CURRENT_RULES, partialMatch=False)
+}
+
+CACHE_SIZE = 1 << 18
+
+GAME_LOGIC_SCRIPT = os.path.join(GAME_DIR, 'js', 'gameLogic.js')
+
+# Fixture countries and answers for ``self_check``: (answer, id, verdict under current, under exact)
+SELF_CHECK_COUNTRIES = [
+    {'id': 'USA', 'name': 'United States', 'alternatives': ['USA', 'United States of America', 'America']},
+    {'id': 'GBR', 'name': 'United Kingdom', 'alternatives': ['UK', 'Great Britain', 'Britain']},
+    {'id': 'COD', 'name': 'Democratic Republic of the Congo', 'alternatives': ['DR Congo', 'Congo-Kinshasa']},
+    {'id': 'COG', 'name': 'Republic of the Congo', 'alternatives': ['Congo-Brazzaville']},
+    {'id': 'CIV', 'name': "Côte d'Ivoire", 'alternatives': ['Ivory Coast']},
+    {'id': 'CUB', 'name': 'Cuba'},
+    {'id': 'TGO', 'name': 'Togo'},
+]
+SELF_CHECK_ANSWERS = [
+    ('United States', 'USA', True, True),
+    ('  united   STATES ', 'USA', True, True),
+    ('U.S.A.', 'USA', True, True),
+    ('America', 'USA', True, True),
+    ('states', 'USA', True, False),
+    ('un', 'GBR', False, False),
+    ('uni', 'GBR', True, False),
+    ('kingdom united', 'GBR', True, False),
+    ('Great', 'GBR', False, False),
+    ('Britain', 'GBR', True, True),
+    ('DR Congo', 'COD', True, True),
+    ('Congo', 'COD', True, False),
+    ('Congo', 'COG', True, False),
+    ('Republic of Congo', 'COG', True, False),
+    ('Congo Kinshasa', 'COG', False, False),
+    ("Cote d'Ivoire", 'CIV', True, True),
+    ('cote divoire', 'CIV', False, False),
+    ('ivory coast', 'CIV', True, True),
+    ('cub', 'CUB', True, False),
+    ('Kuba', 'CUB', False, False),
+    ('Cuba', 'TGO', False, False),
+]
+
+# Grades the fixture answers with GameLogic.validateAnswer, without and with the answer table
+NODE_GRADE_SCRIPT = """
+const fs = require('fs');
+global.window = {};
+(0, eval)(fs.readFileSync(process.argv[1], 'utf8'));
+const {countries, answers, table} = JSON.parse(fs.readFileSync(0, 'utf8'));
+const byId = Object.fromEntries(countries.map(country => [country.id, country]));
+const verdicts = [null, table].map(answerTable => {
+    window.GameLogic.setAnswerTable(answerTable);
+    return answers.map(([answer, id]) => window.GameLogic.validateAnswer(answer, byId[id]));
+});
+process.stdout.write(JSON.stringify(verdicts));
+"""
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_cached(text):
+    return normalize(text)
+
+
+def load_rules(spec):
+    """Options for a version name from ``RULE_VERSIONS`` or a JSON overrides file."""
+    if spec in RULE_VERSIONS:
+        return dict(RULE_VERSIONS[spec])
+    if os.path.exists(spec):
+        overrides = read_json(spec)
+        unknown = sorted(set(overrides) - set(CURRENT_RULES) - {'alternativesDir'})
+        if unknown:
+            raise ValueError(f'{spec}: unknown rule options {unknown}')
+        return dict(CURRENT_RULES, **overrides)
+    raise ValueError(f'Unknown rule version {spec!r} (expected one of {sorted(RULE_VERSIONS)} or a JSON file)')
+
+
+class Rules:
+    """One rule version applied to one language's dataset."""
+
+    def __init__(self, options, language, data=None):
+        """``data`` defaults to the generated dataset of ``language``."""
+        self.options = options
+        self.ignore_words = frozenset(options['ignoreWords'])
+        if data is None:
+            data = read_json(output_path(language))
+
+        alternatives = None
+        if options.get('alternativesDir'):
+            path = os.path.join(options['alternativesDir'], f'{language}.json')
+            alternatives = read_json(path) if os.path.exists(path) else {}
+
+        self.names = {}
+        # Normalized accepted answer -> ids, like the dataset's answers table
+        self.index = {}
+        for country in data['countries']:
+            code = country['id']
+            self.names[code] = country.get('normalizedName') or normalize(country['name'])
+            accepted = [country['name']]
+            if options['alternatives']:
+                accepted += country.get('alternatives', []) if alternatives is None else alternatives.get(code, [])
+            for answer in accepted:
+                self.index.setdefault(normalize_cached(answer), set()).add(code)
+        self.verdicts = {}
+
+    def grade(self, answer, code):
+        """True/False like ``validateAnswer``; None for an id not in the dataset."""
+        name = self.names.get(code)
+        if name is None:
+            return None
+        normalized = normalize_cached(answer)
+        key = (normalized, code)
+        verdict = self.verdicts.get(key)
+        if verdict is None:
+            verdict = code in self.index.get(normalized, ()) or (
+                self.options['partialMatch'] and self.partial_match(normalized, name))
+            if len(self.verdicts) >= CACHE_SIZE:
+                self.verdicts.clear()
+            self.verdicts[key] = verdict
+        return verdict
+
+    def partial_match(self, answer, correct):
+        """Mirrors ``GameLogic.checkPartialMatch``."""
+        options = self.options
+        if len(answer) >= options['minSubstringLength'] and (correct in answer or answer in correct):
+            return True
+
+        if len(answer) <= options['exactMatchLength'] or len(correct) <= options['exactMatchLength']:
+            return answer == correct
+
+        words1 = [word for word in answer.split(' ')
+                  if word not in self.ignore_words and len(word) > options['minWordLength']]
+        words2 = [word for word in correct.split(' ')
+                  if word not in self.ignore_words and len(word) > options['minWordLength']]
+
+        if len(words1) > 1 and len(words2) > 1:
+            matches = sum(1 for word in words1 if any(other in word or word in other for other in words2))
+            return matches >= min(len(words1), len(words2)) * options['wordMatchRatio']
+
+        return False
+
+
+# Rules per (version, language), built once per worker process
+_rules = {}
+
+
+def rules_for(options, language):
+    key = (json.dumps(options, sort_keys=True), language)
+    if key not in _rules:
+        _rules[key] = Rules(options, language) if os.path.exists(output_path(language)) else None
+    return _rules[key]
+
+
+def grade_range(job):
+    """
+    Worker entry point: ``(path, start, end, old, new)`` ->
+    ``(verdict pair counts, {(language, id, normalized answer, old, new): count}, skipped)``.
+    """
+    path, start, end, old, new = job
+    totals = Counter()
+    changes = Counter()
+    skipped = 0
+    by_language = {}
+
+    for line in read_lines(path, start, end):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            answer, code = entry['answer'], entry['id']
+            language = entry.get('language') or FALLBACK_LANGUAGE
+        except (ValueError, KeyError, TypeError):
+            skipped += 1
+            continue
+
+        if language not in by_language:
+            by_language[language] = rules_for(old, language), rules_for(new, language)
+        old_rules, new_rules = by_language[language]
+        if old_rules is None or new_rules is None or not isinstance(answer, str) or not isinstance(code, str):
+            skipped += 1
+            continue
+        before, after = old_rules.grade(answer, code), new_rules.grade(answer, code)
+        if before is None:
+            skipped += 1
+            continue
+
+        totals[(before, after)] += 1
+        if before != after:
+            changes[(language, code, normalize_cached(answer), before, after)] += 1
+
+    return totals, changes, skipped
+
+
+def compare(paths, old, new, workers=None):
+    """Grade every logged pair under both rule option sets; returns ``(totals, changes, skipped)``."""
+    jobs = []
+    for path in paths:
+        ranges = [(0, None)] if path.endswith('.gz') else split_ranges(path)
+        jobs.extend((path, start, end, old, new) for start, end in ranges)
+
+    totals = Counter()
+    changes = Counter()
+    skipped = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part_totals, part_changes, part_skipped in pool.map(grade_range, jobs):
+            totals.update(part_totals)
+            changes.update(part_changes)
+            skipped += part_skipped
+    return totals, changes, skipped
+
+
+def build_report(old_name, new_name, totals, changes, skipped, limit=None):
+    """Verdict counts before and after, flips per country and the flipped answers by frequency."""
+    by_country = {}
+    for (language, code, answer, before, after), count in changes.items():
+        entry = by_country.setdefault(code, {'becameCorrect': 0, 'becameIncorrect': 0})
+        entry['becameCorrect' if after else 'becameIncorrect'] += count
+
+    ranked = sorted(changes.items(), key=lambda item: (-item[1], item[0][:3]))
+    if limit is not None:
+        ranked = ranked[:limit]
+
+    return {
+        'old': old_name,
+        'new': new_name,
+        'graded': sum(totals.values()),
+        'skipped': skipped,
+        'unchanged': {'correct': totals[(True, True)], 'incorrect': totals[(False, False)]},
+        'becameCorrect': totals[(False, True)],
+        'becameIncorrect': totals[(True, False)],
+        'byCountry': dict(sorted(by_country.items(),
+                                 key=lambda item: -(item[1]['becameCorrect'] + item[1]['becameIncorrect']))),
+        'changes': [
+            {'language': language, 'id': code, 'answer': answer,
+             'verdict': 'correct' if after else 'incorrect', 'count': count}
+            for (language, code, answer, before, after), count in ranked
+        ]
+    }
+
+
+def check_game_logic(path=GAME_LOGIC_SCRIPT):
+    """Failures of ``GameLogic.validateAnswer`` on the fixture answers, run in node."""
+    table = build_answer_table(SELF_CHECK_COUNTRIES, {
+        country['id']: country.get('alternatives', []) for country in SELF_CHECK_COUNTRIES
+    })
+    payload = json.dumps({'countries': SELF_CHECK_COUNTRIES, 'table': table,
+                          'answers': [[answer, code] for answer, code, *_ in SELF_CHECK_ANSWERS]})
+    result = subprocess.run(['node', '-e', NODE_GRADE_SCRIPT, path], input=payload,
+                            capture_output=True, text=True, encoding='utf-8')
+    if result.returncode:
+        return [f'grading: gameLogic.js failed in node: {result.stderr.strip()}']
+
+    failures = []
+    for lookup, verdicts in zip(('alternatives', 'answer table'), json.loads(result.stdout)):
+        for (answer, code, expected, _), verdict in zip(SELF_CHECK_ANSWERS, verdicts):
+            if verdict != expected:
+                failures.append(f'grading: gameLogic.js ({lookup}) grades {answer!r} for {code} {verdict}, '
+                                f'expected {expected}')
+    return failures
+
+
+def self_check():
+    """
+    Grade the fixture answers under ``current`` and ``exact`` and, with node, in
+    gameLogic.js; returns failure messages.
+    """
+    data = {'countries': SELF_CHECK_COUNTRIES}
+    failures = []
+    for column, version in enumerate(('current', 'exact')):
+        rules = Rules(RULE_VERSIONS[version], FALLBACK_LANGUAGE, data)
+        for answer, code, *expected in SELF_CHECK_ANSWERS:
+            verdict = rules.grade(answer, code)
+            if verdict != expected[column]:
+                failures.append(f'grading: {answer!r} for {code} is {verdict} under {version}, '
+                                f'expected {expected[column]}')
+        if rules.grade('Cuba', 'XXX') is not None:
+            failures.append(f'grading: an unknown id is graded under {version}')
+    if shutil.which('node'):
+        failures.extend(check_game_logic())
+    return failures
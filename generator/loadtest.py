@@ -0,0 +1,218 @@
+"""
+Load generator: concurrent virtual players replaying a game session over HTTP
+
+A session requests what the pages do, in order: ``languages.json``, the language's
+translation file, the countries data (or the startup bundle holding all three), then the flags of N random countries with a
+think time before each question. The countries data and the flags can be fetched
+in any of the formats the site has produced (see ``DATA_FORMATS`` and
+``FLAG_FORMATS``) so their cost can be compared on the same host. Each player holds
+one keep-alive connection; the client is plain asyncio streams.
+"""
+import asyncio
+import os
+import random
+import statistics
+import time
+
+from . import countries, flags, startup
+from .files import read_json
+from .paths import FLAG_DIR, GAME_DIR, ROOT, site_path
+from .server import PREFIX
+
+# startup: one data/startup_<lang>.json replacing languages, translations and countries;
+# compact: countries-manifest.json then the shared base and the language's name overlay
+DATA_FORMATS = ('startup', 'compact', 'full')
+# bundles: each needed continent bundle once, up front (FlagLoader.preload);
+# min/svg: one request per question from assets/flags/min or assets/flags/svg
+FLAG_FORMATS = ('bundles', 'min', 'svg')
+
+EXCLUDED_FROM_SESSION = {'ATA'}
+
+
+def url(path):
+    """Site URL for a path on disk."""
+    return PREFIX + site_path(path, ROOT)
+
+
+def game_url(relative):
+    return url(os.path.join(GAME_DIR, relative))
+
+
+def session_plan(language, data, rng, flag_count, data_format, flag_format):
+    """
+    Build one session as a list of ``(kind, url, think)`` steps; ``think`` is a
+    factor of the think time to wait before the request.
+    """
+    if data_format == 'startup':
+        steps = [('startup', url(startup.output_path(language)), 0)]
+    else:
+        steps = [
+            ('languages', f'{PREFIX}assets/translations/languages.json', 0),
+            ('translations', f'{PREFIX}assets/translations/{language}.json', 0),
+        ]
+    if data_format == 'compact':
+        pointers = read_json(os.path.join(GAME_DIR, 'data', 'countries-manifest.json'))
+        steps.append(('countries', game_url('data/countries-manifest.json'), 0))
+        steps.append(('countries', game_url(pointers['base']['path']), 0))
+        steps.append(('countries', game_url(pointers['names'][language]['path']), 0))
+    elif data_format == 'full':
+        steps.append(('countries', url(countries.output_path(language)), 0))
+
+    pool = [c for c in data['countries'] if c['id'] not in EXCLUDED_FROM_SESSION]
+    selected = rng.sample(pool, min(flag_count, len(pool)))
+    if flag_format == 'bundles':
+        bundle_urls = dict.fromkeys(game_url(c['flagBundle'][0]) for c in selected)
+        steps.extend(('flags', bundle_url, 0) for bundle_url in bundle_urls)
+        # Questions still take time but are answered from the bundles already held
+        steps.extend(('think', None, 1) for _ in selected[1:])
+    else:
+        for index, country in enumerate(selected):
+            path = (flags.min_path(country['id']) if flag_format == 'min'
+                    else os.path.join(FLAG_DIR, f'{country["id"]}.svg'))
+            steps.append(('flags', url(path), 1 if index else 0))
+    return steps
+
+
+class Connection:
+    """One HTTP/1.1 keep-alive connection; reopened when the server closes it."""
+
+    def __init__(self, host, port, accept_encoding):
+        self.host = host
+        self.port = port
+        self.accept_encoding = accept_encoding
+        self.reader = None
+        self.writer = None
+
+    async def get(self, target):
+        """Fetch ``target``; returns ``(status, body bytes)``."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        request = (f'GET {target} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n'
+                   f'Accept-Encoding: {self.accept_encoding}\r\n\r\n')
+        self.writer.write(request.encode('latin-1'))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError('connection closed by server')
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if 'content-length' in headers:
+            body = await self.reader.readexactly(int(headers['content-length']))
+        else:
+            body = await self.reader.read()
+            headers['connection'] = 'close'
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, len(body)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class Results:
+    def __init__(self):
+        self.latencies = {}
+        self.bytes = {}
+        self.session_bytes = []
+        self.failures = {}
+
+    def add_request(self, kind, seconds, size):
+        self.latencies.setdefault(kind, []).append(seconds * 1000)
+        self.bytes[kind] = self.bytes.get(kind, 0) + size
+
+    def add_failure(self, error):
+        name = type(error).__name__
+        self.failures[name] = self.failures.get(name, 0) + 1
+
+
+async def play(player, host, port, plans, think_time, sessions, start_delay, accept_encoding, results):
+    await asyncio.sleep(start_delay)
+    connection = Connection(host, port, accept_encoding)
+    rng = random.Random(player)
+    try:
+        for _ in range(sessions):
+            total = 0
+            try:
+                for kind, target, think in plans[rng.randrange(len(plans))]:
+                    if think:
+                        await asyncio.sleep(think * think_time * rng.uniform(0.5, 1.5))
+                    if target is None:
+                        continue
+                    start = time.perf_counter()
+                    status, size = await connection.get(target)
+                    if status >= 400:
+                        raise ConnectionError(f'HTTP {status} for {target}')
+                    results.add_request(kind, time.perf_counter() - start, size)
+                    total += size
+            except (OSError, ValueError, asyncio.IncompleteReadError) as error:
+                results.add_failure(error)
+                connection.close()
+                continue
+            results.session_bytes.append(total)
+    finally:
+        connection.close()
+
+
+def percentiles(values):
+    if len(values) < 2:
+        value = values[0] if values else 0.0
+        return {'p50': value, 'p95': value, 'p99': value, 'max': value}
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50': cuts[49], 'p95': cuts[94], 'p99': cuts[98], 'max': max(values)}
+
+
+async def run(host, port, players, language=countries.FALLBACK_LANGUAGE, flag_count=20, think_time=2.0,
+              sessions=1, ramp=5.0, data_format='compact', flag_format='bundles',
+              accept_encoding='gzip, br', seed=0):
+    """Run every player to completion and return the report."""
+    data = read_json(countries.output_path(language))
+    rng = random.Random(seed)
+    # A fixed pool of sessions keeps runs with the same seed comparable
+    plans = [session_plan(language, data, rng, flag_count, data_format, flag_format) for _ in range(256)]
+
+    results = Results()
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        play(player, host, port, plans, think_time, sessions, ramp * player / max(players, 1),
+             accept_encoding, results)
+        for player in range(players)
+    ))
+    elapsed = time.perf_counter() - start
+
+    requests = sum(len(values) for values in results.latencies.values())
+    transferred = sum(results.bytes.values())
+    completed = len(results.session_bytes)
+    return {
+        'players': players,
+        'sessionsCompleted': completed,
+        'sessionsFailed': sum(results.failures.values()),
+        'failures': results.failures,
+        'seconds': round(elapsed, 3),
+        'requests': requests,
+        'requestsPerSecond': round(requests / elapsed, 1),
+        'bytesPerSecond': round(transferred / elapsed),
+        'latencyMs': {
+            kind: {name: round(value, 2) for name, value in percentiles(values).items()}
+            for kind, values in [('all', [v for vs in results.latencies.values() for v in vs]),
+                                 *sorted(results.latencies.items())]
+        },
+        'bytesPerSession': {
+            'mean': round(statistics.mean(results.session_bytes)) if completed else 0,
+            **{kind: round(size / completed) if completed else 0 for kind, size in sorted(results.bytes.items())}
+        },
+        'config': {
+            'language': language, 'flags': flag_count, 'thinkTime': think_time, 'sessions': sessions,
+            'ramp': ramp, 'dataFormat': data_format, 'flagFormat': flag_format,
+            'acceptEncoding': accept_encoding, 'seed': seed
+        }
+    }
@@ -0,0 +1,388 @@
+"""
+Conservative JavaScript and CSS minifiers with source map output
+
+Both minifiers only drop comments and whitespace, so the result parses to the same
+program or stylesheet. JavaScript keeps its line breaks (automatic semicolon
+insertion depends on them) and loses indentation, blank lines and comments;
+strings, template literals and regular expression literals are copied verbatim.
+CSS is written on one line per file.
+
+Each minifier returns ``(text, mappings)`` where ``mappings`` lists
+``(generated line, generated column, source line, source column)`` points, one
+wherever output starts coming from a new source line; ``SourceMap`` joins them
+into a version 3 source map across the files of a bundle.
+"""
+import json
+import re
+
+IDENTIFIER_RE = re.compile(r'[\w$\\\u0080-￿]')
+
+# Keywords after which a slash starts a regular expression rather than a division
+REGEX_KEYWORDS = {
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+    'case', 'do', 'else', 'yield', 'await'
+}
+
+# Characters CSS whitespace can be dropped around (parentheses are kept for media queries)
+CSS_PUNCTUATION = set('{};,>')
+# Whitespace after a colon never matters, before one it may (``a :hover``)
+CSS_SPACE_BEFORE_ONLY = set(':')
+
+BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+def is_identifier_char(char):
+    return bool(char) and IDENTIFIER_RE.match(char) is not None
+
+
+class Output:
+    """Minified text under construction plus its mapping points."""
+
+    def __init__(self):
+        self.lines = [[]]
+        self.column = 0
+        self.last = ''
+        self.mapped_line = None
+        self.mappings = []
+
+    def emit(self, text, line, column):
+        if self.mapped_line != line:
+            self.mappings.append((len(self.lines) - 1, self.column, line, column))
+            self.mapped_line = line
+        self.lines[-1].append(text)
+        self.column += len(text)
+        self.last = text[-1]
+
+    def newline(self):
+        if self.lines[-1]:
+            self.lines.append([])
+            self.column = 0
+            self.last = '\n'
+            self.mapped_line = None
+
+    def text(self):
+        return '\n'.join(''.join(parts) for parts in self.lines if parts)
+
+
+def needs_space(previous, following):
+    """Whether dropping the whitespace between two tokens would merge or change them."""
+    if is_identifier_char(previous) and is_identifier_char(following):
+        return True
+    if previous in '+-' and following == previous:
+        return True
+    if previous == '/' and following in '/*':
+        return True
+    if previous.isdigit() and following == '.':
+        return True
+    return (previous, following) in (('<', '!'), ('-', '>'))
+
+
+class JavaScriptScanner:
+    def __init__(self, source):
+        self.source = source
+        self.position = 0
+        self.line = 0
+        self.line_start = 0
+        self.output = Output()
+        self.pending_space = False
+        # Last significant token: ('word', text), ('value', ...), ('punct', char) or None
+        self.previous = None
+        # Brace depth of each template literal whose ${...} is being scanned
+        self.templates = []
+        self.depth = 0
+
+    def column(self, position=None):
+        return (self.position if position is None else position) - self.line_start
+
+    def emit(self, text, start):
+        if self.pending_space and needs_space(self.output.last, text[0]):
+            self.output.emit(' ', self.line, self.column(start))
+        self.pending_space = False
+        self.output.emit(text, self.line, self.column(start))
+
+    def emit_verbatim(self, start, end):
+        """Copy ``source[start:end]`` as is, following the line breaks inside it."""
+        chunk_start = start
+        for index in range(start, end):
+            if self.source[index] == '\n':
+                if index > chunk_start:
+                    self.emit(self.source[chunk_start:index], chunk_start)
+                self.output.lines.append([])
+                self.output.column = 0
+                self.output.mapped_line = None
+                self.line += 1
+                self.line_start = index + 1
+                chunk_start = index + 1
+        if end > chunk_start:
+            self.emit(self.source[chunk_start:end], chunk_start)
+
+    def newline(self):
+        self.output.newline()
+        self.pending_space = False
+        self.line += 1
+        self.line_start = self.position + 1
+
+    def regex_allowed(self):
+        if self.previous is None:
+            return True
+        kind, text = self.previous
+        if kind == 'word':
+            return text in REGEX_KEYWORDS
+        if kind == 'value':
+            return False
+        return text not in ')]}'
+
+    def skip_string(self, quote):
+        index = self.position + 1
+        while index < len(self.source):
+            char = self.source[index]
+            if char == '\\':
+                index += 2
+                continue
+            if char == quote:
+                return index + 1
+            if char == '\n':
+                raise ValueError(f'Unterminated string on line {self.line + 1}')
+            index += 1
+        raise ValueError(f'Unterminated string on line {self.line + 1}')
+
+    def skip_regex(self):
+        index = self.position + 1
+        in_class = False
+        while index < len(self.source):
+            char = self.source[index]
+            if char == '\\':
+                index += 2
+                continue
+            if char == '\n':
+                raise ValueError(f'Unterminated regular expression on line {self.line + 1}')
+            if char == '[':
+                in_class = True
+            elif char == ']':
+                in_class = False
+            elif char == '/' and not in_class:
+                index += 1
+                while index < len(self.source) and is_identifier_char(self.source[index]):
+                    index += 1
+                return index
+            index += 1
+        raise ValueError(f'Unterminated regular expression on line {self.line + 1}')
+
+    def scan_template(self, start):
+        """Copy template text from ``start`` (a backtick or ``}``) up to its closing backtick or the next ``${``."""
+        index = start + 1
+        while index < len(self.source):
+            char = self.source[index]
+            if char == '\\':
+                index += 2
+                continue
+            if char == '`':
+                self.emit_verbatim(start, index + 1)
+                self.position = index + 1
+                self.previous = ('value', '`')
+                return
+            if char == '$' and self.source.startswith('${', index):
+                self.emit_verbatim(start, index + 2)
+                self.position = index + 2
+                self.templates.append(self.depth)
+                self.depth += 1
+                self.previous = ('punct', '{')
+                return
+            index += 1
+        raise ValueError('Unterminated template literal')
+
+    def run(self):
+        source = self.source
+        while self.position < len(source):
+            char = source[self.position]
+            start = self.position
+
+            if char == '\n':
+                self.newline()
+                self.position += 1
+            elif char in ' \t\r\f\v﻿':
+                self.pending_space = True
+                self.position += 1
+            elif source.startswith('//', start):
+                end = source.find('\n', start)
+                self.position = len(source) if end == -1 else end
+            elif source.startswith('/*', start):
+                end = source.find('*/', start + 2)
+                if end == -1:
+                    raise ValueError(f'Unterminated comment on line {self.line + 1}')
+                breaks = source.count('\n', start, end)
+                self.position = end + 2
+                if breaks:
+                    # A comment spanning lines still separates statements for ASI
+                    self.output.newline()
+                    self.pending_space = False
+                    self.line += breaks
+                    self.line_start = source.rfind('\n', start, end) + 1
+                else:
+                    self.pending_space = True
+            elif char in '\'"':
+                self.position = self.skip_string(char)
+                self.emit(source[start:self.position], start)
+                self.previous = ('value', char)
+            elif char == '`':
+                self.scan_template(start)
+            elif char == '/' and self.regex_allowed():
+                self.position = self.skip_regex()
+                self.emit(source[start:self.position], start)
+                self.previous = ('value', '/')
+            elif is_identifier_char(char):
+                end = start
+                while end < len(source) and is_identifier_char(source[end]):
+                    end += 1
+                # Decimal fractions and exponents are one token with the digits before them
+                if char.isdigit():
+                    while end < len(source) and (source[end] == '.' or is_identifier_char(source[end]) or
+                                                 (source[end] in '+-' and source[end - 1] in 'eE'
+                                                  and not source[start:end].lower().startswith('0x'))):
+                        end += 1
+                self.position = end
+                self.emit(source[start:end], start)
+                # A property name after '.' is a value even when it spells a keyword (y.in / 2)
+                is_value = char.isdigit() or self.previous == ('punct', '.')
+                self.previous = ('value' if is_value else 'word', source[start:end])
+            elif char == '}' and self.templates and self.depth - 1 == self.templates[-1]:
+                self.templates.pop()
+                self.depth -= 1
+                self.scan_template(start)
+            else:
+                if char == '{':
+                    self.depth += 1
+                elif char == '}':
+                    self.depth -= 1
+                self.position += 1
+                self.emit(char, start)
+                self.previous = ('punct', char)
+
+        return self.output.text(), self.output.mappings
+
+
+def minify_js(source):
+    return JavaScriptScanner(source).run()
+
+
+def minify_css(source, rewrite_url=None):
+    """
+    Minify a stylesheet. ``rewrite_url(url)`` maps each ``url()`` target, so a
+    stylesheet moved into a bundle keeps pointing at the same files.
+    """
+    output = Output()
+    position = 0
+    line = 0
+    line_start = 0
+    pending_space = False
+
+    def emit(text, start):
+        nonlocal pending_space
+        if pending_space and output.last not in CSS_PUNCTUATION | CSS_SPACE_BEFORE_ONLY \
+                and text[0] not in CSS_PUNCTUATION and output.last != '':
+            output.emit(' ', line, start - line_start)
+        pending_space = False
+        output.emit(text, line, start - line_start)
+
+    while position < len(source):
+        char = source[position]
+        start = position
+        if char.isspace():
+            end = position
+            while end < len(source) and source[end].isspace():
+                if source[end] == '\n':
+                    line += 1
+                    line_start = end + 1
+                end += 1
+            position = end
+            pending_space = True
+        elif source.startswith('/*', position):
+            end = source.find('*/', position + 2)
+            if end == -1:
+                raise ValueError(f'Unterminated comment on line {line + 1}')
+            breaks = source.count('\n', position, end)
+            if breaks:
+                line += breaks
+                line_start = source.rfind('\n', position, end) + 1
+            position = end + 2
+            pending_space = True
+        elif char in '\'"':
+            end = position + 1
+            while end < len(source) and source[end] != char:
+                end += 2 if source[end] == '\\' else 1
+            position = end + 1
+            emit(source[start:position], start)
+        elif source[position:position + 4].lower() == 'url(':
+            end = source.find(')', position)
+            if end == -1:
+                raise ValueError(f'Unterminated url() on line {line + 1}')
+            target = source[position + 4:end].strip()
+            quote = target[0] if target[:1] in ('"', "'") else ''
+            url = target.strip('\'"')
+            if rewrite_url is not None:
+                url = rewrite_url(url)
+            position = end + 1
+            emit(f'url({quote}{url}{quote})', start)
+        elif char == '}' and output.last == ';':
+            # The last declaration of a block needs no semicolon
+            output.lines[-1][-1] = output.lines[-1][-1][:-1]
+            output.column -= 1
+            pending_space = False
+            position += 1
+            emit(char, start)
+        else:
+            end = position + 1
+            while end < len(source) and not source[end].isspace() and source[end] not in '\'"{};,>/' \
+                    and source[end:end + 4].lower() != 'url(':
+                end += 1
+            position = end
+            emit(source[start:end], start)
+
+    return output.text(), output.mappings
+
+
+def vlq(value):
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    digits = ''
+    while True:
+        digit = value & 31
+        value >>= 5
+        digits += BASE64[digit | 32 if value else digit]
+        if not value:
+            return digits
+
+
+class SourceMap:
+    """Version 3 source map for files appended one after another."""
+
+    def __init__(self):
+        self.sources = []
+        # Generated line -> [(column, source index, source line, source column)]
+        self.lines = {}
+
+    def add(self, source, mappings, line_offset):
+        """Record the mappings of ``source`` written from generated line ``line_offset`` on."""
+        index = len(self.sources)
+        self.sources.append(source)
+        for line, column, source_line, source_column in mappings:
+            self.lines.setdefault(line + line_offset, []).append((column, index, source_line, source_column))
+
+    def to_json(self, file):
+        groups = []
+        previous_source = previous_line = previous_column = 0
+        for line in range(max(self.lines, default=-1) + 1):
+            segments = []
+            previous_generated = 0
+            for column, source, source_line, source_column in sorted(self.lines.get(line, [])):
+                segments.append(vlq(column - previous_generated) + vlq(source - previous_source)
+                                + vlq(source_line - previous_line) + vlq(source_column - previous_column))
+                previous_generated, previous_source = column, source
+                previous_line, previous_column = source_line, source_column
+            groups.append(','.join(segments))
+        return json.dumps({
+            'version': 3,
+            'file': file,
+            'sources': self.sources,
+            'names': [],
+            'mappings': ';'.join(groups)
+        }, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,80 @@
+"""
+Game modes: what each mode builds from and what it produces
+
+Every mode draws its countries from the shared country table (the master list)
+and declares the rest: the tables its names, accepted answers, difficulty and
+similarity come from, the directory of SVG assets its questions show, and which
+derived outputs it needs. All paths a stage writes for a mode (data directory,
+minified assets, bundles, atlases, caches, reports) are derived from the mode's
+game directory, so a new mode under game-modes/ only needs an entry in ``MODES``.
+"""
+import os
+
+from .paths import (ALTERNATIVES_DIR, DIFFICULTY_TABLE, FEATURE_CACHE_DIR, FLAG_DIR, GAME_DIR, NAMES_DIR,
+                    REPORTS_DIR, SHARED_FLAG_DIR, SIMILARITY_TABLE)
+
+# Flag stages: minified assets, shared symbols, continent bundles, thumbnail atlas, similarity
+ASSET_OUTPUTS = ('flags', 'symbols', 'bundles', 'atlas', 'similarity')
+# Per-language outputs: the dataset, type-ahead index, compact base and overlays, startup bundle
+LANGUAGE_OUTPUTS = ('datasets', 'suggestions', 'compact', 'startup')
+OUTPUTS = ASSET_OUTPUTS + LANGUAGE_OUTPUTS
+
+
+class GameMode:
+    """
+    One game mode's build. ``tables`` may name ``names`` and ``alternatives``
+    directories (one JSON file per language) and ``difficulty`` and ``similarity``
+    tables; missing entries mean the mode has none. Without an ``asset_dir``,
+    the mode covers every country in the table and skips the asset outputs.
+    """
+
+    def __init__(self, name, game_dir, tables, asset_dir=None, outputs=OUTPUTS):
+        unknown = sorted(set(outputs) - set(OUTPUTS))
+        if unknown:
+            raise ValueError(f'{name}: unknown outputs {unknown}')
+        if 'names' not in tables:
+            raise ValueError(f'{name}: a game mode needs a names table')
+        if set(outputs) & set(LANGUAGE_OUTPUTS) - {'datasets'} and 'datasets' not in outputs:
+            raise ValueError(f'{name}: {sorted(set(outputs) & set(LANGUAGE_OUTPUTS))} are derived from the datasets')
+
+        self.name = name
+        self.game_dir = game_dir
+        self.tables = dict(tables)
+        self.asset_dir = asset_dir
+        self.outputs = tuple(output for output in outputs if asset_dir or output not in ASSET_OUTPUTS)
+
+        self.data_dir = os.path.join(game_dir, 'data')
+        self.min_dir = os.path.join(game_dir, 'assets', 'flags', 'min')
+        self.bundle_dir = os.path.join(self.data_dir, 'flags')
+        self.atlas_dir = os.path.join(self.data_dir, 'atlas')
+        self.symbol_library = os.path.join(self.data_dir, 'flag-symbols.json')
+        self.shared_flag_dir = os.path.join(SHARED_FLAG_DIR, name)
+        self.feature_cache_dir = os.path.join(FEATURE_CACHE_DIR, name)
+        self.reports_dir = os.path.join(REPORTS_DIR, name)
+
+    def __repr__(self):
+        return f'GameMode({self.name!r})'
+
+    def builds(self, output):
+        return output in self.outputs
+
+    def table(self, name):
+        return self.tables.get(name)
+
+
+WORLD_FLAG_CHAMPIONSHIPS = GameMode(
+    'world-flag-championships',
+    GAME_DIR,
+    tables={
+        'names': NAMES_DIR,
+        'alternatives': ALTERNATIVES_DIR,
+        'difficulty': DIFFICULTY_TABLE,
+        'similarity': SIMILARITY_TABLE,
+    },
+    asset_dir=FLAG_DIR
+)
+
+MODES = (WORLD_FLAG_CHAMPIONSHIPS,)
+# Mode of the stage helpers called without one (the CLI tools, benchmarks and page checks)
+DEFAULT_MODE = WORLD_FLAG_CHAMPIONSHIPS
+
@@ -0,0 +1,226 @@
+"""
+Page bundles: each page's scripts and stylesheets concatenated and minified
+
+The pages list their scripts and stylesheets in dependency order inside marker
+comments; the build replaces the markup between a marker and ``<!-- /bundle -->``
+with a single tag::
+
+    <!-- bundle:js
+        ../../../js/shared/utils.js
+        js/game.js
+    -->
+    <script src="dist/game.3f2a9c0d41be.js"></script>
+    <!-- /bundle -->
+
+Bundles are written to a ``dist`` directory next to the page under
+content-hashed names, so they can be cached forever, with a version 3 source
+map beside each one pointing back at the original files. A block whose sources
+are unchanged keeps its bundle; bundles no page references any more are
+removed. With ``bundle=False`` the blocks list the individual files again,
+which is easier to debug.
+"""
+import os
+import re
+
+from . import minify
+from .cache import hash_bytes, hash_file
+from .files import write_bytes
+from .modes import MODES
+from .paths import ROOT, site_path
+
+STAGE = 'page-bundles'
+
+# Directories holding the HTML entry points
+PAGE_DIRS = (ROOT,) + tuple(mode.game_dir for mode in MODES)
+# Pages that are not part of the game
+EXCLUDED_PAGES = {'test.html'}
+BUNDLE_DIRNAME = 'dist'
+
+BLOCK_RE = re.compile(
+    r'(?P<indent>[ \t]*)<!-- bundle:(?P<kind>js|css)\n(?P<sources>.*?)-->\n'
+    r'(?P<body>.*?)(?P=indent)<!-- /bundle -->', re.S)
+REFERENCE_RE = re.compile(r'(?:src|href)="([^"]+)"')
+
+TAGS = {
+    'js': '<script src="{url}"></script>',
+    'css': '<link rel="stylesheet" href="{url}">',
+}
+SOURCE_MAP_COMMENTS = {
+    'js': '//# sourceMappingURL={name}',
+    'css': '/*# sourceMappingURL={name} */',
+}
+
+
+def list_pages():
+    pages = []
+    for directory in PAGE_DIRS:
+        pages.extend(os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                     if name.endswith('.html') and name not in EXCLUDED_PAGES)
+    return pages
+
+
+def bundle_dir(page_path):
+    return os.path.join(os.path.dirname(page_path), BUNDLE_DIRNAME)
+
+
+def url_between(path, directory):
+    return os.path.relpath(path, directory).replace(os.sep, '/')
+
+
+def parse_blocks(text, page_path):
+    """``[(match, kind, [source paths])]`` for every bundle block of a page."""
+    directory = os.path.dirname(page_path)
+    blocks = []
+    for match in BLOCK_RE.finditer(text):
+        sources = [os.path.normpath(os.path.join(directory, line.strip()))
+                   for line in match.group('sources').splitlines() if line.strip()]
+        blocks.append((match, match.group('kind'), sources))
+    return blocks
+
+
+def page_sources(page_path):
+    """Every script and stylesheet a page bundles, in order."""
+    with open(page_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return [source for _, _, sources in parse_blocks(text, page_path) for source in sources]
+
+
+def css_url_rewriter(source, directory):
+    """Map ``url()`` targets relative to ``source`` onto the bundle directory."""
+    def rewrite(url):
+        if not url or url.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return url
+        return url_between(os.path.join(os.path.dirname(source), url), directory)
+    return rewrite
+
+
+def build_bundle(kind, sources, directory, stem):
+    """Minify and join ``sources``; returns ``(bundle path, bundle bytes, source map bytes)``."""
+    source_map = minify.SourceMap()
+    chunks = []
+    line_offset = 0
+    for source in sources:
+        with open(source, 'r', encoding='utf-8') as f:
+            text = f.read()
+        try:
+            if kind == 'js':
+                minified, mappings = minify.minify_js(text)
+                # Guard against a file whose last statement relies on the end of the file
+                minified += ';'
+            else:
+                minified, mappings = minify.minify_css(text, css_url_rewriter(source, directory))
+        except ValueError as error:
+            raise ValueError(f'{site_path(source, ROOT)}: {error}') from None
+        source_map.add(url_between(source, directory), mappings, line_offset)
+        chunks.append(minified)
+        line_offset += minified.count('\n') + 1
+
+    content = '\n'.join(chunks)
+    name = f'{stem}.{hash_bytes(content)[:12]}.{kind}'
+    comment = SOURCE_MAP_COMMENTS[kind].format(name=f'{name}.map')
+    payload = f'{content}\n{comment}\n'.encode('utf-8')
+    return os.path.join(directory, name), payload, source_map.to_json(name)
+
+
+def render_body(indent, kind, urls):
+    return ''.join(f'{indent}{TAGS[kind].format(url=url)}\n' for url in urls)
+
+
+def referenced_bundle(body, page_path):
+    """The bundle a block currently points at, if it exists."""
+    match = REFERENCE_RE.search(body)
+    if not match or os.path.dirname(match.group(1)) != BUNDLE_DIRNAME:
+        return None
+    path = os.path.normpath(os.path.join(os.path.dirname(page_path), match.group(1)))
+    return path if os.path.exists(path) else None
+
+
+def build_page(manifest, page_path, module_hash, bundle=True, force=False):
+    """Rewrite one page's bundle blocks. Returns ``(bundle paths in use, bundles written)``."""
+    with open(page_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    blocks = parse_blocks(text, page_path)
+    if not blocks:
+        return set(), 0
+
+    page = site_path(page_path, ROOT)
+    directory = bundle_dir(page_path)
+    stem = os.path.splitext(os.path.basename(page_path))[0]
+    in_use = set()
+    written = 0
+    parts = []
+    position = 0
+
+    for index, (match, kind, sources) in enumerate(blocks):
+        key = f'{page}#{index}'
+        missing = [source for source in sources if not os.path.exists(source)]
+        if missing:
+            raise FileNotFoundError(f'{page}: bundle sources not found: '
+                                    f'{", ".join(site_path(path, ROOT) for path in missing)}')
+
+        indent = match.group('indent')
+        if bundle:
+            digest = hash_bytes(module_hash, kind, *(f'{site_path(source, ROOT)}:{hash_file(source)}'
+                                                     for source in sources))
+            current = referenced_bundle(match.group('body'), page_path)
+            if not force and current is not None and manifest.is_fresh(STAGE, key, digest):
+                body = match.group('body')
+                in_use.add(current)
+            else:
+                path, payload, source_map = build_bundle(kind, sources, directory, stem)
+                write_bytes(path, payload)
+                write_bytes(f'{path}.map', source_map)
+                manifest.record(STAGE, key, digest)
+                body = render_body(indent, kind, [url_between(path, os.path.dirname(page_path))])
+                in_use.add(path)
+                written += 1
+        else:
+            manifest.forget(STAGE, key)
+            body = render_body(indent, kind, [url_between(source, os.path.dirname(page_path))
+                                              for source in sources])
+
+        parts.append(text[position:match.start('body')])
+        parts.append(body)
+        position = match.end('body')
+
+    parts.append(text[position:])
+    write_bytes(page_path, ''.join(parts).encode('utf-8'))
+    return in_use, written
+
+
+def remove_stale(directories, in_use):
+    """Delete bundles (and their maps) that no page references."""
+    removed = 0
+    keep = in_use | {f'{path}.map' for path in in_use}
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if path not in keep:
+                os.remove(path)
+                removed += 1
+        if not os.listdir(directory):
+            os.rmdir(directory)
+    return removed
+
+
+def build(manifest, bundle=True, force=False):
+    """Bundle (or, with ``bundle=False``, unbundle) every page. Returns the bundle paths in use."""
+    module_hash = hash_bytes(hash_file(__file__), hash_file(minify.__file__))
+    pages = list_pages()
+    in_use = set()
+    written = 0
+    for page_path in pages:
+        page_bundles, page_written = build_page(manifest, page_path, module_hash, bundle, force)
+        in_use |= page_bundles
+        written += page_written
+
+    removed = remove_stale({bundle_dir(page_path) for page_path in pages}, in_use)
+    if written:
+        sizes = sum(os.path.getsize(path) for path in in_use)
+        print(f'Bundled page scripts and stylesheets into {written} new bundles '
+              f'({len(in_use)} in use, {sizes:,} bytes)')
+    if removed:
+        print(f'Removed {removed} stale bundle files')
+    return in_use
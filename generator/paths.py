@@ -0,0 +1,58 @@
+"""
+Filesystem locations shared by the build stages
+"""
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Source tables: structural country fields plus name and alternative-name tables per language
+TABLES_DIR = os.path.join(ROOT, 'generator', 'tables')
+COUNTRY_TABLE = os.path.join(TABLES_DIR, 'countries.json')
+NAMES_DIR = os.path.join(TABLES_DIR, 'names')
+ALTERNATIVES_DIR = os.path.join(TABLES_DIR, 'alternatives')
+# Per-flag answer statistics, written by aggregate_results.py
+DIFFICULTY_TABLE = os.path.join(TABLES_DIR, 'difficulty.json')
+# Most confusable flags per flag, written by the similarity stage (kept for builds without NumPy)
+SIMILARITY_TABLE = os.path.join(TABLES_DIR, 'similarity.json')
+
+# Site-wide assets
+TRANSLATIONS_DIR = os.path.join(ROOT, 'assets', 'translations')
+PRECOMPRESSED_MANIFEST = os.path.join(ROOT, 'precompressed.json')
+PRECACHE_MANIFEST = os.path.join(ROOT, 'precache-manifest.json')
+SERVICE_WORKER = os.path.join(ROOT, 'sw.js')
+TEMPLATES_DIR = os.path.join(ROOT, 'generator', 'templates')
+
+# World Flag Championships game mode
+GAME_DIR = os.path.join(ROOT, 'game-modes', 'geography-games', 'world-flag-championships')
+FLAG_DIR = os.path.join(GAME_DIR, 'assets', 'flags', 'svg')
+FLAG_MIN_DIR = os.path.join(GAME_DIR, 'assets', 'flags', 'min')
+DATA_DIR = os.path.join(GAME_DIR, 'data')
+BUNDLE_DIR = os.path.join(DATA_DIR, 'flags')
+ATLAS_DIR = os.path.join(DATA_DIR, 'atlas')
+# Subtrees shared by several flags, referenced from the bundled flags with <use>
+SYMBOL_LIBRARY = os.path.join(DATA_DIR, 'flag-symbols.json')
+
+# Game results store (results_store.py); holds player data, not committed
+RESULTS_DIR = os.path.join(ROOT, 'results')
+
+# Benchmark results, committed so regressions show up against the previous run
+BENCHMARK_HISTORY = os.path.join(ROOT, 'benchmarks', 'history.json')
+# Transfer budgets per HTML entry point, checked by page_weight.py and the build
+WEIGHT_BUDGETS = os.path.join(ROOT, 'benchmarks', 'budgets.json')
+
+# Incremental build state (not committed)
+CACHE_DIR = os.path.join(ROOT, '.build-cache')
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'manifest.json')
+REPORTS_DIR = os.path.join(CACHE_DIR, 'reports')
+FEATURE_CACHE_DIR = os.path.join(CACHE_DIR, 'flag-features')
+# Minified flags with shared subtrees replaced by <use>, per game mode; the bundles are cut from these
+SHARED_FLAG_DIR = os.path.join(CACHE_DIR, 'flags-shared')
+# Content-hashed inputs shared by the dataset workers of every game mode and language
+INTERMEDIATE_DIR = os.path.join(CACHE_DIR, 'intermediates')
+# Indexed SQLite copy of every dataset, queried by the subset endpoint of serve.py
+COUNTRY_STORE = os.path.join(CACHE_DIR, 'countries.sqlite')
+
+
+def site_path(path, base=GAME_DIR):
+    """Return ``path`` relative to ``base`` with forward slashes, as the pages fetch it."""
+    return os.path.relpath(path, base).replace(os.sep, '/')
@@ -0,0 +1,182 @@
+"""
+Build stages in dependency order, shared by the one-shot build and watch mode
+
+``build_inputs`` runs a game mode's per-asset stages and returns the fields they
+contribute to every dataset of the mode; with several modes each one's chain of
+stages runs in its own worker process, the stages splitting the workers between
+them. ``build_languages`` then writes the per-language outputs of every mode. The
+country table (the master list every mode draws from) and each mode's inputs are
+stored once as content-hashed intermediates, and every ``(mode, language)`` pair
+builds in its own worker process from them.
+Every dataset is then loaded into the indexed country store (generator/store.py).
+Watch mode keeps the inputs around and reruns ``build_inputs`` only when assets or
+the country table change.
+"""
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+
+from . import (answers, atlas, bundles, compact, countries, difficulty, flags, modes, selection, similarity,
+               startup, store, suggestions, symbols)
+from .cache import load_intermediate, store_intermediate
+
+
+def build_inputs(manifest, mode, country_table, precision=flags.DEFAULT_PRECISION, workers=None, force=False):
+    """
+    Run the asset stages ``mode`` declares: optimize its flags, hoist their shared
+    subtrees, bundle and render them and find the most similar flags; then load
+    its difficulty table and build the selection bitsets.
+    Returns the mode's dataset inputs:
+    ``{'flag_ids', 'country_fields', 'extra_fields'}``.
+    """
+    scoped = manifest.scoped(mode.name)
+    flag_ids = countries.scan_flags(mode.asset_dir) if mode.asset_dir else sorted(country_table)
+    codes = countries.ordered_codes(country_table, flag_ids)
+    country_fields = {}
+    extra_fields = {}
+
+    if mode.builds('flags'):
+        flags.build(scoped, precision=precision, workers=workers, force=force, mode=mode)
+        flag_file = partial(flags.min_path, mode=mode)
+    else:
+        flag_file = partial(similarity.source_path, mode=mode)
+    bundled_flag = flag_file
+    if mode.builds('symbols'):
+        bundled_flag = symbols.build(scoped, flag_ids, flag_file, force=force, mode=mode)
+    if mode.builds('bundles'):
+        flag_index = bundles.build(scoped, country_table, flag_ids, bundled_flag, force=force, mode=mode)
+        for code, entry in flag_index.items():
+            country_fields.setdefault(code, {})['flagBundle'] = entry
+    if mode.builds('atlas'):
+        flag_atlas, thumbs = atlas.build(scoped, flag_ids, flag_file, workers=workers, force=force, mode=mode)
+        for code, position in thumbs.items():
+            country_fields.setdefault(code, {})['flagThumb'] = position
+        if flag_atlas:
+            extra_fields['flagAtlas'] = flag_atlas
+    if mode.builds('similarity') and mode.table('similarity'):
+        for code, fields in similarity.build(scoped, codes, workers=workers, force=force, mode=mode).items():
+            country_fields.setdefault(code, {}).update(fields)
+    if mode.table('difficulty'):
+        for code, fields in difficulty.load_fields(mode.table('difficulty')).items():
+            country_fields.setdefault(code, {}).update(fields)
+
+    extra_fields['selection'] = selection.build_bitsets(country_table, codes)
+    return {
+        'flag_ids': flag_ids,
+        'country_fields': country_fields,
+        'extra_fields': extra_fields
+    }
+
+
+def build_mode(job):
+    """
+    Worker entry point: ``(mode, country table path, manifest, precision, workers, force)``
+    -> ``(inputs, recorded manifest entries, printed output)`` of ``build_inputs``.
+    """
+    mode, table_path, manifest, precision, workers, force = job
+    output = io.StringIO()
+    with redirect_stdout(output):
+        inputs = build_inputs(manifest, mode, load_intermediate(table_path), precision, workers, force)
+    return inputs, manifest.recorded, output.getvalue()
+
+
+def build_modes(manifest, selected_modes=None, precision=flags.DEFAULT_PRECISION, workers=None, force=False):
+    """
+    ``build_inputs`` for each mode, the modes in parallel. Returns ``{mode: inputs}``,
+    each including the shared ``country_table``.
+    """
+    country_table = countries.load_country_table()
+    selected = list(selected_modes or modes.MODES)
+    shared = {}
+    if len(selected) > 1:
+        # Every mode's stages start their own pools; split the workers so they do not oversubscribe
+        total = workers or os.cpu_count() or 1
+        table_path = store_intermediate('country-table', country_table)
+        jobs = [(mode, table_path, manifest.subset(mode.name), precision, max(1, total // len(selected)), force)
+                for mode in selected]
+        with ProcessPoolExecutor(max_workers=min(len(selected), total)) as pool:
+            for mode, (inputs, recorded, output) in zip(selected, pool.map(build_mode, jobs)):
+                manifest.replay(recorded)
+                print(output, end='')
+                shared[mode] = inputs
+    else:
+        # A single mode keeps every worker for its own stages
+        for mode in selected:
+            shared[mode] = build_inputs(manifest, mode, country_table, precision, workers, force)
+    for inputs in shared.values():
+        inputs['country_table'] = country_table
+    return shared
+
+
+def build_language(job):
+    """
+    Worker entry point: ``(mode, language, country table path, inputs path, manifest, force)``
+    -> ``(recorded manifest entries, printed output)``. Writes the dataset, suggestion
+    index and startup bundle the mode declares.
+    """
+    mode, language, table_path, inputs_path, manifest, force = job
+    country_table = load_intermediate(table_path)
+    inputs = load_intermediate(inputs_path)
+    scoped = manifest.scoped(mode.name)
+    dataset_path = partial(countries.output_path, mode=mode)
+
+    output = io.StringIO()
+    with redirect_stdout(output):
+        countries.build(scoped, country_table, inputs['flag_ids'], inputs['country_fields'],
+                        inputs['extra_fields'], enrichers=[answers], languages=[language], force=force, mode=mode)
+        if mode.builds('suggestions'):
+            suggestions.build(scoped, [language], dataset_path, force=force, mode=mode)
+        if mode.builds('startup'):
+            startup.build(scoped, [language], dataset_path, force=force, mode=mode)
+    return manifest.recorded, output.getvalue()
+
+
+def build_languages(manifest, shared, languages=None, compact_outputs=True, workers=None, force=False):
+    """
+    Write the dataset, suggestion index, compact copy and startup bundle of each
+    language of each mode in ``shared`` (see ``build_modes``), the pairs in parallel,
+    then refresh the country store. Returns ``{mode: languages}``.
+    """
+    table_path = None
+    jobs = []
+    targets = {}
+    for mode, inputs in shared.items():
+        available = countries.available_languages(mode)
+        targets[mode] = [language for language in (languages or available) if language in available]
+        if not mode.builds('datasets') or not targets[mode]:
+            continue
+        if table_path is None:
+            table_path = store_intermediate('country-table', inputs['country_table'])
+        inputs_path = store_intermediate(f'{mode.name}-inputs', {
+            key: value for key, value in inputs.items() if key != 'country_table'
+        })
+        jobs.extend((mode, language, table_path, inputs_path, manifest.subset(mode.name), force)
+                    for language in targets[mode])
+
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(build_language, jobs))
+    else:
+        # A single pair (a watch rebuild) is not worth starting workers for
+        results = [build_language(job) for job in jobs]
+    for recorded, output in results:
+        manifest.replay(recorded)
+        print(output, end='')
+
+    for mode, mode_languages in targets.items():
+        if compact_outputs and mode.builds('compact') and mode_languages:
+            compact.build(manifest.scoped(mode.name), mode_languages,
+                          partial(countries.output_path, mode=mode), force=force, mode=mode)
+    store.build(manifest, force=force)
+    return targets
+
+
+def build(manifest, selected_modes=None, languages=None, precision=flags.DEFAULT_PRECISION, workers=None,
+          compact_outputs=True, force=False):
+    """Every stage of the selected modes (default: all). Returns ``{mode: inputs}``."""
+    shared = build_modes(manifest, selected_modes, precision, workers, force)
+    build_languages(manifest, shared, languages, compact_outputs, workers, force)
+    return shared
+
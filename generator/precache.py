@@ -0,0 +1,96 @@
+"""
+Offline precache manifest and the service worker that consumes it
+
+``precache-manifest.json`` lists every file a session can load (app shell,
+translations, data, flag bundles and flags) with a content hash, size and group.
+The shell is every page plus what its markup references, so bundled pages
+precache their bundles rather than the individual scripts.
+``sw.js`` is rendered from generator/templates/service-worker.js with the
+manifest's version baked in, so any content change also changes the worker and
+browsers pick it up. The worker precaches the default groups on install and a
+continent's ``bundle:`` group when the setup screen asks for it; it only refetches
+entries whose hash changed.
+"""
+import os
+
+from . import bundles, countries, flags, pages
+from .cache import hash_bytes, hash_file
+from .files import dump_json, write_bytes
+from .paths import PRECACHE_MANIFEST, ROOT, SERVICE_WORKER, TEMPLATES_DIR, TRANSLATIONS_DIR, site_path
+from .weight import static_dependencies
+
+TEMPLATE = os.path.join(TEMPLATES_DIR, 'service-worker.js')
+
+# Full datasets only back up the compact files, individual flags only back up the bundles
+DEFAULT_GROUPS = ('shell', 'translations', 'data', 'atlas')
+
+
+def list_files(directory, extensions):
+    if not os.path.isdir(directory):
+        return []
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+            if name.endswith(extensions)]
+
+
+def shell_files():
+    """Every page plus the bundles, scripts, stylesheets and icons its markup references."""
+    files = set()
+    for page_path in pages.list_pages():
+        blocking, other = static_dependencies(page_path)
+        files.update([page_path] + blocking + other)
+    return files
+
+
+def collect_groups(shared):
+    """``{path: group}`` for every precacheable file of the game modes in ``shared`` (``{mode: inputs}``)."""
+    groups = {}
+    groups.update((path, 'shell') for path in shell_files())
+    groups.update((path, 'translations') for path in list_files(TRANSLATIONS_DIR, ('.json',)))
+
+    for mode, inputs in shared.items():
+        full_datasets = {countries.output_path(language, mode) for language in countries.available_languages(mode)}
+        for path in list_files(mode.data_dir, ('.json',)):
+            groups[path] = 'data-full' if path in full_datasets else 'data'
+        groups.update((path, 'atlas') for path in list_files(mode.atlas_dir, ('.png',)))
+
+        # The continent groups of every mode are precached together when the setup screen asks
+        for continent, codes in bundles.group_by_continent(inputs['country_table'], inputs['flag_ids']).items():
+            groups[bundles.bundle_path(continent, mode)] = f'bundle:{continent}'
+            groups.update((flags.min_path(code, mode), f'flag:{continent}') for code in codes)
+    return groups
+
+
+def build_manifest(shared):
+    entries = {}
+    for path, group in sorted(collect_groups(shared).items()):
+        if os.path.exists(path):
+            entries[site_path(path, ROOT)] = {
+                'hash': hash_file(path)[:16],
+                'size': os.path.getsize(path),
+                'group': group
+            }
+    return {
+        'version': hash_bytes(dump_json(entries, indent=None))[:16],
+        'defaultGroups': list(DEFAULT_GROUPS),
+        'entries': entries
+    }
+
+
+def render_worker(version):
+    with open(TEMPLATE, 'r', encoding='utf-8') as f:
+        template = f.read()
+    return template.replace('__PRECACHE_VERSION__', version).encode('utf-8')
+
+
+def build(shared):
+    """Write the precache manifest and service worker for ``{mode: inputs}``. Returns the manifest."""
+    manifest = build_manifest(shared)
+    changed = write_bytes(PRECACHE_MANIFEST, dump_json(manifest, indent=None))
+    changed = write_bytes(SERVICE_WORKER, render_worker(manifest['version'])) or changed
+
+    default_bytes = sum(entry['size'] for entry in manifest['entries'].values()
+                        if entry['group'] in DEFAULT_GROUPS)
+    if changed:
+        print(f'Created {os.path.relpath(PRECACHE_MANIFEST, ROOT)} with {len(manifest["entries"])} entries '
+              f'(version {manifest["version"]}, {default_bytes:,} bytes precached on install)')
+    return manifest
@@ -0,0 +1,207 @@
+"""
+Append-only game results store with incrementally maintained statistics
+
+Results are the records saved by ``endGame`` in js/game.js. Each accepted result is
+appended to ``results.jsonl`` and folded into running aggregates (count, mean and
+best score, mean accuracy and time) and a top-k leaderboard for its continent
+selection and time limit, plus the roll-ups over all selections and/or all time
+limits. Queries read those directly, so they cost the same however much history
+exists. ``snapshot.json`` saves the aggregates with the log offset they cover;
+opening the store loads it and replays only the log written after it.
+"""
+import heapq
+import json
+import os
+
+from .files import dump_json, read_json, write_bytes
+from .paths import RESULTS_DIR
+
+ALL = '*'
+LEADERBOARD_SIZE = 10
+SNAPSHOT_VERSION = 1
+
+
+def calculate_score(correct_first_try, correct_second_try):
+    """Mirrors ``GameLogic.calculateScore`` in js/gameLogic.js."""
+    return correct_first_try * 10 + correct_second_try * 5
+
+
+def selection_key(continents):
+    return ','.join(sorted(continents)) if continents else ALL
+
+
+def limit_key(time_limit):
+    return ALL if time_limit is None else str(time_limit)
+
+
+def normalize(record, sequence):
+    """The fields the store keeps from an exported result."""
+    first = record.get('correctFirstTry') or 0
+    second = record.get('correctSecondTry') or 0
+    played = record.get('completedQuestions') or record.get('totalQuestions') or 0
+    return {
+        'seq': sequence,
+        'score': record['score'] if 'score' in record else calculate_score(first, second),
+        # Same definition as the results page: first- and second-try answers over flags played
+        'accuracy': round((first + second) * 100 / played, 2) if played else 0,
+        'timeTaken': record.get('timeTaken') or 0,
+        'timeLimit': record.get('timeLimit') or 0,
+        'continents': sorted(record.get('continents') or []),
+        'player': record.get('player'),
+        'date': record.get('date')
+    }
+
+
+class Aggregate:
+    """Running totals for one selection/time-limit pair."""
+
+    def __init__(self, count=0, score_total=0, best_score=None, accuracy_total=0.0, time_total=0):
+        self.count = count
+        self.score_total = score_total
+        self.best_score = best_score
+        self.accuracy_total = accuracy_total
+        self.time_total = time_total
+
+    def add(self, entry):
+        self.count += 1
+        self.score_total += entry['score']
+        self.best_score = entry['score'] if self.best_score is None else max(self.best_score, entry['score'])
+        self.accuracy_total += entry['accuracy']
+        self.time_total += entry['timeTaken']
+
+    def summary(self):
+        """Same keys as ``GameLogic.getGameStatistics``."""
+        if not self.count:
+            return {'totalGames': 0, 'averageScore': 0, 'bestScore': 0, 'averageAccuracy': 0, 'averageTime': 0}
+        return {
+            'totalGames': self.count,
+            'averageScore': round(self.score_total / self.count),
+            'bestScore': self.best_score,
+            'averageAccuracy': round(self.accuracy_total / self.count),
+            'averageTime': round(self.time_total / self.count)
+        }
+
+    def to_json(self):
+        return [self.count, self.score_total, self.best_score, self.accuracy_total, self.time_total]
+
+
+class Leaderboard:
+    """The best ``size`` entries: highest score, then fastest, then earliest."""
+
+    def __init__(self, size=LEADERBOARD_SIZE, entries=()):
+        self.size = size
+        self.heap = []
+        self.ranked = None
+        for entry in entries:
+            self.add(entry)
+
+    @staticmethod
+    def rank(entry):
+        return entry['score'], -entry['timeTaken'], -entry['seq']
+
+    def add(self, entry):
+        item = (self.rank(entry), entry['seq'], entry)
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, item)
+        elif item[0] > self.heap[0][0]:
+            heapq.heapreplace(self.heap, item)
+        else:
+            return
+        self.ranked = None
+
+    def top(self):
+        if self.ranked is None:
+            self.ranked = [entry for _, _, entry in sorted(self.heap, reverse=True)]
+        return self.ranked
+
+
+class ResultsStore:
+    def __init__(self, directory=RESULTS_DIR, leaderboard_size=LEADERBOARD_SIZE):
+        self.log_path = os.path.join(directory, 'results.jsonl')
+        self.snapshot_path = os.path.join(directory, 'snapshot.json')
+        self.leaderboard_size = leaderboard_size
+        self.aggregates = {}
+        self.leaderboards = {}
+        self.offset = 0
+        self.sequence = 0
+        self.load()
+
+    def keys(self, entry):
+        selections = {selection_key(entry['continents']), ALL}
+        limits = {limit_key(entry['timeLimit']), ALL}
+        return [(selection, limit) for selection in selections for limit in limits]
+
+    def apply(self, entry):
+        for key in self.keys(entry):
+            self.aggregates.setdefault(key, Aggregate()).add(entry)
+            self.leaderboards.setdefault(key, Leaderboard(self.leaderboard_size)).add(entry)
+        self.sequence = max(self.sequence, entry['seq'] + 1)
+
+    def load(self):
+        """Restore the snapshot if it still matches the log, then replay the rest of the log."""
+        if os.path.exists(self.snapshot_path):
+            snapshot = read_json(self.snapshot_path)
+            log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+            if (snapshot.get('version') == SNAPSHOT_VERSION and snapshot['offset'] <= log_size
+                    and snapshot['leaderboardSize'] == self.leaderboard_size):
+                self.offset = snapshot['offset']
+                self.sequence = snapshot['sequence']
+                for key, values in snapshot['aggregates'].items():
+                    self.aggregates[tuple(key.split('|'))] = Aggregate(*values)
+                for key, entries in snapshot['leaderboards'].items():
+                    self.leaderboards[tuple(key.split('|'))] = Leaderboard(self.leaderboard_size, entries)
+
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'rb') as f:
+                f.seek(self.offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Partial line from an interrupted append; the next add starts after it
+                        break
+                    self.apply(json.loads(line))
+                    self.offset += len(line)
+
+    def add_many(self, records):
+        """Append and apply exported results; returns the stored entries."""
+        entries = []
+        lines = []
+        for record in records:
+            entry = normalize(record, self.sequence)
+            self.apply(entry)
+            entries.append(entry)
+            lines.append(dump_json(entry, indent=None) + b'\n')
+        if lines:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, 'ab') as f:
+                if f.tell() != self.offset:
+                    # Drop a partial line left by an interrupted append
+                    f.truncate(self.offset)
+                payload = b''.join(lines)
+                f.write(payload)
+            self.offset += len(payload)
+        return entries
+
+    def add(self, record):
+        return self.add_many([record])[0]
+
+    def stats(self, continents=None, time_limit=None):
+        aggregate = self.aggregates.get((selection_key(continents), limit_key(time_limit)))
+        return (aggregate or Aggregate()).summary()
+
+    def leaderboard(self, continents=None, time_limit=None):
+        board = self.leaderboards.get((selection_key(continents), limit_key(time_limit)))
+        return board.top() if board else []
+
+    def selections(self):
+        """Every ``(selection, time limit)`` pair with results, roll-ups included."""
+        return sorted(self.aggregates)
+
+    def save(self):
+        write_bytes(self.snapshot_path, dump_json({
+            'version': SNAPSHOT_VERSION,
+            'offset': self.offset,
+            'sequence': self.sequence,
+            'leaderboardSize': self.leaderboard_size,
+            'aggregates': {'|'.join(key): aggregate.to_json() for key, aggregate in sorted(self.aggregates.items())},
+            'leaderboards': {'|'.join(key): board.top() for key, board in sorted(self.leaderboards.items())}
+        }, indent=None))
@@ -0,0 +1,34 @@
+"""
+Selection bitsets: one bitset per continent and per status over country ordinals
+
+A country's ordinal is its position in the dataset's ``countries`` array. Bitsets
+are arrays of 32-bit words (bit ``i % 32`` of word ``i // 32``) so the setup
+screen can combine filters with a few bitwise operations per word.
+"""
+from .countries import STATUSES
+
+WORD_BITS = 32
+
+
+def bitset(ordinals, size):
+    words = [0] * ((size + WORD_BITS - 1) // WORD_BITS)
+    for ordinal in ordinals:
+        words[ordinal // WORD_BITS] |= 1 << (ordinal % WORD_BITS)
+    return words
+
+
+def build_bitsets(country_table, codes):
+    """``codes`` are the dataset's country ids in ordinal order."""
+    continents = {}
+    statuses = {status: [] for status in STATUSES}
+    for ordinal, code in enumerate(codes):
+        country = country_table[code]
+        continents.setdefault(country['continent'], []).append(ordinal)
+        statuses.setdefault(country['status'], []).append(ordinal)
+
+    size = len(codes)
+    return {
+        'size': size,
+        'continents': {continent: bitset(ordinals, size) for continent, ordinals in continents.items()},
+        'statuses': {status: bitset(ordinals, size) for status, ordinals in statuses.items()}
+    }
@@ -0,0 +1,19 @@
+"""
+Self-checks of the stages whose results are easy to get subtly wrong
+
+The repository has no test suite. Instead, such modules carry a ``self_check()``
+that runs them on fixed fixtures and returns failure messages. generate_countries.py
+runs every check before building and stops on a failure; --self-check runs only
+the checks.
+"""
+from . import difficulty, grading, similarity
+
+CHECKS = (difficulty.self_check, similarity.self_check, grading.self_check)
+
+
+def run(checks=CHECKS):
+    """Run ``checks`` and print their failures; returns the failure messages."""
+    failures = [failure for check in checks for failure in check()]
+    for failure in failures:
+        print(f'❌ Self-check failed: {failure}')
+    return failures
@@ -0,0 +1,377 @@
+"""
+Caching static file server for local and staging use
+
+Serves the site under ``/world-quiz-championships/`` the way it is hosted: the
+pages, their bundles, scripts, styles and assets, the game modes and the service
+worker files; the generator, tables, results and the rest of the repository are
+not served. Responses carry strong ETags with ``304`` revalidation, year-long immutable caching for
+content-hashed files, the ``.br``/``.gz`` siblings written by ``--compress``
+when the client accepts them, and an in-memory LRU of recently served files.
+With a country store (generator/store.py), ``<game mode>/api/countries`` answers
+filtered-subset queries such as ``?lang=en&continent=Oceania&status=official``,
+and the game mode's pages are served with a ``countries-api`` meta tag announcing
+it; static hosting has neither, so the pages filter the full data themselves.
+Everything runs on one asyncio loop; file reads and queries go to the default executor.
+"""
+import asyncio
+import mimetypes
+import os
+import re
+import time
+import traceback
+from collections import OrderedDict
+from email.utils import formatdate
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .cache import hash_bytes
+from .compress import SUFFIXES, available_encodings, compress_bytes
+from .countries import FALLBACK_LANGUAGE
+from .files import dump_json
+from .modes import MODES
+from .paths import ROOT, site_path
+from .store import FILTERS
+
+PREFIX = '/world-quiz-championships/'
+
+# File names carrying a content hash (countries_en.<sha12>.json) never change
+HASHED_NAME_RE = re.compile(r'\.[0-9a-f]{12}\.[a-z0-9]+$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+# Top-level directories and files of the site; anything else is a 404 (pages are the *.html at the root)
+SITE_DIRS = {'assets', 'css', 'dist', 'game-modes', 'js'}
+SITE_FILES = {'favicon.ico', 'precache-manifest.json', 'sw.js'}
+
+# Preferred first when the client accepts both
+ENCODING_PREFERENCE = ('br', 'gzip')
+
+# Subset endpoint of each game mode (below PREFIX) -> mode name
+SUBSET_ENDPOINTS = {f'{site_path(mode.game_dir, ROOT)}/api/countries': mode.name for mode in MODES}
+# Game mode directories whose pages announce their endpoint
+SUBSET_PAGES = {site_path(mode.game_dir, ROOT) for mode in MODES}
+SUBSET_META = b'    <meta name="countries-api" content="api/countries">\n'
+# Query parameters besides the store's filters; list values are comma-separated
+SUBSET_PARAMETERS = {'lang', 'ids', 'answers'}
+
+CONTENT_TYPES = {
+    '.js': 'text/javascript; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.svg': 'image/svg+xml',
+    '.bin': 'application/octet-stream',
+}
+
+REASONS = {
+    200: 'OK', 301: 'Moved Permanently', 302: 'Found', 304: 'Not Modified',
+    400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error',
+}
+
+
+def content_type(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in CONTENT_TYPES:
+        return CONTENT_TYPES[extension]
+    return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def accepted_encodings(header):
+    """Encodings from an ``Accept-Encoding`` header with a non-zero q-value."""
+    accepted = set()
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class FileCache:
+    """
+    LRU of file contents bounded by total bytes. Entries are keyed by path and
+    checked against the file's current ``(mtime, size)``, so edits are picked up.
+    """
+
+    def __init__(self, max_bytes=32 << 20):
+        self.max_bytes = max_bytes
+        # Larger files would evict most of the cache; they are read on every request
+        self.max_entry = max_bytes // 8
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, path, stat):
+        """Return ``(body, etag)`` for ``path`` whose ``os.stat`` result is ``stat``."""
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self.entries.get(path)
+        if entry and entry[0] == version:
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return entry[1], entry[2]
+
+        self.misses += 1
+        body = await asyncio.get_running_loop().run_in_executor(None, read_file, path)
+        etag = f'"{hash_bytes(body)[:20]}"'
+        self.discard(path)
+        if len(body) <= self.max_entry:
+            self.entries[path] = (version, body, etag)
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, (_, evicted, _) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+        return body, etag
+
+    def discard(self, path):
+        entry = self.entries.pop(path, None)
+        if entry:
+            self.size -= len(entry[1])
+
+
+def parse_subset_query(query):
+    """``(language, filters, ids, answers)`` from a subset query string; raises ValueError."""
+    parameters = parse_qs(query)
+    unknown = sorted(set(parameters) - SUBSET_PARAMETERS - set(FILTERS))
+    if unknown:
+        raise ValueError(f'Unknown parameters: {", ".join(unknown)}')
+
+    def values(name):
+        return [value for raw in parameters[name] for value in raw.split(',') if value]
+
+    language = parameters.get('lang', [FALLBACK_LANGUAGE])[-1]
+    filters = {name: values(name) for name in FILTERS if name in parameters}
+    ids = values('ids') if 'ids' in parameters else None
+    answers = parameters.get('answers', ['0'])[-1] not in ('', '0', 'false')
+    return language, filters, ids, answers
+
+
+def is_site_path(relative):
+    """Whether ``relative`` (to the served root) is part of the site."""
+    top, _, rest = relative.replace(os.sep, '/').partition('/')
+    if rest:
+        return top in SITE_DIRS
+    return top in SITE_DIRS or top in SITE_FILES or top.endswith('.html')
+
+
+def announce_subset(body):
+    """``body`` of an HTML page with ``SUBSET_META`` added to its head."""
+    return body.replace(b'</head>', SUBSET_META + b'</head>', 1)
+
+
+def is_not_modified(etag, request_headers):
+    if_none_match = request_headers.get('if-none-match', '')
+    return etag in (tag.strip() for tag in if_none_match.split(',')) or if_none_match.strip() == '*'
+
+
+class StaticServer:
+    def __init__(self, root=ROOT, cache=None, quiet=False, store=None):
+        self.root = os.path.realpath(root)
+        self.cache = cache or FileCache()
+        self.quiet = quiet
+        self.store = store
+        self.encodings = [encoding for encoding in ENCODING_PREFERENCE if encoding in available_encodings()]
+
+    def resolve(self, url_path):
+        """Map a URL path below ``PREFIX`` to a file, or return None."""
+        relative = unquote(url_path[len(PREFIX):])
+        parts = [part for part in relative.split('/') if part]
+        # Hidden files (.git, .build-cache) and parent references are never served
+        if any(part.startswith('.') for part in parts):
+            return None
+        path = os.path.realpath(os.path.join(self.root, *parts))
+        if path == self.root:
+            return path
+        if not path.startswith(self.root + os.sep):
+            return None
+        return path if is_site_path(os.path.relpath(path, self.root)) else None
+
+    def pick_encoding(self, path, stat, request_headers):
+        """The best precompressed sibling the client accepts that is not older than ``path``."""
+        accepted = accepted_encodings(request_headers.get('accept-encoding', ''))
+        for encoding in ENCODING_PREFERENCE:
+            if encoding not in accepted:
+                continue
+            sibling = path + SUFFIXES[encoding]
+            try:
+                sibling_stat = os.stat(sibling)
+            except FileNotFoundError:
+                continue
+            if sibling_stat.st_mtime_ns >= stat.st_mtime_ns:
+                return encoding, sibling, sibling_stat
+        return None, path, stat
+
+    def has_siblings(self, path):
+        return any(os.path.exists(path + suffix) for suffix in SUFFIXES.values())
+
+    def announces_subset(self, path):
+        """Whether ``path`` is a game mode page and the store behind its endpoint exists."""
+        return (self.store is not None and path.endswith('.html') and os.path.exists(self.store.path)
+                and os.path.relpath(os.path.dirname(path), self.root).replace(os.sep, '/') in SUBSET_PAGES)
+
+    def compress(self, body, headers, request_headers):
+        """Compress a generated ``body`` on the fly when the client accepts it."""
+        headers['Vary'] = 'Accept-Encoding'
+        accepted = accepted_encodings(request_headers.get('accept-encoding', ''))
+        for encoding in self.encodings:
+            if encoding in accepted:
+                headers['Content-Encoding'] = encoding
+                return compress_bytes(body, encoding)
+        return body
+
+    async def respond(self, method, target, request_headers):
+        """Return ``(status, headers, body)`` for one request."""
+        if method not in ('GET', 'HEAD'):
+            return 405, {'Allow': 'GET, HEAD'}, b''
+
+        url_path = urlsplit(target).path
+        if url_path in ('', '/', PREFIX.rstrip('/')):
+            return 302, {'Location': PREFIX}, b''
+        if not url_path.startswith(PREFIX):
+            return 404, {}, b''
+        endpoint = url_path[len(PREFIX):]
+        if endpoint in SUBSET_ENDPOINTS:
+            return await self.respond_subset(SUBSET_ENDPOINTS[endpoint], urlsplit(target).query, request_headers)
+
+        path = self.resolve(url_path)
+        if path is None:
+            return 404, {}, b''
+        if os.path.isdir(path):
+            if not url_path.endswith('/'):
+                return 301, {'Location': url_path + '/'}, b''
+            path = os.path.join(path, 'index.html')
+        try:
+            stat = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return 404, {}, b''
+
+        announce = self.announces_subset(path)
+        if announce:
+            # The precompressed siblings lack the announcement
+            encoding, served_path, served_stat = None, path, stat
+        else:
+            encoding, served_path, served_stat = self.pick_encoding(path, stat, request_headers)
+        body, etag = await self.cache.get(served_path, served_stat)
+        if announce:
+            body = announce_subset(body)
+            etag = f'"{hash_bytes(body)[:20]}"'
+
+        headers = {
+            'Content-Type': content_type(path),
+            'ETag': etag,
+            'Cache-Control': IMMUTABLE if HASHED_NAME_RE.search(path) else REVALIDATE,
+            'Last-Modified': formatdate(stat.st_mtime, usegmt=True),
+        }
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        if announce or encoding or self.has_siblings(path):
+            headers['Vary'] = 'Accept-Encoding'
+
+        if is_not_modified(etag, request_headers):
+            return 304, headers, b''
+        if announce:
+            body = self.compress(body, headers, request_headers)
+        return 200, headers, body
+
+    async def respond_subset(self, mode_name, query, request_headers):
+        """Query the country store; the compact JSON is compressed on the fly when accepted."""
+        if self.store is None:
+            return 404, {}, b''
+        try:
+            language, filters, ids, answers = parse_subset_query(query)
+            subset = await asyncio.get_running_loop().run_in_executor(
+                None, self.store.subset, mode_name, language, filters, ids, answers)
+        except ValueError:
+            return 400, {}, b''
+        except FileNotFoundError:
+            # The store has not been built yet
+            return 404, {}, b''
+        if subset is None:
+            return 404, {}, b''
+
+        body = dump_json(subset, indent=None)
+        etag = f'"{hash_bytes(body)[:20]}"'
+        headers = {
+            'Content-Type': CONTENT_TYPES['.json'],
+            'ETag': etag,
+            'Cache-Control': REVALIDATE,
+            'Vary': 'Accept-Encoding',
+        }
+        if is_not_modified(etag, request_headers):
+            return 304, headers, b''
+        return 200, headers, self.compress(body, headers, request_headers)
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it closes or asks not to be kept alive."""
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    method, target, version = request_line.decode('latin-1').split()
+                    request_headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        request_headers[name.strip().lower()] = value.strip()
+                except ValueError:
+                    # Malformed or oversized request line/header
+                    await self.send(writer, 'GET', 400, {}, b'', keep_alive=False)
+                    break
+
+                connection = request_headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+                start = time.perf_counter()
+                try:
+                    status, headers, body = await self.respond(method, target, request_headers)
+                except Exception:
+                    print(f'❌ {method} {target} failed:')
+                    traceback.print_exc()
+                    status, headers, body = 500, {}, b''
+                if method not in ('GET', 'HEAD'):
+                    # The request body, if any, was not read
+                    keep_alive = False
+
+                await self.send(writer, method, status, headers, body, keep_alive)
+                if not self.quiet:
+                    print(f'{method} {target} {status} {len(body)} '
+                          f'{(time.perf_counter() - start) * 1000:.1f}ms')
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def send(self, writer, method, status, headers, body, keep_alive):
+        lines = [f'HTTP/1.1 {status} {REASONS[status]}']
+        headers = dict(headers)
+        headers['Content-Length'] = str(len(body))
+        headers['Date'] = formatdate(usegmt=True)
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD' and status != 304:
+            writer.write(body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8000, cache_bytes=32 << 20, quiet=False, store=None):
+    server = StaticServer(cache=FileCache(cache_bytes), quiet=quiet, store=store)
+    listener = await asyncio.start_server(server.handle, host, port)
+    print(f'Serving {ROOT} at http://{host}:{port}{PREFIX}')
+    async with listener:
+        await listener.serve_forever()
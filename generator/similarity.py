@@ -0,0 +1,254 @@
+"""
+Flag similarity: the most confusable flags for every flag, for multiple-choice and hard rounds
+
+Each source SVG is rasterized at a low resolution and reduced to a feature vector: a
+coarse color histogram (which colors, in what proportion) and the mean color of
+every cell of a small grid (where they are). The full similarity matrix is
+computed in one vectorized NumPy pass and the ``TOP_K`` closest flags of each flag
+are written to the game mode's similarity table (generator/tables/similarity.json
+for World Flag Championships), from which the build adds ``similarFlags`` to every
+country in the datasets.
+
+Feature vectors are cached per flag content hash in .build-cache/flag-features/<mode>, so
+a rerun only rasterizes the flags that changed. Rasterizing needs the optional
+``cairosvg`` and ``Pillow`` packages plus NumPy; without them the committed table
+is used as is. ``self_check`` scores striped fixture flags (NumPy only) and checks
+which are closest.
+"""
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .cache import hash_bytes, hash_file
+from .files import read_json, write_json
+from .modes import DEFAULT_MODE
+from .paths import ROOT, SIMILARITY_TABLE
+
+STAGE = 'flag-similarity'
+
+TOP_K = 5
+# Render size; 4:3 like the flags, small enough that details do not matter
+RASTER_WIDTH = 32
+RASTER_HEIGHT = 24
+# Color levels per channel in the histogram (4 -> 64 bins)
+HISTOGRAM_LEVELS = 4
+# Layout grid of mean colors (8x6 cells of 4x4 pixels)
+GRID_COLUMNS = 8
+GRID_ROWS = 6
+# Share of the color histogram in the combined similarity; the rest is layout
+HISTOGRAM_WEIGHT = 0.4
+FEATURE_LENGTH = HISTOGRAM_LEVELS ** 3 + GRID_COLUMNS * GRID_ROWS * 3
+
+# Fixture flags for ``self_check``: equal stripes of RGB colors; IDN and MCO are identical
+SELF_CHECK_FLAGS = {
+    'FRA': ('vertical', [(0, 85, 164), (255, 255, 255), (239, 65, 53)]),
+    'ITA': ('vertical', [(0, 146, 70), (255, 255, 255), (206, 43, 55)]),
+    'IRL': ('vertical', [(22, 155, 98), (255, 255, 255), (255, 136, 62)]),
+    'NLD': ('horizontal', [(174, 28, 40), (255, 255, 255), (33, 70, 139)]),
+    'RUS': ('horizontal', [(255, 255, 255), (0, 57, 166), (213, 43, 30)]),
+    'DEU': ('horizontal', [(0, 0, 0), (221, 0, 0), (255, 206, 0)]),
+    'IDN': ('horizontal', [(206, 17, 38), (255, 255, 255)]),
+    'MCO': ('horizontal', [(206, 17, 38), (255, 255, 255)]),
+}
+# (flag, closer, farther): the same layout in near colors beats a different palette,
+# the same palette turned beats other colors
+SELF_CHECK_ORDER = [('ITA', 'IRL', 'FRA'), ('FRA', 'NLD', 'DEU'), ('IDN', 'MCO', 'ITA'), ('NLD', 'FRA', 'DEU')]
+# Expected start of the most similar list
+SELF_CHECK_TOP = {'ITA': ['IRL', 'FRA'], 'IRL': ['ITA', 'FRA'], 'IDN': ['MCO'], 'MCO': ['IDN']}
+
+
+def dependencies_available():
+    try:
+        import cairosvg  # noqa: F401
+        import numpy  # noqa: F401
+        import PIL  # noqa: F401
+    except (ImportError, OSError):
+        # OSError: cairosvg is installed but the native cairo library is not
+        return False
+    return True
+
+
+def source_path(code, mode=DEFAULT_MODE):
+    return os.path.join(mode.asset_dir, f'{code}.svg')
+
+
+def feature_path(digest, mode=DEFAULT_MODE):
+    return os.path.join(mode.feature_cache_dir, f'{digest[:24]}.npy')
+
+
+def extract_features(job):
+    """Worker entry point: ``(code, svg_path)`` -> ``(code, float32 feature bytes)``."""
+    import cairosvg
+    import numpy
+    from PIL import Image
+
+    code, svg_path = job
+    with open(svg_path, 'rb') as f:
+        png = cairosvg.svg2png(bytestring=f.read(), output_width=RASTER_WIDTH, output_height=RASTER_HEIGHT)
+    with Image.open(io.BytesIO(png)) as image:
+        # Transparent areas count as the white page they are shown on
+        canvas = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        canvas.alpha_composite(image.convert('RGBA'))
+        pixels = numpy.asarray(canvas.convert('RGB'), dtype=numpy.float32)
+    return code, pixel_features(pixels).tobytes()
+
+
+def pixel_features(pixels):
+    """Feature vector of a ``RASTER_HEIGHT`` x ``RASTER_WIDTH`` RGB float array (0-255)."""
+    import numpy
+
+    levels = numpy.minimum((pixels * HISTOGRAM_LEVELS / 256).astype(numpy.int64), HISTOGRAM_LEVELS - 1)
+    bins = (levels[..., 0] * HISTOGRAM_LEVELS + levels[..., 1]) * HISTOGRAM_LEVELS + levels[..., 2]
+    histogram = numpy.bincount(bins.ravel(), minlength=HISTOGRAM_LEVELS ** 3) / bins.size
+
+    cell_height = RASTER_HEIGHT // GRID_ROWS
+    cell_width = RASTER_WIDTH // GRID_COLUMNS
+    grid = pixels.reshape(GRID_ROWS, cell_height, GRID_COLUMNS, cell_width, 3).mean(axis=(1, 3)) / 255
+
+    return numpy.concatenate([histogram, grid.ravel()]).astype(numpy.float32)
+
+
+def load_features(codes, digests, workers=None, mode=DEFAULT_MODE):
+    """Feature matrix with one row per code; only flags missing from the cache are rasterized."""
+    import numpy
+
+    rows = {}
+    jobs = []
+    for code in codes:
+        path = feature_path(digests[code], mode)
+        if os.path.exists(path):
+            rows[code] = numpy.load(path)
+        else:
+            jobs.append((code, source_path(code, mode)))
+
+    os.makedirs(mode.feature_cache_dir, exist_ok=True)
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for code, payload in pool.map(extract_features, jobs, chunksize=8):
+                rows[code] = numpy.frombuffer(payload, dtype=numpy.float32)
+                numpy.save(feature_path(digests[code], mode), rows[code])
+
+    # Drop vectors of flag versions that no longer exist
+    current = {os.path.basename(feature_path(digest, mode)) for digest in digests.values()}
+    for name in os.listdir(mode.feature_cache_dir):
+        if name not in current:
+            os.remove(os.path.join(mode.feature_cache_dir, name))
+
+    return numpy.stack([rows[code] for code in codes]), len(jobs)
+
+
+def similarity_matrix(features):
+    """
+    Pairwise similarity in [0, 1]: histogram intersection blended with one minus the
+    normalized Euclidean distance between the layout grids.
+    """
+    import numpy
+
+    bins = HISTOGRAM_LEVELS ** 3
+    histograms = features[:, :bins].astype(numpy.float64)
+    layouts = features[:, bins:].astype(numpy.float64)
+
+    histogram_similarity = numpy.minimum(histograms[:, None, :], histograms[None, :, :]).sum(axis=2)
+
+    squared = (layouts ** 2).sum(axis=1)
+    distances = squared[:, None] + squared[None, :] - 2 * layouts @ layouts.T
+    layout_similarity = 1 - numpy.sqrt(numpy.maximum(distances, 0) / layouts.shape[1])
+
+    return HISTOGRAM_WEIGHT * histogram_similarity + (1 - HISTOGRAM_WEIGHT) * layout_similarity
+
+
+def build_table(codes, matrix, top_k=TOP_K):
+    """``{code: {'similar': [ids], 'scores': [...]}}`` with the ``top_k`` closest other flags."""
+    import numpy
+
+    matrix = matrix.copy()
+    numpy.fill_diagonal(matrix, -numpy.inf)
+    # Stable sort so ties keep table order and the output is deterministic
+    order = numpy.argsort(-matrix, axis=1, kind='stable')[:, :top_k]
+
+    table = {}
+    for ordinal, code in enumerate(codes):
+        table[code] = {
+            'similar': [codes[other] for other in order[ordinal]],
+            'scores': [round(float(matrix[ordinal, other]), 4) for other in order[ordinal]]
+        }
+    return {'topK': top_k, 'countries': table}
+
+
+def build(manifest, codes, workers=None, force=False, mode=DEFAULT_MODE):
+    """Recompute the mode's similarity table if any flag changed; returns the table's dataset fields."""
+    table_path = mode.table('similarity')
+    digests = {code: hash_file(source_path(code, mode)) for code in codes}
+    digest = hash_bytes(hash_file(__file__), *(f'{code}:{digests[code]}' for code in codes))
+    table_exists = os.path.exists(table_path)
+
+    if force or not table_exists or not manifest.is_fresh(STAGE, 'flags', digest):
+        if dependencies_available():
+            features, rasterized = load_features(codes, digests, workers, mode)
+            write_json(table_path, build_table(codes, similarity_matrix(features)))
+            manifest.record(STAGE, 'flags', digest)
+            print(f'Computed the {len(codes)}x{len(codes)} flag similarity matrix '
+                  f'({rasterized} flags rasterized) into {os.path.relpath(table_path, ROOT)}')
+        elif table_exists:
+            print('⚠️  NumPy/cairosvg/Pillow not installed, keeping the existing flag similarity table '
+                  '(it may be stale)')
+        else:
+            print('⚠️  NumPy/cairosvg/Pillow not installed, skipping flag similarity')
+
+    return load_fields(set(codes), table_path)
+
+
+def load_fields(codes, path=SIMILARITY_TABLE):
+    """``{code: {'similarFlags': [ids]}}`` limited to ``codes``; empty without a table."""
+    if not os.path.exists(path):
+        return {}
+    fields = {}
+    for code, entry in read_json(path)['countries'].items():
+        if code in codes:
+            fields[code] = {'similarFlags': [other for other in entry['similar'] if other in codes]}
+    return fields
+
+
+def stripe_pixels(orientation, colors):
+    """Pixels of a flag of equal ``vertical`` or ``horizontal`` stripes, as ``pixel_features`` takes them."""
+    import numpy
+
+    pixels = numpy.zeros((RASTER_HEIGHT, RASTER_WIDTH, 3), dtype=numpy.float32)
+    size = RASTER_WIDTH if orientation == 'vertical' else RASTER_HEIGHT
+    for index, color in enumerate(colors):
+        stripe = slice(index * size // len(colors), (index + 1) * size // len(colors))
+        if orientation == 'vertical':
+            pixels[:, stripe] = color
+        else:
+            pixels[stripe] = color
+    return pixels
+
+
+def self_check():
+    """Score the fixture flags and check which are closest; returns failure messages."""
+    try:
+        import numpy
+    except (ImportError, OSError):
+        print('⚠️  NumPy not installed, skipping the flag similarity self-check')
+        return []
+
+    codes = list(SELF_CHECK_FLAGS)
+    matrix = similarity_matrix(numpy.stack([pixel_features(stripe_pixels(*SELF_CHECK_FLAGS[code]))
+                                            for code in codes]))
+    failures = []
+    if not numpy.allclose(matrix, matrix.T, atol=1e-6) or not numpy.allclose(numpy.diag(matrix), 1, atol=1e-6):
+        failures.append('similarity: the fixture matrix is not symmetric with ones on the diagonal')
+
+    ordinals = {code: ordinal for ordinal, code in enumerate(codes)}
+    for code, closer, farther in SELF_CHECK_ORDER:
+        near = matrix[ordinals[code], ordinals[closer]]
+        far = matrix[ordinals[code], ordinals[farther]]
+        if not near > far:
+            failures.append(f'similarity: {closer} ({near:.4f}) is not closer to {code} than {farther} ({far:.4f})')
+
+    table = build_table(codes, matrix)['countries']
+    for code, expected in SELF_CHECK_TOP.items():
+        if table[code]['similar'][:len(expected)] != expected:
+            failures.append(f'similarity: most similar to {code} are {table[code]["similar"]}, '
+                            f'expected {expected} first')
+    return failures
@@ -0,0 +1,61 @@
+"""
+Startup bundles: everything a game page needs before the first flag, in one file
+
+``data/startup_<lang>.json`` combines the UI strings from
+assets/translations/<lang>.json, the language list from languages.json and the
+compact dataset as a shared base plus the language's name overlay (see
+``compact.to_base`` and ``compact.to_names``). The translation files and
+datasets stay the sources; js/startupBundle.js hands the parts to the translator
+and ``CountriesData``. The name is fixed so a page can request it without a
+manifest lookup first; the server revalidates it by ETag.
+"""
+import os
+
+from .cache import hash_bytes, hash_file
+from .compact import to_base, to_names
+from .files import read_json, write_json
+from .modes import DEFAULT_MODE
+from .paths import ROOT, TRANSLATIONS_DIR
+
+STAGE = 'startup'
+FORMAT = 'startup/2'
+LANGUAGES_FILE = os.path.join(TRANSLATIONS_DIR, 'languages.json')
+
+
+def translations_path(language):
+    return os.path.join(TRANSLATIONS_DIR, f'{language}.json')
+
+
+def output_path(language, mode=DEFAULT_MODE):
+    return os.path.join(mode.data_dir, f'startup_{language}.json')
+
+
+def build_bundle(language, data):
+    return {
+        'format': FORMAT,
+        'language': language,
+        'languages': read_json(LANGUAGES_FILE),
+        'translations': read_json(translations_path(language)),
+        'countries': {'base': to_base(data), 'names': to_names(data)}
+    }
+
+
+def build(manifest, languages, dataset_path, force=False, mode=DEFAULT_MODE):
+    """Write the startup bundle of each language with a translation file."""
+    module_hash = hash_file(__file__)
+    compact_hash = hash_file(os.path.join(os.path.dirname(__file__), 'compact.py'))
+    for language in languages:
+        if not os.path.exists(translations_path(language)):
+            print(f'⚠️  {language}: no UI translations, skipping the startup bundle')
+            continue
+
+        source = dataset_path(language)
+        path = output_path(language, mode)
+        digest = hash_bytes(module_hash, compact_hash, hash_file(source),
+                            hash_file(translations_path(language)), hash_file(LANGUAGES_FILE))
+        if not force and os.path.exists(path) and manifest.is_fresh(STAGE, language, digest):
+            continue
+
+        write_json(path, build_bundle(language, read_json(source)), indent=None)
+        manifest.record(STAGE, language, digest)
+        print(f'Created {os.path.relpath(path, ROOT)} ({os.path.getsize(path):,} bytes)')
@@ -0,0 +1,243 @@
+"""
+Indexed SQLite country store behind the filtered-subset endpoint of serve.py
+
+The build loads every dataset of every game mode into one SQLite database, one
+row per ``(mode, language, country)``, with an index per filter column. A query
+names a mode, a language and any of the ``FILTERS`` (several values each, OR-ed)
+or explicit ids, and gets back only the matching countries in the compact form
+of generator/compact.py: a base with ids, continents, statuses and flag bundle
+ranges plus a name overlay, which ``CountriesData.merge`` in js/countriesData.js
+joins as usual. Adding a filter dimension is an entry in ``FILTERS``: the store
+gets a column and an index for it and the endpoint accepts it as a parameter.
+"""
+import json
+import os
+import sqlite3
+import threading
+
+from . import compact, countries, modes
+from .cache import hash_bytes, hash_file
+from .files import read_json
+from .paths import COUNTRY_STORE, ROOT, site_path
+
+STAGE = 'country-store'
+SCHEMA_VERSION = 1
+
+# Query parameter -> dataset field; each becomes an indexed column
+FILTERS = {
+    'continent': 'continent',
+    'status': 'status',
+}
+
+# Most ids one query may name (every dataset has fewer countries)
+MAX_IDS = 512
+
+
+def schema():
+    filter_columns = ''.join(f'    {column} TEXT NOT NULL,\n' for column in FILTERS)
+    statements = [
+        'CREATE TABLE datasets (\n'
+        '    mode TEXT NOT NULL,\n'
+        '    language TEXT NOT NULL,\n'
+        '    continents TEXT NOT NULL,\n'
+        '    flag_atlas TEXT,\n'
+        '    PRIMARY KEY (mode, language)\n'
+        ') WITHOUT ROWID',
+        'CREATE TABLE countries (\n'
+        '    mode TEXT NOT NULL,\n'
+        '    language TEXT NOT NULL,\n'
+        '    id TEXT NOT NULL,\n'
+        '    ordinal INTEGER NOT NULL,\n'
+        '    name TEXT NOT NULL,\n'
+        '    normalized_name TEXT,\n'
+        '    alternatives TEXT,\n'
+        f'{filter_columns}'
+        '    flag_bundle TEXT,\n'
+        '    flag_offset INTEGER,\n'
+        '    flag_length INTEGER,\n'
+        '    flag_thumb TEXT,\n'
+        '    PRIMARY KEY (mode, language, id)\n'
+        ') WITHOUT ROWID',
+        'CREATE TABLE answers (\n'
+        '    mode TEXT NOT NULL,\n'
+        '    language TEXT NOT NULL,\n'
+        '    id TEXT NOT NULL,\n'
+        '    answer TEXT NOT NULL,\n'
+        '    PRIMARY KEY (mode, language, id, answer)\n'
+        ') WITHOUT ROWID',
+    ]
+    statements.extend(f'CREATE INDEX countries_{column} ON countries (mode, language, {column})'
+                      for column in FILTERS)
+    return statements
+
+
+def dataset_rows(mode, language, data):
+    """``(dataset row, country rows, answer rows)`` for one dataset."""
+    continents = list(data['continents'])
+    dataset = (mode.name, language, json.dumps(continents, ensure_ascii=False),
+               json.dumps(data['flagAtlas'], ensure_ascii=False) if 'flagAtlas' in data else None)
+
+    country_rows = []
+    for ordinal, country in enumerate(data['countries']):
+        bundle, offset, length = country.get('flagBundle') or (None, None, None)
+        country_rows.append((
+            mode.name, language, country['id'], ordinal, country['name'], country.get('normalizedName'),
+            json.dumps(country['alternatives'], ensure_ascii=False) if 'alternatives' in country else None,
+            *(country[field] for field in FILTERS.values()),
+            bundle, offset, length,
+            json.dumps(country['flagThumb']) if 'flagThumb' in country else None
+        ))
+
+    answer_rows = []
+    for answer, match in data.get('answers', {}).items():
+        for code in match if isinstance(match, list) else [match]:
+            answer_rows.append((mode.name, language, code, answer))
+    return dataset, country_rows, answer_rows
+
+
+def write_store(path, datasets):
+    """Write a fresh store at ``path`` from ``[(mode, language, data)]``."""
+    tmp_path = f'{path}.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    connection = sqlite3.connect(tmp_path)
+    try:
+        for statement in schema():
+            connection.execute(statement)
+        for mode, language, data in datasets:
+            dataset, country_rows, answer_rows = dataset_rows(mode, language, data)
+            connection.execute('INSERT INTO datasets VALUES (?, ?, ?, ?)', dataset)
+            if country_rows:
+                placeholders = ', '.join('?' * len(country_rows[0]))
+                connection.executemany(f'INSERT INTO countries VALUES ({placeholders})', country_rows)
+            connection.executemany('INSERT INTO answers VALUES (?, ?, ?, ?)', answer_rows)
+        connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        connection.commit()
+        connection.execute('ANALYZE')
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+
+
+def build(manifest, path=COUNTRY_STORE, force=False):
+    """
+    Rewrite the store when any dataset of any mode changed. Returns the number of
+    datasets it holds.
+    """
+    sources = []
+    for mode in modes.MODES:
+        if not mode.builds('datasets'):
+            continue
+        for language in countries.available_languages(mode):
+            source = countries.output_path(language, mode)
+            if os.path.exists(source):
+                sources.append((mode, language, source))
+
+    digest = hash_bytes(hash_file(__file__), *(f'{mode.name}/{language}:{hash_file(source)}'
+                                              for mode, language, source in sources))
+    key = site_path(path, ROOT)
+    if not force and os.path.exists(path) and manifest.is_fresh(STAGE, key, digest):
+        return len(sources)
+
+    write_store(path, [(mode, language, read_json(source)) for mode, language, source in sources])
+    manifest.record(STAGE, key, digest)
+    print(f'Created {key} with {len(sources)} datasets ({os.path.getsize(path):,} bytes)')
+    return len(sources)
+
+
+class CountryStore:
+    """
+    Read-only queries against the store. Each thread gets its own connection, so
+    the server can run queries in its executor; a connection is reopened when a
+    rebuild has replaced the file.
+    """
+
+    def __init__(self, path=COUNTRY_STORE):
+        self.path = path
+        self.local = threading.local()
+
+    def connection(self):
+        """Raises FileNotFoundError while the store has not been built."""
+        stat = os.stat(self.path)
+        version = (stat.st_ino, stat.st_mtime_ns)
+        if getattr(self.local, 'version', None) != version:
+            self.close()
+            self.local.connection = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+            self.local.version = version
+        return self.local.connection
+
+    def subset(self, mode_name, language, filters=None, ids=None, answers=False):
+        """
+        Countries of one dataset matching every filter in ``filters`` (``{parameter:
+        [values]}``, see ``FILTERS``) and, if given, one of ``ids``, as
+        ``{'base', 'names'}`` in the compact format; None for an unknown dataset.
+        ``answers`` adds the normalized names, alternatives and answer table the
+        game validates against.
+        """
+        connection = self.connection()
+        dataset = connection.execute('SELECT continents, flag_atlas FROM datasets WHERE mode = ? AND language = ?',
+                                     (mode_name, language)).fetchone()
+        if dataset is None:
+            return None
+
+        conditions = ['mode = ?', 'language = ?']
+        parameters = [mode_name, language]
+        for name, values in (filters or {}).items():
+            if name not in FILTERS:
+                raise ValueError(f'Unknown filter: {name}')
+            conditions.append(f'{name} IN ({", ".join("?" * len(values))})')
+            parameters.extend(values)
+        if ids is not None:
+            if len(ids) > MAX_IDS:
+                raise ValueError(f'At most {MAX_IDS} ids per query')
+            conditions.append(f'id IN ({", ".join("?" * len(ids))})')
+            parameters.extend(ids)
+
+        where = ' AND '.join(conditions)
+        rows = connection.execute(
+            f'SELECT id, name, normalized_name, alternatives, {", ".join(FILTERS)}, '
+            f'flag_bundle, flag_offset, flag_length, flag_thumb '
+            f'FROM countries WHERE {where} ORDER BY ordinal', parameters).fetchall()
+
+        selected = []
+        for code, name, normalized_name, alternatives, *row in rows:
+            country = dict(zip(FILTERS.values(), row[:len(FILTERS)]), id=code, name=name,
+                           flagPath=countries.FLAG_PATH_TEMPLATE.replace('{id}', code))
+            bundle, offset, length, thumb = row[len(FILTERS):]
+            if bundle is not None:
+                country['flagBundle'] = [bundle, offset, length]
+            if thumb is not None:
+                country['flagThumb'] = json.loads(thumb)
+            if answers:
+                country['normalizedName'] = normalized_name
+                if alternatives is not None:
+                    country['alternatives'] = json.loads(alternatives)
+            selected.append(country)
+
+        present = {country['continent'] for country in selected}
+        data = {
+            'continents': {continent: [country['id'] for country in selected if country['continent'] == continent]
+                           for continent in json.loads(dataset[0]) if continent in present},
+            'countries': selected
+        }
+        if dataset[1] is not None:
+            data['flagAtlas'] = json.loads(dataset[1])
+        if answers:
+            # Only answers naming a selected country; an answer shared with others keeps just these
+            table = {}
+            for answer, code in connection.execute(
+                    f'SELECT answer, id FROM answers WHERE mode = ? AND language = ? '
+                    f'AND id IN (SELECT id FROM countries WHERE {where})', [mode_name, language, *parameters]):
+                table.setdefault(answer, []).append(code)
+            data['answers'] = {answer: codes[0] if len(codes) == 1 else sorted(codes)
+                               for answer, codes in sorted(table.items())}
+        return {'base': compact.to_base(data), 'names': compact.to_names(data)}
+
+    def close(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+            self.local.version = None
@@ -0,0 +1,85 @@
+"""
+Type-ahead index: sorted folded terms plus trigram posting lists per language
+
+``data/suggestions_<lang>.json`` is built from the finished country dataset (names and
+alternatives). ``fold`` mirrors ``AnswerValidator.fold`` in js/answerValidator.js.
+"""
+import os
+import re
+import unicodedata
+
+from .cache import hash_bytes, hash_file
+from .files import read_json, write_json
+from .modes import DEFAULT_MODE
+from .paths import ROOT
+
+STAGE = 'suggestions'
+
+COMBINING_MARKS_RE = re.compile('[̀-ͯ]')
+SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+# Letters NFD does not decompose
+LETTER_FOLDS = str.maketrans({'ø': 'o', 'æ': 'ae', 'œ': 'oe', 'ß': 'ss', 'đ': 'd', 'ł': 'l', 'ı': 'i'})
+
+
+def fold(text):
+    """Lowercase, drop accents and turn every run of other characters into one space."""
+    text = unicodedata.normalize('NFD', text.lower())
+    text = COMBINING_MARKS_RE.sub('', text).translate(LETTER_FOLDS)
+    return SEPARATOR_RE.sub(' ', text).strip()
+
+
+def trigrams(term):
+    return {term[i:i + 3] for i in range(len(term) - 2)}
+
+
+def output_path(language, mode=DEFAULT_MODE):
+    return os.path.join(mode.data_dir, f'suggestions_{language}.json')
+
+
+def build_index(countries):
+    """
+    ``ids``/``names`` are indexed by country ordinal; ``terms`` is sorted and
+    ``termIds`` gives each term's ordinal; ``trigrams`` maps a trigram to the
+    ascending indices of the terms containing it.
+    """
+    ids = [country['id'] for country in countries]
+    names = [country['name'] for country in countries]
+
+    pairs = set()
+    for ordinal, country in enumerate(countries):
+        for answer in [country['name']] + country.get('alternatives', []):
+            term = fold(answer)
+            if term:
+                pairs.add((term, ordinal))
+    pairs = sorted(pairs)
+
+    postings = {}
+    for index, (term, _) in enumerate(pairs):
+        for gram in trigrams(term):
+            postings.setdefault(gram, []).append(index)
+
+    return {
+        'ids': ids,
+        'names': names,
+        'terms': [term for term, _ in pairs],
+        'termIds': [ordinal for _, ordinal in pairs],
+        'trigrams': dict(sorted(postings.items()))
+    }
+
+
+def build(manifest, languages, dataset_path, force=False, mode=DEFAULT_MODE):
+    """Write the suggestion index for each language whose dataset changed."""
+    module_hash = hash_file(__file__)
+    for language in languages:
+        source = dataset_path(language)
+        path = output_path(language, mode)
+        digest = hash_bytes(module_hash, hash_file(source))
+        if not force and os.path.exists(path) and manifest.is_fresh(STAGE, language, digest):
+            continue
+
+        index = build_index(read_json(source)['countries'])
+        write_json(path, index, indent=None)
+        manifest.record(STAGE, language, digest)
+        print(f'Created {os.path.relpath(path, ROOT)} with {len(index["terms"])} terms '
+              f'and {len(index["trigrams"])} trigrams')
@@ -0,0 +1,268 @@
+"""
+Shared flag symbols: subtrees repeated across flags hoisted into one library
+
+Many flags carry the same fragments (the Union Jack canton of the British
+territories, the tricolour of the French ones). This stage parses every minified
+flag, finds runs of sibling elements that serialize identically after
+normalization (sorted attributes, lowercase hex colors, ``Z`` as ``z``) in several
+places, and replaces each run with ``<use href="#<symbol id>"/>``. The runs go to
+data/flag-symbols.json once; ``FlagLoader`` adds the symbols a flag uses as
+``<defs>`` before displaying it, so a session downloads each shared fragment once.
+
+Only plain shapes and groups are hoisted: anything with an id, class, url() or
+href reference depends on the rest of its document, as does every element of a
+flag with a stylesheet. The rewritten flags are
+written to .build-cache/flags-shared/<mode>, which the bundles are cut from; the
+standalone files in assets/flags/min stay self-contained. A corpus-wide report of
+the savings is written to .build-cache/reports/<mode>/flag-symbols.json.
+"""
+import gzip
+import os
+import re
+import xml.etree.ElementTree as ET
+
+from . import flags
+from .cache import hash_bytes, hash_file
+from .files import dump_json, write_bytes, write_json
+from .modes import DEFAULT_MODE
+from .paths import ROOT
+
+STAGE = 'flag-symbols'
+LIBRARY_FORMAT = 'flag-symbols/1'
+SYMBOL_PREFIX = 'wqs-'
+
+# Elements that render the same wherever they are referenced from
+SHAPE_TAGS = {'g', 'path', 'rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon'}
+# Containers whose children may be replaced by <use>; clipPath needs direct shape references
+RUN_PARENT_TAGS = {'g', 'defs', 'mask', 'pattern'}
+# Longest run of siblings considered as one symbol
+MAX_RUN = 12
+# Smallest run worth a symbol, in bytes
+MIN_SYMBOL_BYTES = 96
+# Net saving a symbol must bring across the corpus, in bytes
+MIN_SAVING = 64
+
+HEX_COLOR_RE = re.compile(r'#[0-9A-Fa-f]{3,8}\b')
+
+
+def shared_path(code, mode=DEFAULT_MODE):
+    return os.path.join(mode.shared_flag_dir, f'{code}.svg')
+
+
+def use_markup(symbol_id):
+    return f'<use href="#{symbol_id}"/>'
+
+
+def normalize(element, forms):
+    """
+    Canonical markup of ``element`` and its subtree, or None if it cannot be hoisted.
+    Results are memoized in ``forms`` by element identity.
+    """
+    key = id(element)
+    if key in forms:
+        return forms[key]
+
+    form = None
+    tag = flags.local_name(element.tag)
+    hoistable = (flags.namespace(element.tag) in (flags.SVG_NS, None) and tag in SHAPE_TAGS
+                 and not (element.text and element.text.strip()))
+    attrs = []
+    if hoistable:
+        for name, value in sorted(element.attrib.items()):
+            if name in ('id', 'class') or flags.local_name(name) == 'href' or 'url(' in value:
+                hoistable = False
+                break
+            value = HEX_COLOR_RE.sub(lambda match: match.group(0).lower(), ' '.join(value.split()))
+            if name == 'd':
+                value = value.replace('Z', 'z')
+            attrs.append(f' {flags.qualified(name)}="{flags.escape(value, quote=True)}"')
+
+    if hoistable:
+        children = []
+        for child in element:
+            child_form = normalize(child, forms)
+            if child_form is None or (child.tail and child.tail.strip()):
+                children = None
+                break
+            children.append(child_form)
+        if children is not None:
+            form = (f'<{tag}{"".join(attrs)}>{"".join(children)}</{tag}>' if children
+                    else f'<{tag}{"".join(attrs)}/>')
+
+    forms[key] = form
+    return form
+
+
+def run_parents(element):
+    """The root and its groups, outside clip paths (which may only reference shapes directly)."""
+    yield element
+    for child in element:
+        if flags.local_name(child.tag) in RUN_PARENT_TAGS:
+            yield from run_parents(child)
+
+
+def find_runs(roots):
+    """
+    ``{markup: [(code, parent, start, length)]}`` for every hoistable run of
+    siblings found more than once. A run can only repeat if the run one sibling
+    shorter does, so runs grow a sibling at a time from the repeated ones, keyed by
+    ``(key of the shorter run, last member)``; only those long enough for a symbol
+    have their markup joined.
+    """
+    forms = {}
+    level = {}
+    for code, root in roots.items():
+        if any(flags.local_name(element.tag) == 'style' for element in root.iter()):
+            # Selectors would match the hoisted copies differently
+            continue
+        for parent in run_parents(root):
+            tokens = [normalize(child, forms) if not (child.tail and child.tail.strip()) else None
+                      for child in parent]
+            for start, token in enumerate(tokens):
+                if token is not None:
+                    level.setdefault(token, []).append((code, parent, start, tokens))
+
+    runs = {}
+    for length in range(1, MAX_RUN + 1):
+        longer = {}
+        for key, occurrences in level.items():
+            if len(occurrences) < 2:
+                continue
+            _, _, start, tokens = occurrences[0]
+            markup = ''.join(tokens[start:start + length])
+            if len(markup) >= MIN_SYMBOL_BYTES:
+                runs[markup] = [(code, parent, start, length) for code, parent, start, _ in occurrences]
+            if length == MAX_RUN:
+                continue
+            for occurrence in occurrences:
+                _, _, start, tokens = occurrence
+                if start + length < len(tokens) and tokens[start + length] is not None:
+                    longer.setdefault((key, tokens[start + length]), []).append(occurrence)
+        level = longer
+    return runs
+
+
+def saving(markup, symbol_id, uses):
+    wrapper = len(f'<g id="{symbol_id}"></g>')
+    return (uses - 1) * len(markup.encode('utf-8')) - uses * len(use_markup(symbol_id)) - wrapper
+
+
+def choose_symbols(runs):
+    """
+    Pick runs greedily by estimated saving, skipping occurrences that overlap a run
+    already hoisted. Returns ``({symbol id: markup}, [(code, parent, start, length, symbol id)])``.
+    """
+    candidates = []
+    for markup, occurrences in runs.items():
+        if len(occurrences) > 1:
+            symbol_id = SYMBOL_PREFIX + hash_bytes(markup)[:8]
+            candidates.append((-saving(markup, symbol_id, len(occurrences)), markup, symbol_id))
+    candidates.sort()
+
+    claimed = set()
+    symbols = {}
+    replacements = []
+    for estimate, markup, symbol_id in candidates:
+        if -estimate < MIN_SAVING:
+            break
+        free = []
+        for code, parent, start, length in runs[markup]:
+            elements = [node for child in parent[start:start + length] for node in child.iter()]
+            if not any(id(node) in claimed for node in elements):
+                free.append((code, parent, start, length, elements))
+                # Mark right away so overlapping occurrences of the same run are skipped
+                claimed.update(id(node) for node in elements)
+        if len(free) > 1 and saving(markup, symbol_id, len(free)) >= MIN_SAVING:
+            symbols[symbol_id] = markup
+            replacements.extend((code, parent, start, length, symbol_id) for code, parent, start, length, _ in free)
+        else:
+            for *_, elements in free:
+                claimed.difference_update(id(node) for node in elements)
+    return symbols, replacements
+
+
+def apply_replacements(replacements):
+    """Replace each chosen run with a ``<use>``; later runs first so indices stay valid."""
+    for code, parent, start, length, symbol_id in sorted(replacements, key=lambda item: -item[2]):
+        use = ET.Element(f'{{{flags.SVG_NS}}}use', {'href': f'#{symbol_id}'})
+        use.tail = parent[start + length - 1].tail
+        parent[start:start + length] = [use]
+
+
+def gzip_size(payload):
+    return len(gzip.compress(payload, compresslevel=9, mtime=0))
+
+
+def build(manifest, flag_ids, flag_file, force=False, mode=DEFAULT_MODE):
+    """
+    Hoist shared subtrees out of ``flag_file(code)`` for every flag if any changed,
+    writing the symbol library and the rewritten flags. Returns the path function
+    the bundles should read flags from.
+    """
+    def output_path(code):
+        return shared_path(code, mode)
+
+    codes = sorted(flag_ids)
+    digest = hash_bytes(hash_file(__file__), hash_file(flags.__file__),
+                        *(f'{code}:{hash_file(flag_file(code))}' for code in codes))
+    outputs_exist = os.path.exists(mode.symbol_library) and all(os.path.exists(output_path(code)) for code in codes)
+    if not force and outputs_exist and manifest.is_fresh(STAGE, 'flags', digest):
+        return output_path
+
+    sources = {}
+    roots = {}
+    for code in codes:
+        with open(flag_file(code), 'rb') as f:
+            sources[code] = f.read()
+        roots[code] = ET.fromstring(sources[code])
+
+    symbols, replacements = choose_symbols(find_runs(roots))
+    apply_replacements(replacements)
+
+    os.makedirs(mode.shared_flag_dir, exist_ok=True)
+    outputs = {code: flags.serialize_document(root) for code, root in roots.items()}
+    for code, payload in outputs.items():
+        write_bytes(output_path(code), payload)
+    for name in os.listdir(mode.shared_flag_dir):
+        if name.endswith('.svg') and name[:-len('.svg')] not in outputs:
+            os.remove(os.path.join(mode.shared_flag_dir, name))
+
+    library = dump_json({'format': LIBRARY_FORMAT, 'symbols': dict(sorted(symbols.items()))}, indent=None)
+    write_bytes(mode.symbol_library, library)
+    manifest.record(STAGE, 'flags', digest)
+
+    uses = {}
+    for code, _, _, _, symbol_id in replacements:
+        uses.setdefault(symbol_id, []).append(code)
+    before = sum(len(payload) for payload in sources.values())
+    after = sum(len(payload) for payload in outputs.values())
+    # Most flags use no symbol and come out unchanged; compress those once
+    before_gzip = after_gzip = 0
+    for code, payload in outputs.items():
+        size = gzip_size(sources[code])
+        before_gzip += size
+        after_gzip += size if payload == sources[code] else gzip_size(payload)
+    library_gzip = gzip_size(library)
+    write_json(os.path.join(mode.reports_dir, 'flag-symbols.json'), {
+        'symbols': len(symbols),
+        'uses': len(replacements),
+        'flagsBefore': before,
+        'flagsAfter': after,
+        'library': len(library),
+        'saved': before - after - len(library),
+        'flagsBeforeGzip': before_gzip,
+        'flagsAfterGzip': after_gzip,
+        'libraryGzip': library_gzip,
+        'savedGzip': before_gzip - after_gzip - library_gzip,
+        'bySymbol': {
+            symbol_id: {'bytes': len(symbols[symbol_id].encode('utf-8')), 'flags': sorted(set(users))}
+            for symbol_id, users in sorted(uses.items(), key=lambda item: -len(item[1]))
+        }
+    })
+
+    flags_using = len({code for code, *_ in replacements})
+    print(f'Hoisted {len(symbols)} shared subtrees from {flags_using} flags into '
+          f'{os.path.relpath(mode.symbol_library, ROOT)}')
+    print(f'  {before:,} -> {after:,} + {len(library):,} library bytes (saved {before - after - len(library):,}; '
+          f'{before_gzip - after_gzip - library_gzip:,} per-file gzipped)')
+    return output_path
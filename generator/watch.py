@@ -0,0 +1,218 @@
+"""
+Watch mode: rebuild the outputs affected by changes to assets, tables and pages
+
+Events come from the optional ``watchdog`` package, or from polling file stats
+when it is not installed. A burst of events is debounced into one batch, which
+is then mapped to the stages it touches (see ``classify``).
+"""
+import os
+import queue
+import time
+
+from . import compress, countries, flags, modes, pages, pipeline, precache
+from .paths import COUNTRY_TABLE, ROOT, TABLES_DIR, TRANSLATIONS_DIR
+
+# Quiet period that ends a burst of events, and the polling interval without watchdog
+DEBOUNCE = 0.15
+POLL_INTERVAL = 0.1
+
+# Page scripts and stylesheets; the pages themselves change on every bundle, so they are not watched
+PAGE_SOURCE_DIRS = tuple(os.path.join(directory, name) for directory in pages.PAGE_DIRS for name in ('js', 'css'))
+
+
+def watched_dirs(selected_modes=modes.MODES):
+    """Asset and table directories of the modes plus the shared sources, without nested duplicates."""
+    directories = {TABLES_DIR, TRANSLATIONS_DIR, *PAGE_SOURCE_DIRS}
+    for mode in selected_modes:
+        if mode.asset_dir:
+            directories.add(mode.asset_dir)
+        for name in ('names', 'alternatives', 'difficulty'):
+            table = mode.table(name)
+            if table:
+                directories.add(table if name in ('names', 'alternatives') else os.path.dirname(table))
+    return tuple(sorted(directory for directory in directories
+                        if not any(directory.startswith(other + os.sep) for other in directories)))
+
+
+WATCHED_DIRS = watched_dirs()
+
+
+class PollingSource:
+    """Reports paths whose size or modification time changed between scans."""
+
+    def __init__(self, directories=WATCHED_DIRS):
+        self.directories = directories
+        self.snapshot = self.scan()
+
+    def scan(self):
+        stats = {}
+        for directory in self.directories:
+            for parent, _, names in os.walk(directory):
+                for name in names:
+                    path = os.path.join(parent, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def wait(self, timeout=None):
+        """Block until something changed (or ``timeout`` elapsed) and return the changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = self.scan()
+            changed = {path for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+class WatchdogSource:
+    """Same interface as ``PollingSource``, fed by watchdog's native observers."""
+
+    def __init__(self, directories=WATCHED_DIRS):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        self.directories = directories
+        events = self.events = queue.Queue()
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if not event.is_directory:
+                    events.put(event.src_path)
+                    if getattr(event, 'dest_path', None):
+                        events.put(event.dest_path)
+
+        self.observer = Observer()
+        for directory in directories:
+            self.observer.schedule(Handler(), directory, recursive=True)
+        self.observer.start()
+
+    def wait(self, timeout=None):
+        try:
+            changed = {self.events.get(timeout=timeout)}
+        except queue.Empty:
+            return set()
+        while not self.events.empty():
+            changed.add(self.events.get_nowait())
+        return changed
+
+    def close(self):
+        self.observer.stop()
+        self.observer.join()
+
+
+def open_source():
+    try:
+        import watchdog  # noqa: F401
+    except ImportError:
+        print('⚠️  watchdog is not installed, polling for changes instead')
+        return PollingSource()
+    return WatchdogSource()
+
+
+def next_batch(source):
+    """Wait for a change, then keep collecting until ``DEBOUNCE`` passes without events."""
+    paths = source.wait()
+    while True:
+        more = source.wait(DEBOUNCE)
+        if not more:
+            return {os.path.abspath(path) for path in paths}
+        paths |= more
+
+
+def classify(paths, selected_modes=modes.MODES):
+    """
+    Map changed paths to ``(changed_modes, languages, pages_changed)``. A mode's assets
+    and difficulty table feed every dataset of that mode (the country table those of every
+    mode), as do the fallback language's names and the language list in the startup
+    bundles; ``languages`` is then None (all of them). Otherwise it is the set of
+    languages whose tables or UI translations changed. ``pages_changed`` is set when a
+    page script or stylesheet changed and the bundles need rebuilding.
+    """
+    changed_modes = set()
+    pages_changed = False
+    languages = set()
+    name_dirs = {mode.table('names') for mode in selected_modes}
+    language_dirs = name_dirs | {mode.table('alternatives') for mode in selected_modes} | {TRANSLATIONS_DIR}
+    for path in paths:
+        directory, name = os.path.split(path)
+        if any(path.startswith(source_dir + os.sep) for source_dir in PAGE_SOURCE_DIRS) and \
+                name.endswith(('.js', '.css')):
+            pages_changed = True
+        elif path == COUNTRY_TABLE:
+            changed_modes.update(selected_modes)
+        elif directory in language_dirs and name.endswith('.json'):
+            language = name[:-len('.json')]
+            if directory in name_dirs and language == countries.FALLBACK_LANGUAGE:
+                languages = None
+            elif directory == TRANSLATIONS_DIR and name == 'languages.json':
+                languages = None
+            elif languages is not None:
+                languages.add(language)
+        else:
+            changed_modes.update(mode for mode in selected_modes
+                                 if (directory == mode.asset_dir and name.endswith('.svg'))
+                                 or path == mode.table('difficulty'))
+
+    if changed_modes:
+        languages = None
+    return changed_modes, languages, pages_changed
+
+
+def rebuild(manifest, shared, paths, selected=None, precision=flags.DEFAULT_PRECISION, workers=None,
+            compact_outputs=True, compress_outputs=False, bundle_pages=True):
+    """Rerun the stages ``paths`` affect. Returns the (possibly refreshed) ``{mode: inputs}``."""
+    changed_modes, languages, pages_changed = classify(paths, list(shared))
+    if not changed_modes and languages == set() and not pages_changed:
+        return shared
+
+    if changed_modes:
+        shared = dict(shared)
+        shared.update(pipeline.build_modes(manifest, [mode for mode in shared if mode in changed_modes],
+                                           precision=precision, workers=workers))
+    targets = None if languages is None else sorted(languages)
+    if selected:
+        targets = [language for language in (selected if targets is None else targets) if language in selected]
+    if targets is None or targets:
+        pipeline.build_languages(manifest, shared, languages=targets, compact_outputs=compact_outputs,
+                                 workers=workers)
+    if pages_changed:
+        pages.build(manifest, bundle=bundle_pages)
+    precache.build(shared)
+    if compress_outputs:
+        compress.build(manifest, workers=workers)
+    manifest.save()
+    return shared
+
+
+def run(manifest, shared, languages=None, precision=flags.DEFAULT_PRECISION, workers=None,
+        compact_outputs=True, compress_outputs=False, bundle_pages=True):
+    """Watch until interrupted, rebuilding after each debounced batch of changes."""
+    source = open_source()
+    print(f'Watching {", ".join(os.path.relpath(d, ROOT) for d in source.directories)} (Ctrl+C to stop)')
+    try:
+        while True:
+            paths = next_batch(source)
+            start = time.perf_counter()
+            names = sorted(os.path.relpath(path, ROOT) for path in paths)
+            print(f'\n{len(names)} changed: {", ".join(names[:5])}{" ..." if len(names) > 5 else ""}')
+            try:
+                shared = rebuild(manifest, shared, paths, languages, precision, workers,
+                                 compact_outputs, compress_outputs, bundle_pages)
+            except Exception as error:
+                # A half-saved table should not end the session; the next save retries
+                print(f'⚠️  Rebuild failed: {error}')
+                continue
+            print(f'Done in {(time.perf_counter() - start) * 1000:.0f} ms')
+    except KeyboardInterrupt:
+        print('\nStopped watching')
+    finally:
+        source.close()
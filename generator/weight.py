@@ -0,0 +1,246 @@
+"""
+Transfer weight of each HTML entry point, checked against byte and request budgets
+
+A page's static dependencies come from its markup: stylesheets and scripts
+without ``async``/``defer`` block the first render, icons and images do not.
+Data fetched by the page scripts is not visible in the markup, so ``PAGES`` names
+the known fetches of each page: the startup bundle or translations it needs before
+anything shows (critical) and what a session adds later, such as the flag bundles
+of the selected continents and the shared flag symbols. Pages that register the
+service worker (offline.js, on its own or inside a page bundle) also cost sw.js
+and the default precache groups in the background, reported separately as
+``precache``.
+
+Every file counts as one request and is compressed on its own, as it is served.
+Metrics are flat names such as ``critical.gzip.bytes`` or ``session.requests``;
+benchmarks/budgets.json caps them per page (``*`` applies to every page).
+"""
+import os
+from html.parser import HTMLParser
+
+from . import atlas, bundles, countries, pages, startup
+from .compress import available_encodings, compress_bytes
+from .files import read_json
+from .paths import (GAME_DIR, PRECACHE_MANIFEST, ROOT, SERVICE_WORKER, SYMBOL_LIBRARY, TRANSLATIONS_DIR,
+                    WEIGHT_BUDGETS, site_path)
+from .server import PREFIX
+
+# Known fetches per entry point (paths relative to ROOT), beyond what the markup references
+PAGES = {
+    'index.html': {'critical': ('translations', 'languages'), 'session': ()},
+    site_path(os.path.join(GAME_DIR, 'index.html'), ROOT): {'critical': ('startup',), 'session': ('atlas',)},
+    site_path(os.path.join(GAME_DIR, 'game.html'), ROOT): {'critical': ('startup',), 'session': ('flags',)},
+    site_path(os.path.join(GAME_DIR, 'results.html'), ROOT): {'critical': ('translations',), 'session': ('flags',)},
+}
+
+# Script that registers the service worker
+OFFLINE_SCRIPT = os.path.join(ROOT, 'js', 'shared', 'offline.js')
+
+# Phases in the order they accumulate: the session includes the critical path
+PHASES = ('critical', 'session', 'precache')
+
+
+class DependencyParser(HTMLParser):
+    """Collects ``(url, blocking)`` for the stylesheets, scripts, icons and images of a page."""
+
+    def __init__(self):
+        super().__init__()
+        self.dependencies = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'script' and attrs.get('src'):
+            blocking = 'async' not in attrs and 'defer' not in attrs and attrs.get('type') != 'module'
+            self.dependencies.append((attrs['src'], blocking))
+        elif tag == 'link' and attrs.get('href'):
+            rel = (attrs.get('rel') or '').lower().split()
+            if 'stylesheet' in rel:
+                self.dependencies.append((attrs['href'], True))
+            elif 'icon' in rel or 'preload' in rel:
+                self.dependencies.append((attrs['href'], False))
+        elif tag == 'img' and attrs.get('src'):
+            self.dependencies.append((attrs['src'], False))
+
+
+def resolve(page_path, url):
+    """Local file for a URL referenced from ``page_path``, or None for data and external URLs."""
+    url = url.split('#', 1)[0].split('?', 1)[0]
+    if not url or url.startswith(('data:', 'http:', 'https:', '//')):
+        return None
+    if url.startswith(PREFIX):
+        return os.path.normpath(os.path.join(ROOT, url[len(PREFIX):]))
+    if url.startswith('/'):
+        return None
+    return os.path.normpath(os.path.join(os.path.dirname(page_path), url))
+
+
+def static_dependencies(page_path):
+    """``(blocking paths, other paths)`` referenced by the page's markup, in document order."""
+    parser = DependencyParser()
+    with open(page_path, 'r', encoding='utf-8') as f:
+        parser.feed(f.read())
+
+    blocking, other = [], []
+    for url, is_blocking in parser.dependencies:
+        path = resolve(page_path, url)
+        if path is not None:
+            (blocking if is_blocking else other).append(path)
+    return blocking, other
+
+
+def flag_dependencies(data, continents):
+    """Bundles of the selected continents, plus the symbol library if a bundled flag uses it."""
+    selected = [country for country in data['countries'] if country['continent'] in continents]
+    paths = {bundles.bundle_path(continent) for continent in continents if continent in data['continents']}
+    paths = sorted(path for path in paths if os.path.exists(path))
+
+    for country in selected:
+        if 'flagBundle' not in country:
+            continue
+        bundle, offset, length = country['flagBundle']
+        with open(os.path.join(GAME_DIR, bundle), 'rb') as f:
+            f.seek(offset)
+            if b'href="#wqs-' in f.read(length):
+                paths.append(SYMBOL_LIBRARY)
+                break
+    return paths
+
+
+def fetch_dependencies(kind, language, data, continents):
+    if kind == 'translations':
+        return [os.path.join(TRANSLATIONS_DIR, f'{language}.json')]
+    if kind == 'languages':
+        return [os.path.join(TRANSLATIONS_DIR, 'languages.json')]
+    if kind == 'startup':
+        return [startup.output_path(language)]
+    if kind == 'atlas':
+        return [atlas.atlas_path(1)] if 'flagAtlas' in data and os.path.exists(atlas.atlas_path(1)) else []
+    if kind == 'flags':
+        return flag_dependencies(data, continents)
+    raise ValueError(f'Unknown fetch kind: {kind}')
+
+
+def precache_dependencies():
+    """sw.js and the files it precaches on install."""
+    if not os.path.exists(PRECACHE_MANIFEST):
+        return [SERVICE_WORKER]
+    manifest = read_json(PRECACHE_MANIFEST)
+    groups = set(manifest['defaultGroups'])
+    return [SERVICE_WORKER] + [os.path.join(ROOT, path) for path, entry in manifest['entries'].items()
+                               if entry['group'] in groups]
+
+
+def page_phases(page, language, data, continents):
+    """``{phase: [paths]}`` for one entry point; each path appears in its earliest phase only."""
+    page_path = os.path.join(ROOT, page)
+    fetches = PAGES[page]
+    blocking, other = static_dependencies(page_path)
+
+    phases = {
+        'critical': [page_path] + blocking + [path for kind in fetches['critical']
+                                              for path in fetch_dependencies(kind, language, data, continents)],
+        'session': other + [path for kind in fetches['session']
+                            for path in fetch_dependencies(kind, language, data, continents)],
+        'precache': (precache_dependencies()
+                     if OFFLINE_SCRIPT in blocking + other + pages.page_sources(page_path) else []),
+    }
+
+    seen = set()
+    for phase in PHASES:
+        unique = []
+        for path in phases[phase]:
+            if path not in seen:
+                seen.add(path)
+                unique.append(path)
+        phases[phase] = unique
+    return phases
+
+
+def file_sizes(path, encodings, sizes):
+    """``{'raw': bytes, encoding: bytes}`` for ``path``, memoized in ``sizes``."""
+    if path not in sizes:
+        with open(path, 'rb') as f:
+            payload = f.read()
+        sizes[path] = {'raw': len(payload)}
+        sizes[path].update((encoding, len(compress_bytes(payload, encoding))) for encoding in encodings)
+    return sizes[path]
+
+
+def measure(language=countries.FALLBACK_LANGUAGE, continents=None):
+    """
+    Returns ``(report, missing)``: ``{page: {'metrics': {...}, 'files': {phase: [...]}}}``
+    and the ``(page, path)`` dependencies that do not exist. The session selects
+    ``continents`` (default: every continent); session metrics include the critical path.
+    """
+    data = read_json(countries.output_path(language))
+    continents = list(continents or data['continents'])
+    encodings = available_encodings()
+    sizes = {}
+    missing = []
+
+    report = {}
+    for page in PAGES:
+        phases = page_phases(page, language, data, continents)
+        metrics = {}
+        files = {}
+        totals = {'requests': 0, 'raw': 0, **{encoding: 0 for encoding in encodings}}
+        for phase in PHASES:
+            phase_totals = {'requests': 0, 'raw': 0, **{encoding: 0 for encoding in encodings}}
+            files[phase] = []
+            for path in phases[phase]:
+                if not os.path.exists(path):
+                    missing.append((page, site_path(path, ROOT)))
+                    continue
+                file_size = file_sizes(path, encodings, sizes)
+                files[phase].append({'path': site_path(path, ROOT), **file_size})
+                phase_totals['requests'] += 1
+                for key, value in file_size.items():
+                    phase_totals[key] += value
+
+            # The precache runs in the background; the session includes the critical path
+            if phase != 'precache':
+                for key, value in phase_totals.items():
+                    totals[key] += value
+                phase_totals = dict(totals)
+            metrics[f'{phase}.requests'] = phase_totals['requests']
+            for key in ('raw',) + tuple(encodings):
+                metrics[f'{phase}.{key}.bytes'] = phase_totals[key]
+
+        report[page] = {'metrics': metrics, 'files': files}
+    return report, missing
+
+
+def load_budgets(path=WEIGHT_BUDGETS):
+    return read_json(path) if os.path.exists(path) else {}
+
+
+def check_budgets(report, budgets):
+    """``[(page, metric, value, budget)]`` for every metric over its budget."""
+    failures = []
+    for page, entry in report.items():
+        limits = dict(budgets.get('*', {}))
+        limits.update(budgets.get(page, {}))
+        for metric, budget in sorted(limits.items()):
+            value = entry['metrics'].get(metric)
+            if value is not None and value > budget:
+                failures.append((page, metric, value, budget))
+    return failures
+
+
+def unchecked_budgets(report, budgets):
+    """Budget metrics no page reports (e.g. brotli sizes without the brotli package)."""
+    reported = {metric for entry in report.values() for metric in entry['metrics']}
+    return sorted({metric for limits in budgets.values() for metric in limits} - reported)
+
+
+def print_failures(failures):
+    for page, metric, value, budget in failures:
+        print(f'❌ {page}: {metric} = {value:,} over budget {budget:,}')
+
+
+def check(budgets_path=WEIGHT_BUDGETS):
+    """Measure every page with the default selection and return the budget failures."""
+    report, _ = measure()
+    failures = check_budgets(report, load_budgets(budgets_path))
+    print_failures(failures)
+    return failures
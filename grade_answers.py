@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Grade logged player answers under two versions of the answer rules.
+
+Replays (answer, country id, language) pairs from JSONL logs against the
+generated datasets with the same normalization and matching as
+GameLogic.validateAnswer, once per rule version, and reports every verdict that
+changes: how many answers would become correct or incorrect, per country, and
+the flipped answers by frequency. A version is a built-in name (current, exact)
+or a JSON file of rule option overrides, e.g. {"wordMatchRatio": 1.0} or
+{"alternativesDir": "path/to/alternatives"} to try edited alternative names.
+"""
+import argparse
+import os
+import time
+
+from generator import grading
+from generator.files import write_json
+from generator.paths import REPORTS_DIR, ROOT
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Grade logged answers under two rule versions and diff the verdicts')
+    parser.add_argument('paths', nargs='+', metavar='ANSWERS.jsonl',
+                        help='one {"answer", "id", "language"} object per line (.gz allowed)')
+    parser.add_argument('--old', default='current',
+                        help='baseline rule version or JSON overrides file (default: current)')
+    parser.add_argument('--new', required=True,
+                        help='candidate rule version or JSON overrides file')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--output', default=os.path.join(REPORTS_DIR, 'answer-grading.json'),
+                        help='report path (default: .build-cache/reports/answer-grading.json)')
+    parser.add_argument('--top', type=int, default=20,
+                        help='flipped answers to print (default: 20)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    old, new = grading.load_rules(args.old), grading.load_rules(args.new)
+
+    start = time.perf_counter()
+    totals, changes, skipped = grading.compare(args.paths, old, new, workers=args.workers)
+    report = grading.build_report(args.old, args.new, totals, changes, skipped)
+    elapsed = time.perf_counter() - start
+    write_json(args.output, report)
+
+    print(f'Graded {report["graded"]:,} answers in {elapsed:.1f} s ({args.old} -> {args.new})')
+    print(f'  Unchanged: {report["unchanged"]["correct"]:,} correct, {report["unchanged"]["incorrect"]:,} incorrect')
+    print(f'  Became correct: {report["becameCorrect"]:,}')
+    print(f'  Became incorrect: {report["becameIncorrect"]:,}')
+    if skipped:
+        print(f'⚠️  Skipped {skipped:,} malformed lines, unknown ids or languages without a dataset')
+    for change in report['changes'][:args.top]:
+        print(f'  {change["count"]:>8,}  {change["language"]} {change["id"]}  '
+              f'"{change["answer"]}" -> {change["verdict"]}')
+    print(f'Report written to {os.path.relpath(args.output, ROOT)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -29,17 +29,9 @@ class SettingsMenu {
         // Load available languages
         let languages = [];
         try {
-            const response = await fetch('/world-quiz-championships/assets/translations/languages.json');
-            if (response.ok) {
-                languages = await response.json();
-            } else {
-                // Fallback to hardcoded if fetch fails
-                languages = [
-                    { "code": "en", "name": "English", "flag": "🇺🇸" },
-                    { "code": "no", "name": "Norsk", "flag": "🇳🇴" }
-                ];
-            }
+            languages = await translator.loadLanguages();
         } catch (error) {
+            // Fallback to hardcoded if fetch fails
             console.error('Failed to load languages:', error);
             languages = [
                 { "code": "en", "name": "English", "flag": "🇺🇸" },
@@ -0,0 +1,41 @@
+/**
+ * Offline support for World Quiz Championships
+ * Registers the generated service worker (sw.js) and asks it to keep the flags of the
+ * continents being played, so repeat games load without network round trips
+ */
+
+const OfflineCache = {
+    scriptUrl: '/world-quiz-championships/sw.js',
+
+    /**
+     * Register the service worker where supported
+     * @returns {Promise<ServiceWorkerRegistration|null>} Registration, or null when unavailable
+     */
+    register: function() {
+        if (!('serviceWorker' in navigator)) {
+            return Promise.resolve(null);
+        }
+        return navigator.serviceWorker.register(this.scriptUrl).catch(error => {
+            console.warn('Service worker registration failed:', error);
+            return null;
+        });
+    },
+
+    /**
+     * Precache the flag bundles of the given continents
+     * @param {Array<string>} continents - Continent names as used in the countries data
+     */
+    precacheContinents: function(continents) {
+        if (!('serviceWorker' in navigator) || continents.length === 0) return;
+        navigator.serviceWorker.ready.then(registration => {
+            if (registration.active) {
+                registration.active.postMessage({ type: 'precache-continents', continents: continents });
+            }
+        });
+    }
+};
+
+OfflineCache.register();
+
+// Export for use in other modules
+window.OfflineCache = OfflineCache;
@@ -7,6 +7,17 @@ class TranslationService {
     constructor() {
         this.currentLanguage = localStorage.getItem('wqc-language') || 'en';
         this.translations = {};
+        this.languages = null;
+        this.startupBundle = null;
+    }
+
+    // Take the UI strings and language list from a startup bundle
+    // ({ language, languages, translations }) instead of fetching their files
+    useStartupBundle(bundle) {
+        this.startupBundle = bundle.catch(error => {
+            console.warn('Startup bundle unavailable, loading translation files:', error);
+            return null;
+        });
     }
 
     getCurrentLanguage() {
@@ -34,6 +45,12 @@ class TranslationService {
     async loadTranslations(language) {
         if (this.translations[language]) return this.translations[language];
 
+        const bundle = this.startupBundle && await this.startupBundle;
+        if (bundle && bundle.language === language) {
+            this.translations[language] = bundle.translations;
+            return this.translations[language];
+        }
+
         const response = await fetch(`/world-quiz-championships/assets/translations/${language}.json`);
         if (!response.ok) {
             throw new Error(`Failed to load translations for ${language}`);
@@ -42,6 +59,23 @@ class TranslationService {
         return this.translations[language];
     }
 
+    async loadLanguages() {
+        if (this.languages) return this.languages;
+
+        const bundle = this.startupBundle && await this.startupBundle;
+        if (bundle) {
+            this.languages = bundle.languages;
+            return this.languages;
+        }
+
+        const response = await fetch('/world-quiz-championships/assets/translations/languages.json');
+        if (!response.ok) {
+            throw new Error('Failed to load languages');
+        }
+        this.languages = await response.json();
+        return this.languages;
+    }
+
     updatePageLanguage() {
         // Update HTML lang attribute
         document.documentElement.lang = this.currentLanguage === 'no' ? 'nb' : 'en';
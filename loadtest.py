@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Simulate concurrent players against a running server (see serve.py).
+
+Every virtual player replays a game session in the order the pages request it:
+languages.json, the translation file, the countries data, then N flags with a
+think time between questions. Throughput, p50/p95/p99 latency per request kind
+and bytes per session are printed, and optionally saved as JSON so runs with
+different --data-format/--flag-format settings can be compared.
+
+Example:
+    python serve.py --quiet --port 8000 &
+    python loadtest.py --players 2000 --flag-format min
+"""
+import argparse
+import asyncio
+import resource
+
+from generator import countries, loadtest
+from generator.files import write_json
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Load-test the site with simulated players')
+    parser.add_argument('--host', default='127.0.0.1', help='server host (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8000, help='server port (default: %(default)s)')
+    parser.add_argument('--players', type=int, default=1000,
+                        help='concurrent virtual players (default: %(default)s)')
+    parser.add_argument('--sessions', type=int, default=1,
+                        help='sessions each player plays in a row (default: %(default)s)')
+    parser.add_argument('--ramp', type=float, default=5.0,
+                        help='seconds over which players join (default: %(default)s)')
+    parser.add_argument('--lang', default=countries.FALLBACK_LANGUAGE,
+                        help='language of the session (default: %(default)s)')
+    parser.add_argument('--flags', type=int, default=20,
+                        help='questions (flags) per session (default: %(default)s)')
+    parser.add_argument('--think', type=float, default=2.0,
+                        help='mean seconds between questions (default: %(default)s)')
+    parser.add_argument('--data-format', choices=loadtest.DATA_FORMATS, default='startup',
+                        help='how the countries data is fetched (default: %(default)s)')
+    parser.add_argument('--flag-format', choices=loadtest.FLAG_FORMATS, default='bundles',
+                        help='how flags are fetched (default: %(default)s)')
+    parser.add_argument('--accept-encoding', default='gzip, br',
+                        help='Accept-Encoding header sent (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the session pool (default: %(default)s)')
+    parser.add_argument('--json', metavar='PATH', help='also write the report to PATH')
+    return parser.parse_args()
+
+
+def raise_file_limit():
+    """Each player holds a socket; lift the soft descriptor limit as far as allowed."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or hard > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def print_report(report):
+    print(f'{report["players"]} players, {report["sessionsCompleted"]} sessions completed, '
+          f'{report["sessionsFailed"]} failed in {report["seconds"]} s')
+    for name, count in report['failures'].items():
+        print(f'  ⚠️  {name}: {count}')
+    print(f'{report["requests"]:,} requests ({report["requestsPerSecond"]:,}/s), '
+          f'{report["bytesPerSecond"] / 1e6:,.2f} MB/s')
+    print(f'\n{"latency ms":<14}{"p50":>9}{"p95":>9}{"p99":>9}{"max":>9}')
+    for kind, values in report['latencyMs'].items():
+        print(f'{kind:<14}' + ''.join(f'{values[name]:>9.2f}' for name in ('p50', 'p95', 'p99', 'max')))
+    print('\nbytes per session')
+    for kind, size in report['bytesPerSession'].items():
+        print(f'  {kind:<12}{size:>12,}')
+
+
+def main():
+    args = parse_args()
+    raise_file_limit()
+    report = asyncio.run(loadtest.run(
+        args.host, args.port, args.players, language=args.lang, flag_count=args.flags,
+        think_time=args.think, sessions=args.sessions, ramp=args.ramp, data_format=args.data_format,
+        flag_format=args.flag_format, accept_encoding=args.accept_encoding, seed=args.seed))
+    print_report(report)
+    if args.json:
+        write_json(args.json, report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Report what each HTML entry point costs to load and check it against budgets.
+
+Every page's stylesheets and scripts are read from its markup and combined with
+the data it is known to fetch: the startup bundle or translations on the critical
+path, the flag bundles and shared flag symbols of the selected continents for a
+session. Bytes (raw, gzip and, with the brotli package, brotli) and request counts
+are printed per page for the critical path, the whole session and the service
+worker's background precache.
+
+Metrics over their budget in benchmarks/budgets.json are listed and the exit
+status is 1; generate_countries.py runs the same check after every build.
+"""
+import argparse
+import sys
+
+from generator import countries, weight
+from generator.files import write_json
+from generator.paths import WEIGHT_BUDGETS
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Report page transfer weight and check budgets')
+    parser.add_argument('--lang', default=countries.FALLBACK_LANGUAGE,
+                        help='language of the data files (default: %(default)s)')
+    parser.add_argument('--continent', action='append', dest='continents',
+                        help='continent selected for the session (repeatable, default: all)')
+    parser.add_argument('--budgets', default=WEIGHT_BUDGETS,
+                        help='budgets file (default: benchmarks/budgets.json)')
+    parser.add_argument('--files', action='store_true',
+                        help='list every file with its sizes')
+    parser.add_argument('--json', metavar='PATH',
+                        help='also save the full report as JSON')
+    return parser.parse_args()
+
+
+def print_report(report, show_files):
+    for page, entry in report.items():
+        metrics = entry['metrics']
+        print(page)
+        for phase in weight.PHASES:
+            if not metrics[f'{phase}.requests']:
+                continue
+            sizes = ', '.join(f'{metrics[name]:,} {name.split(".")[1]}' for name in metrics
+                              if name.startswith(f'{phase}.') and name.endswith('.bytes'))
+            print(f'  {phase:<9} {metrics[f"{phase}.requests"]:>4} requests  {sizes}')
+            if show_files:
+                for file in entry['files'][phase]:
+                    print(f'      {file["raw"]:>10,}  {file["path"]}')
+
+
+def main():
+    args = parse_args()
+    report, missing = weight.measure(args.lang, args.continents)
+    print_report(report, args.files)
+    for page, path in missing:
+        print(f'⚠️  {page}: {path} does not exist')
+
+    if args.json:
+        write_json(args.json, report)
+
+    budgets = weight.load_budgets(args.budgets)
+    for metric in weight.unchecked_budgets(report, budgets):
+        print(f'⚠️  Budget for {metric} not checked, no page reports it')
+    failures = weight.check_budgets(report, budgets)
+    weight.print_failures(failures)
+    if failures:
+        sys.exit(1)
+    if budgets:
+        print('All pages within budget')
+
+
+if __name__ == '__main__':
+    main()
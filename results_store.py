@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Keep exported game results with running statistics and leaderboards.
+
+``add`` appends endGame records (JSONL, optionally .gz-compressed) to the store in
+results/; ``stats`` and ``leaderboard`` answer from the incrementally maintained
+aggregates for a continent selection and time limit, so they take the same time
+however many results have been recorded. Leaving out --continents or --time-limit
+queries the roll-up over all selections or all time limits.
+"""
+import argparse
+import gzip
+import json
+
+from generator.paths import RESULTS_DIR
+from generator.results import LEADERBOARD_SIZE, ResultsStore
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Keep exported game results with running statistics')
+    parser.add_argument('--dir', default=RESULTS_DIR,
+                        help='store directory (default: results/)')
+    parser.add_argument('--size', type=int, default=LEADERBOARD_SIZE,
+                        help=f'leaderboard length (default: {LEADERBOARD_SIZE})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help='append exported results')
+    add.add_argument('paths', nargs='+', metavar='RESULTS.jsonl',
+                     help='one endGame record per line (.gz allowed)')
+
+    for name, description in (('stats', 'print running statistics'), ('leaderboard', 'print the leaderboard')):
+        query = commands.add_parser(name, help=description)
+        query.add_argument('--continents', default=None,
+                           help='comma-separated continent selection (default: all selections)')
+        query.add_argument('--time-limit', type=int, default=None,
+                           help='time limit in seconds (default: all time limits)')
+
+    commands.add_parser('selections', help='list the selections and time limits with results')
+    return parser.parse_args()
+
+
+def read_records(path):
+    """The records in ``path``; undecodable lines, such as one cut off by a crash, are skipped."""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', errors='replace') as f:
+        try:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as error:
+                    print(f'⚠️  Skipping {path}:{number}: {error}')
+                    continue
+                if not isinstance(record, dict):
+                    print(f'⚠️  Skipping {path}:{number}: not a result record')
+                    continue
+                yield record
+        except EOFError:
+            print(f'⚠️  {path} is truncated, skipping the rest of it')
+
+
+def main():
+    args = parse_args()
+    store = ResultsStore(args.dir, leaderboard_size=args.size)
+
+    if args.command == 'add':
+        added = 0
+        for path in args.paths:
+            added += len(store.add_many(read_records(path)))
+        store.save()
+        print(f'Added {added:,} results ({store.sequence:,} stored)')
+        return
+
+    if args.command == 'selections':
+        for selection, time_limit in store.selections():
+            print(f'{selection}\t{time_limit}\t{store.aggregates[(selection, time_limit)].count}')
+        return
+
+    continents = args.continents.split(',') if args.continents else None
+    if args.command == 'stats':
+        result = store.stats(continents, args.time_limit)
+    else:
+        result = store.leaderboard(continents, args.time_limit)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Serve the site locally the way it is hosted, under /world-quiz-championships/.
+
+Unlike python -m http.server it sends strong ETags and answers conditional
+requests with 304, marks content-hashed files immutable, serves the .br/.gz
+siblings from generate_countries.py --compress when the browser accepts them,
+and keeps recently served files in a bounded in-memory cache. One asyncio loop
+handles all connections, so it holds up under many concurrent players.
+
+It also answers country queries from the SQLite store generate_countries.py
+writes, returning only the matching countries in the compact dataset format:
+
+    game-modes/geography-games/world-flag-championships/api/countries?lang=en&continent=Oceania&status=official
+
+Filters (continent, status) and ids take comma-separated values; answers=1 adds
+the answer table the game validates against.
+"""
+import argparse
+import asyncio
+import os
+
+from generator import server
+from generator.paths import COUNTRY_STORE, ROOT
+from generator.store import CountryStore
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Serve the site under /world-quiz-championships/')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='interface to listen on (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=8000,
+                        help='port to listen on (default: %(default)s)')
+    parser.add_argument('--cache-mb', type=int, default=32,
+                        help='in-memory file cache size in MiB (default: %(default)s)')
+    parser.add_argument('--quiet', action='store_true',
+                        help='do not log requests')
+    parser.add_argument('--store', default=COUNTRY_STORE,
+                        help='country store for the api/countries endpoint (default: .build-cache/countries.sqlite)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not os.path.exists(args.store):
+        print(f'⚠️  {os.path.relpath(args.store, ROOT)} not found, api/countries answers 404 until '
+              f'generate_countries.py writes it')
+    store = CountryStore(args.store)
+    try:
+        asyncio.run(server.serve(args.host, args.port, cache_bytes=args.cache_mb << 20, quiet=args.quiet,
+                                 store=store))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+/**
+ * Service worker for World Quiz Championships
+ * Generated by generate_countries.py from generator/templates/service-worker.js; edit the
+ * template, not sw.js. Files listed in precache-manifest.json are served from the cache,
+ * and a cached file is only downloaded again when its hash in the manifest changes.
+ */
+
+const PRECACHE_VERSION = '19bb11ea4f982b97';
+const CACHE_NAME = 'wqc-precache';
+const SCOPE = self.registration.scope;
+const MANIFEST_URL = new URL('precache-manifest.json', SCOPE).href;
+// Synthetic cache entry holding { site path: hash } of everything cached
+const HASHES_URL = new URL('__precache-hashes__', SCOPE).href;
+
+const Precache = {
+    manifest: null,
+
+    // Updates run one at a time so they never race on the hash record
+    queue: Promise.resolve(),
+
+    /**
+     * Get the manifest matching this worker version, from the cache or the network
+     * @returns {Promise<object>} Precache manifest
+     */
+    loadManifest: async function() {
+        if (this.manifest) return this.manifest;
+
+        const cache = await caches.open(CACHE_NAME);
+        const cached = await cache.match(MANIFEST_URL);
+        if (cached) {
+            const manifest = await cached.json();
+            if (manifest.version === PRECACHE_VERSION) {
+                this.manifest = manifest;
+                return manifest;
+            }
+        }
+
+        const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+        await cache.put(MANIFEST_URL, response.clone());
+        this.manifest = await response.json();
+        return this.manifest;
+    },
+
+    readHashes: async function(cache) {
+        const response = await cache.match(HASHES_URL);
+        return response ? response.json() : {};
+    },
+
+    writeHashes: function(cache, hashes) {
+        return cache.put(HASHES_URL, new Response(JSON.stringify(hashes), {
+            headers: { 'Content-Type': 'application/json' }
+        }));
+    },
+
+    /**
+     * Cache the given groups plus every group already cached, fetching only entries
+     * that are missing or whose hash changed, and drop entries no longer listed
+     * @param {Array<string>} groups - Manifest groups to make available offline
+     * @returns {Promise} Resolves when the cache is up to date
+     */
+    update: function(groups) {
+        this.queue = this.queue.catch(() => {}).then(() => this.runUpdate(groups));
+        return this.queue;
+    },
+
+    runUpdate: async function(groups) {
+        const manifest = await this.loadManifest();
+        const cache = await caches.open(CACHE_NAME);
+        const hashes = await this.readHashes(cache);
+
+        const wanted = new Set(groups);
+        Object.keys(hashes).forEach(path => {
+            const entry = manifest.entries[path];
+            if (entry) wanted.add(entry.group);
+        });
+
+        const stale = Object.entries(manifest.entries)
+            .filter(([path, entry]) => wanted.has(entry.group) && hashes[path] !== entry.hash);
+
+        await Promise.all(stale.map(async ([path, entry]) => {
+            const url = new URL(path, SCOPE).href;
+            const response = await fetch(url, { cache: 'no-cache' });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status} for ${path}`);
+            }
+            await cache.put(url, response);
+            hashes[path] = entry.hash;
+        }));
+
+        const removed = Object.keys(hashes).filter(path => !manifest.entries[path]);
+        await Promise.all(removed.map(path => cache.delete(new URL(path, SCOPE).href)));
+        removed.forEach(path => delete hashes[path]);
+
+        await this.writeHashes(cache, hashes);
+    },
+
+    /**
+     * Site path of a request inside the scope ('' maps to index.html)
+     * @param {string} url - Absolute request URL
+     * @returns {string|null} Path relative to the scope, or null outside it
+     */
+    pathOf: function(url) {
+        if (!url.startsWith(SCOPE)) return null;
+        const path = url.slice(SCOPE.length).split(/[?#]/)[0];
+        return path === '' || path.endsWith('/') ? `${path}index.html` : path;
+    },
+
+    /**
+     * Answer a request from the cache; listed files missed so far are cached on the way
+     * @param {Request} request - Intercepted GET request
+     * @returns {Promise<Response>} Cached or network response
+     */
+    respond: async function(request) {
+        const path = this.pathOf(request.url);
+        const cache = await caches.open(CACHE_NAME);
+        const url = new URL(path, SCOPE).href;
+        const cached = await cache.match(url);
+        if (cached) return cached;
+
+        const response = await fetch(request);
+        const manifest = await this.loadManifest().catch(() => null);
+        const entry = manifest && manifest.entries[path];
+        if (entry && response.ok) {
+            await cache.put(url, response.clone());
+            this.queue = this.queue.catch(() => {}).then(async () => {
+                const hashes = await this.readHashes(cache);
+                hashes[path] = entry.hash;
+                await this.writeHashes(cache, hashes);
+            });
+        }
+        return response;
+    }
+};
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        Precache.loadManifest()
+            .then(manifest => Precache.update(manifest.defaultGroups))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(names
+                .filter(name => name.startsWith('wqc-') && name !== CACHE_NAME)
+                .map(name => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('message', event => {
+    if (event.data && event.data.type === 'precache-continents') {
+        event.waitUntil(Precache.update(event.data.continents.map(continent => `bundle:${continent}`)));
+    }
+});
+
+self.addEventListener('fetch', event => {
+    if (event.request.method !== 'GET' || Precache.pathOf(event.request.url) === null) return;
+    event.respondWith(Precache.respond(event.request));
+});